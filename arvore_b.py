@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Árvore B+ com ordem configurável e a mesma API de atividade_5.ArvoreAVL.
+
+Cada nó guarda as chaves numa lista ordenada, pesquisada com bisect (em C), então
+uma busca faz log_ordem(n) saltos entre nós em vez dos log2(n) da AVL. Todas as
+chaves ficam nas folhas, que são encadeadas da esquerda para a direita: consultas
+por intervalo descem uma vez e depois só percorrem folhas. Os nós internos guardam
+apenas separadores: a subárvore filhos[i] contém as chaves k com
+chaves[i - 1] <= k < chaves[i].
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class NoB:
+    """
+    Nó da árvore B+. Nas folhas filhos é None e proxima aponta para a folha seguinte;
+    nos nós internos len(filhos) == len(chaves) + 1.
+    """
+    __slots__ = ("chaves", "filhos", "proxima")
+
+    def __init__(self, chaves=None, filhos=None):
+        self.chaves = chaves if chaves is not None else []
+        self.filhos = filhos
+        self.proxima = None
+
+
+class ArvoreB:
+    """
+    Árvore B+ de ordem "ordem": cada nó tem no máximo ordem filhos (ordem - 1 chaves)
+    e, fora a raiz, no mínimo ceil(ordem / 2) - 1 chaves.
+    """
+    def __init__(self, ordem=64):
+        if ordem < 3:
+            raise ValueError(f"A ordem da árvore B precisa ser pelo menos 3: {ordem}")
+        self.ordem = ordem
+        self._maximo = ordem - 1
+        self._minimo = (ordem + 1) // 2 - 1
+        self.raiz = NoB()
+        self._tamanho = 0
+
+    def __len__(self):
+        return self._tamanho
+
+    # ===============================================================
+    # CARGA EM LOTE
+    # ===============================================================
+
+    @classmethod
+    def from_iterable(cls, chaves, presorted=False, ordem=64):
+        """
+        Monta a árvore de baixo para cima a partir das chaves, em O(n) se já estiverem
+        ordenadas. Chaves duplicadas geram ValueError, como em inserir.
+        """
+        chaves = list(chaves) if presorted else sorted(chaves)
+        for anterior, chave in zip(chaves, chaves[1:]):
+            if not anterior < chave:
+                raise ValueError(f"Chave duplicada ou fora de ordem: {chave}")
+        arvore = cls(ordem)
+        if not chaves:
+            return arvore
+        # folhas com as chaves distribuídas por igual (todas acima do mínimo)
+        nivel = []
+        minimos = []
+        for inicio, fim in _fatias(len(chaves), arvore._maximo):
+            folha = NoB(chaves[inicio:fim])
+            if nivel:
+                nivel[-1].proxima = folha
+            nivel.append(folha)
+            minimos.append(chaves[inicio])
+        while len(nivel) > 1:
+            acima = []
+            minimos_acima = []
+            for inicio, fim in _fatias(len(nivel), ordem):
+                acima.append(NoB(minimos[inicio + 1:fim], nivel[inicio:fim]))
+                minimos_acima.append(minimos[inicio])
+            nivel, minimos = acima, minimos_acima
+        arvore.raiz = nivel[0]
+        arvore._tamanho = len(chaves)
+        return arvore
+
+    # ===============================================================
+    # INSERÇÃO E DELEÇÃO
+    # ===============================================================
+
+    def _descer(self, chave):
+        """Retorna (folha, caminho), com caminho = [(nó interno, índice do filho), ...]."""
+        caminho = []
+        no = self.raiz
+        while no.filhos is not None:
+            i = bisect_right(no.chaves, chave)
+            caminho.append((no, i))
+            no = no.filhos[i]
+        return no, caminho
+
+    def inserir(self, chave):
+        """Insere uma chave; chaves duplicadas geram ValueError."""
+        folha, caminho = self._descer(chave)
+        i = bisect_left(folha.chaves, chave)
+        if i < len(folha.chaves) and folha.chaves[i] == chave:
+            raise ValueError(f"Chave duplicada: {chave}")
+        folha.chaves.insert(i, chave)
+        self._tamanho += 1
+        if len(folha.chaves) <= self._maximo:
+            return
+
+        # folha cheia: metade de cima vai para uma folha nova, cuja primeira chave
+        # sobe como separador
+        meio = len(folha.chaves) // 2
+        nova = NoB(folha.chaves[meio:])
+        del folha.chaves[meio:]
+        nova.proxima = folha.proxima
+        folha.proxima = nova
+        separador = nova.chaves[0]
+        while caminho:
+            pai, i = caminho.pop()
+            pai.chaves.insert(i, separador)
+            pai.filhos.insert(i + 1, nova)
+            if len(pai.chaves) <= self._maximo:
+                return
+            # nó interno cheio: a chave do meio sobe e não fica em nenhuma metade
+            meio = len(pai.chaves) // 2
+            separador = pai.chaves[meio]
+            nova = NoB(pai.chaves[meio + 1:], pai.filhos[meio + 1:])
+            del pai.chaves[meio:]
+            del pai.filhos[meio + 1:]
+        # a raiz dividiu: a árvore cresce um nível
+        self.raiz = NoB([separador], [self.raiz, nova])
+
+    def deletar(self, chave):
+        """Remove a chave se ela existir."""
+        folha, caminho = self._descer(chave)
+        i = bisect_left(folha.chaves, chave)
+        if i == len(folha.chaves) or folha.chaves[i] != chave:
+            return
+        del folha.chaves[i]
+        self._tamanho -= 1
+
+        no = folha
+        while caminho and len(no.chaves) < self._minimo:
+            pai, i = caminho.pop()
+            esquerdo = pai.filhos[i - 1] if i > 0 else None
+            direito = pai.filhos[i + 1] if i + 1 < len(pai.filhos) else None
+            if esquerdo is not None and len(esquerdo.chaves) > self._minimo:
+                self._emprestar_da_esquerda(pai, i, esquerdo, no)
+                return
+            if direito is not None and len(direito.chaves) > self._minimo:
+                self._emprestar_da_direita(pai, i, no, direito)
+                return
+            # os irmãos estão no mínimo: junta com um deles e tira o separador do pai
+            if esquerdo is not None:
+                self._fundir(pai, i - 1, esquerdo, no)
+            else:
+                self._fundir(pai, i, no, direito)
+            no = pai
+
+        if self.raiz.filhos is not None and not self.raiz.chaves:
+            # a raiz ficou com um único filho: a árvore perde um nível
+            self.raiz = self.raiz.filhos[0]
+
+    def _emprestar_da_esquerda(self, pai, i, esquerdo, no):
+        if no.filhos is None:
+            no.chaves.insert(0, esquerdo.chaves.pop())
+            pai.chaves[i - 1] = no.chaves[0]
+        else:
+            no.chaves.insert(0, pai.chaves[i - 1])
+            no.filhos.insert(0, esquerdo.filhos.pop())
+            pai.chaves[i - 1] = esquerdo.chaves.pop()
+
+    def _emprestar_da_direita(self, pai, i, no, direito):
+        if no.filhos is None:
+            no.chaves.append(direito.chaves.pop(0))
+            pai.chaves[i] = direito.chaves[0]
+        else:
+            no.chaves.append(pai.chaves[i])
+            no.filhos.append(direito.filhos.pop(0))
+            pai.chaves[i] = direito.chaves.pop(0)
+
+    def _fundir(self, pai, i, esquerdo, direito):
+        """Junta pai.filhos[i + 1] (direito) em pai.filhos[i] (esquerdo)."""
+        if esquerdo.filhos is None:
+            esquerdo.chaves.extend(direito.chaves)
+            esquerdo.proxima = direito.proxima
+        else:
+            esquerdo.chaves.append(pai.chaves[i])
+            esquerdo.chaves.extend(direito.chaves)
+            esquerdo.filhos.extend(direito.filhos)
+        del pai.chaves[i]
+        del pai.filhos[i + 1]
+
+    # ===============================================================
+    # BUSCAS
+    # ===============================================================
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        """Retorna, em ordem, as chaves no intervalo [chave1, chave2]."""
+        folha, _ = self._descer(chave1)
+        resultado = []
+        i = bisect_left(folha.chaves, chave1)
+        while folha is not None:
+            chaves = folha.chaves
+            if chaves and chaves[-1] > chave2:
+                resultado.extend(chaves[i:bisect_right(chaves, chave2)])
+                break
+            resultado.extend(chaves[i:])
+            folha = folha.proxima
+            i = 0
+        return resultado
+
+    def obter_profundidade_no(self, chave):
+        """
+        Profundidade (raiz = 0) da folha que contém a chave, ou -1 se não existir.
+        Numa árvore B+ todas as folhas ficam no mesmo nível.
+        """
+        nivel = 0
+        no = self.raiz
+        while no.filhos is not None:
+            no = no.filhos[bisect_right(no.chaves, chave)]
+            nivel += 1
+        i = bisect_left(no.chaves, chave)
+        return nivel if i < len(no.chaves) and no.chaves[i] == chave else -1
+
+    def __contains__(self, chave):
+        return self.obter_profundidade_no(chave) != -1
+
+    def percurso_em_ordem(self):
+        """Retorna lista das chaves em ordem (in-order)."""
+        no = self.raiz
+        while no.filhos is not None:
+            no = no.filhos[0]
+        resultado = []
+        while no is not None:
+            resultado.extend(no.chaves)
+            no = no.proxima
+        return resultado
+
+
+def _fatias(total, capacidade):
+    """Divide range(total) no menor número de fatias de até capacidade itens, por igual."""
+    partes = -(-total // capacidade)
+    base, sobra = divmod(total, partes)
+    inicio = 0
+    for parte in range(partes):
+        fim = inicio + base + (parte < sobra)
+        yield inicio, fim
+        inicio = fim
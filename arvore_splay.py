@@ -0,0 +1,114 @@
+# arvore_splay.py
+# arvore splay: bst que se reorganiza a cada acesso, trazendo a chave acessada
+# para a raiz. chaves populares ficam perto do topo, entao trafego concentrado
+# em poucas chaves paga bem menos que a profundidade de uma arvore balanceada
+# (custo amortizado O(log n) por operacao mesmo no pior caso)
+#
+# o splay e top-down e iterativo (sleator e tarjan): desce uma vez so, montando
+# as arvores da esquerda e da direita sem pilha nem recursao, entao mesmo uma
+# arvore degenerada com milhoes de nos nao estoura a pilha
+
+from atividade_2 import BinarySearchTree, Node
+
+
+class SplayTree(BinarySearchTree):
+    # mesma interface da BinarySearchTree: insert, search, delete, height e depth
+    # (height/depth/search_many/salvar/visualize sao herdados; depth so consulta
+    # e nao reorganiza a arvore)
+
+    # o modo scapegoat (alpha) nao existe aqui: o splay ja reorganiza a arvore
+    def __init__(self, alpha=None):
+        if alpha is not None:
+            raise TypeError("SplayTree nao aceita alpha (modo scapegoat da BinarySearchTree)")
+        super().__init__()
+
+    # traz para a raiz o no com o valor, ou o ultimo no visitado procurando por ele
+    def _splay(self, valor):
+        cabeca = Node(None)  # cabeca.right junta a arvore da esquerda, cabeca.left a da direita
+        esquerda = direita = cabeca
+        node = self.root
+        while True:
+            if valor < node.valor:
+                if node.left is None:
+                    break
+                if valor < node.left.valor:
+                    # zig-zig: rotacao a direita antes de descer
+                    filho = node.left
+                    node.left = filho.right
+                    filho.right = node
+                    node = filho
+                    if node.left is None:
+                        break
+                # pendura o no na arvore da direita e desce a esquerda
+                direita.left = node
+                direita = node
+                node = node.left
+            elif valor > node.valor:
+                if node.right is None:
+                    break
+                if valor > node.right.valor:
+                    # zag-zag: rotacao a esquerda antes de descer
+                    filho = node.right
+                    node.right = filho.left
+                    filho.left = node
+                    node = filho
+                    if node.right is None:
+                        break
+                # pendura o no na arvore da esquerda e desce a direita
+                esquerda.right = node
+                esquerda = node
+                node = node.right
+            else:
+                break
+        # remonta: as subarvores do no final vao para as pontas das arvores laterais
+        esquerda.right = node.left
+        direita.left = node.right
+        node.left = cabeca.right
+        node.right = cabeca.left
+        self.root = node
+
+    # buscar um valor (o valor encontrado vira a raiz)
+    def search(self, valor):
+        if self.root is None:
+            return False
+        self._splay(valor)
+        return self.root.valor == valor
+
+    # inserir um valor: depois do splay o novo no vira raiz e a antiga raiz
+    # e partida entre os dois lados
+    def insert(self, valor):
+        self._snapshot = None
+        if self.root is None:
+            self.root = Node(valor)
+            return
+        self._splay(valor)
+        raiz = self.root
+        if raiz.valor == valor:
+            return  # valor repetido: nada a fazer
+        novo = Node(valor)
+        if valor < raiz.valor:
+            novo.left = raiz.left
+            novo.right = raiz
+            raiz.left = None
+        else:
+            novo.right = raiz.right
+            novo.left = raiz
+            raiz.right = None
+        self.root = novo
+
+    # remover um valor: com ele na raiz, o maior da subarvore esquerda sobe
+    # (splay pelo proprio valor) e herda a subarvore direita
+    def delete(self, valor):
+        self._snapshot = None
+        if self.root is None:
+            return
+        self._splay(valor)
+        raiz = self.root
+        if raiz.valor != valor:
+            return
+        if raiz.left is None:
+            self.root = raiz.right
+            return
+        self.root = raiz.left
+        self._splay(valor)  # valor e maior que todos: o maximo vem para a raiz
+        self.root.right = raiz.right
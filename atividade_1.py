@@ -5,8 +5,14 @@ objetivo:
 - Lívia Lana 211332
 """
 
-from graphviz import Digraph
+import operator
+import os
 import random
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from visualizacao import escrever_dot, renderizar
 
 class No:
     def __init__(self, valor, esquerdo=None, direito=None):
@@ -15,26 +21,18 @@ class No:
         self.direito = direito
 
 # função para desenhar a árvore
-def desenhar_arvore(raiz, nome_arquivo="arvore"):
-    dot = Digraph()
-
-    def adicionar(no, pai=None):
-        if no is None:
-            return
-
-        # cada nó vai ser identificado pelo seu valor e posição na memória
-        id_no = str(id(no))
-        dot.node(id_no, str(no.valor))
-
-        if pai:
-            dot.edge(pai, id_no)
-
-        adicionar(no.esquerdo, id_no)
-        adicionar(no.direito, id_no)
-
-    adicionar(raiz)
-    dot.render(nome_arquivo, format="png", cleanup=True)
-    print(f"Árvore salva em {nome_arquivo}.png")
+# o DOT é escrito em streaming (visualizacao.escrever_dot), sem recursão; para árvores
+# grandes use profundidade_max/colapsar e, se quiser, em_segundo_plano=True, que
+# retorna um Future em vez de esperar o dot terminar
+def desenhar_arvore(raiz, nome_arquivo="arvore", profundidade_max=None, colapsar=None,
+                    em_segundo_plano=False):
+    caminho_dot = f"{nome_arquivo}.dot"
+    escrever_dot(raiz, caminho_dot, lambda no: (no.esquerdo, no.direito),
+                 lambda no: no.valor, profundidade_max, colapsar)
+    resultado = renderizar(caminho_dot, f"{nome_arquivo}.png", em_segundo_plano=em_segundo_plano)
+    if not em_segundo_plano:
+        print(f"Árvore salva em {nome_arquivo}.png")
+    return resultado
 
 # fazer a árvore fixa
 # Expressão: ((7 + 3) * (5 - 2)) / (10 * 20)
@@ -59,21 +57,284 @@ def gerar_expressao_aleatoria():
     return f"(({numeros[0]} {op1} {numeros[1]}) {op2} ({numeros[2]} {op3} {numeros[3]}))"
 
 
-def construir_arvore(expr):
-    tokens = expr.replace("(", " ( ").replace(")", " ) ").split()
+# expressão aleatória com formato de árvore também aleatório: 'operandos' folhas e
+# no máximo 'profundidade' níveis de operadores (None = sem limite). Usa o gerador
+# rng recebido, então o resultado é reproduzível a partir da semente.
+def gerar_expressao_com_formato(rng, operandos=4, profundidade=None):
+    if operandos < 1:
+        raise ValueError(f"operandos deve ser pelo menos 1: {operandos}")
+    if profundidade is not None and operandos > 2 ** profundidade:
+        raise ValueError(f"{operandos} operandos não cabem em profundidade {profundidade}")
+    operadores = ["+", "-", "*", "/"]
+    partes = []
+    # pilha de tarefas: texto pronto ou (folhas, profundidade restante) a expandir
+    pilha = [(operandos, profundidade)]
+    while pilha:
+        tarefa = pilha.pop()
+        if isinstance(tarefa, str):
+            partes.append(tarefa)
+            continue
+        folhas, prof = tarefa
+        if folhas == 1:
+            partes.append(str(rng.randint(1, 9)))
+            continue
+        # cada lado precisa caber em 2^(prof-1) folhas
+        limite = folhas - 1 if prof is None else min(folhas - 1, 2 ** (prof - 1))
+        esquerda = rng.randint(folhas - limite, limite)
+        prof_filhos = None if prof is None else prof - 1
+        pilha.append(")")
+        pilha.append((folhas - esquerda, prof_filhos))
+        pilha.append(f" {rng.choice(operadores)} ")
+        pilha.append((esquerda, prof_filhos))
+        pilha.append("(")
+    return "".join(partes)
+
+
+# lote de expressões reproduzível pela semente
+def gerar_lote_expressoes(quantidade, semente=0, operandos=4, profundidade=None):
+    rng = random.Random(semente)
+    return [gerar_expressao_com_formato(rng, operandos, profundidade) for _ in range(quantidade)]
 
-    def parse():
-        token = tokens.pop(0)
+
+# tokenizador de uma passada: números inteiros ou decimais, operadores e parênteses
+TOKEN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|([-+*/()]))")
+
+# precedência dos operadores; "neg" é o menos unário
+PRECEDENCIA = {"+": 1, "-": 1, "*": 2, "/": 2, "neg": 3}
+
+
+def tokenizar(expr):
+    tokens = []
+    pos = 0
+    fim = len(expr.rstrip())
+    while pos < fim:
+        m = TOKEN.match(expr, pos)
+        if m is None:
+            raise ValueError(f"Caractere inválido na posição {pos}: {expr[pos]!r}")
+        tokens.append(m.group(1) or m.group(2))
+        pos = m.end()
+    return tokens
+
+
+def _reduzir(operandos, operador):
+    # aplica o operador do topo da pilha aos operandos já montados
+    if operador == "neg":
+        if not operandos:
+            raise ValueError("Expressão malformada: '-' sem operando")
+        operando = operandos.pop()
+        if operando.esquerdo is None and operando.direito is None and not str(operando.valor).startswith("-"):
+            operandos.append(No(f"-{operando.valor}"))  # -3 vira a folha "-3"
+        else:
+            operandos.append(No("-", None, operando))
+        return
+    if len(operandos) < 2:
+        raise ValueError(f"Expressão malformada: faltam operandos para '{operador}'")
+    direito = operandos.pop()
+    esquerdo = operandos.pop()
+    operandos.append(No(operador, esquerdo, direito))
+
+
+# monta a árvore em tempo linear com o algoritmo shunting-yard (sem recursão):
+# aceita números com vários dígitos e decimais, menos unário, precedência
+# (* e / antes de + e -) e parênteses opcionais. O menos unário vira um nó "-"
+# só com o filho direito (ou é incorporado ao número, como em "-3").
+def construir_arvore(expr):
+    operandos = []
+    operadores = []
+    espera_operando = True
+    for token in tokenizar(expr):
         if token == "(":
-            esquerdo = parse()
-            operador = tokens.pop(0)
-            direito = parse()
-            tokens.pop(0)  # remove ")"
-            return No(operador, esquerdo, direito)
+            if not espera_operando:
+                raise ValueError("Expressão malformada: '(' depois de um operando")
+            operadores.append(token)
+        elif token == ")":
+            if espera_operando:
+                raise ValueError("Expressão malformada: ')' inesperado")
+            while operadores and operadores[-1] != "(":
+                _reduzir(operandos, operadores.pop())
+            if not operadores:
+                raise ValueError("Parênteses desbalanceados")
+            operadores.pop()
+        elif token in PRECEDENCIA:
+            if espera_operando:
+                if token == "-":
+                    operadores.append("neg")
+                elif token != "+":  # + unário não muda nada
+                    raise ValueError(f"Expressão malformada: operador '{token}' sem operando à esquerda")
+                continue
+            # operadores binários são associativos à esquerda
+            while operadores and operadores[-1] != "(" and PRECEDENCIA[operadores[-1]] >= PRECEDENCIA[token]:
+                _reduzir(operandos, operadores.pop())
+            operadores.append(token)
+            espera_operando = True
         else:
-            return No(token)
+            if not espera_operando:
+                raise ValueError(f"Expressão malformada: número {token} depois de um operando")
+            operandos.append(No(token))
+            espera_operando = False
+
+    if espera_operando:
+        raise ValueError("Expressão malformada: termina sem operando")
+    while operadores:
+        operador = operadores.pop()
+        if operador == "(":
+            raise ValueError("Parênteses desbalanceados")
+        _reduzir(operandos, operador)
+    return operandos[0]
+
+
+# avaliação das árvores de expressão
+OPERACOES = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
+def _numero(valor):
+    # folhas podem guardar números (arvore_fixa) ou texto (construir_arvore)
+    if isinstance(valor, (int, float)):
+        return valor
+    try:
+        return int(valor)
+    except ValueError:
+        return float(valor)
+
+
+def _dividir(a, b):
+    if b == 0:
+        raise ZeroDivisionError(f"Divisão por zero: {a} / {b}")
+    return a / b
+
+
+# avaliação recursiva direta, percorrendo a árvore a cada chamada
+def avaliar(no):
+    if no.esquerdo is None and no.direito is None:
+        return _numero(no.valor)
+    if no.esquerdo is None:  # menos unário
+        return -avaliar(no.direito)
+    a = avaliar(no.esquerdo)
+    b = avaliar(no.direito)
+    if no.valor == "/":
+        return _dividir(a, b)
+    if no.valor not in OPERACOES:
+        raise ValueError(f"Operador inválido: {no.valor}")
+    return OPERACOES[no.valor](a, b)
+
+
+class ExpressaoCompilada:
+    """
+    Árvore de expressão compilada uma única vez para um programa plano.
+    instrucoes é o programa em pós-ordem: cada instrução grava um registrador
+    (("num", valor), ("neg", reg) ou (operador, reg_esquerdo, reg_direito)) e o resultado fica
+    em saida. O programa vira uma função Python, então avaliar não anda na árvore.
+    """
+    def __init__(self, instrucoes, saida):
+        self.instrucoes = instrucoes
+        self.saida = saida
+        self.codigo = self._gerar_codigo()
+        escopo = {}
+        exec(compile(self.codigo, "<expressao>", "exec"), escopo)
+        self.avaliar = escopo["_avaliar"]
+
+    def __call__(self):
+        return self.avaliar()
+
+    def _gerar_codigo(self):
+        linhas = ["def _avaliar():"]
+        for i, instrucao in enumerate(self.instrucoes):
+            if instrucao[0] == "num":
+                linhas.append(f"    r{i} = {instrucao[1]!r}")
+                continue
+            if instrucao[0] == "neg":
+                linhas.append(f"    r{i} = -r{instrucao[1]}")
+                continue
+            operador, a, b = instrucao
+            if operador == "/":
+                linhas.append(f"    if r{b} == 0: raise ZeroDivisionError(f'Divisão por zero: {{r{a}}} / {{r{b}}}')")
+            linhas.append(f"    r{i} = r{a} {operador} r{b}")
+        linhas.append(f"    return r{self.saida}")
+        return "\n".join(linhas)
+
+
+# compila a árvore em pós-ordem (sem recursão); com memoizar=True as subárvores
+# estruturalmente iguais são unificadas (hash-consing) e calculadas uma só vez
+def compilar(raiz, memoizar=True):
+    instrucoes = []
+    tabela = {}     # estrutura da subárvore -> registrador
+    registro = {}   # id(no) -> registrador
+    pilha = [(raiz, False)]
+    while pilha:
+        no, filhos_prontos = pilha.pop()
+        chave = None
+        if no.esquerdo is None and no.direito is None:
+            valor = _numero(no.valor)
+            instrucao = ("num", valor)
+            # 1 == 1.0 e 0.0 == -0.0 no dicionário, mas não dão o mesmo resultado:
+            # a chave de folhas inclui o tipo e o repr
+            chave = ("num", type(valor), repr(valor))
+        elif not filhos_prontos:
+            pilha.append((no, True))
+            pilha.append((no.direito, False))
+            if no.esquerdo is not None:
+                pilha.append((no.esquerdo, False))
+            continue
+        elif no.esquerdo is None:  # menos unário
+            instrucao = ("neg", registro[id(no.direito)])
+        else:
+            if no.valor not in OPERACOES:
+                raise ValueError(f"Operador inválido: {no.valor}")
+            instrucao = (no.valor, registro[id(no.esquerdo)], registro[id(no.direito)])
+        if chave is None:
+            chave = instrucao
+        reg = tabela.get(chave) if memoizar else None
+        if reg is None:
+            reg = len(instrucoes)
+            instrucoes.append(instrucao)
+            if memoizar:
+                tabela[chave] = reg
+        registro[id(no)] = reg
+    return ExpressaoCompilada(instrucoes, registro[id(raiz)])
+
+
+# pipeline paralelo: gera, monta (construir_arvore) e avalia expressões em lotes
+# distribuídos num ProcessPoolExecutor. Cada lote usa a semente "semente:indice",
+# então o resultado não depende do número de processos.
+def _processar_lote(semente, indice, quantidade, operandos, profundidade, incluir_expressoes):
+    resultados = []
+    for expr in gerar_lote_expressoes(quantidade, f"{semente}:{indice}", operandos, profundidade):
+        try:
+            valor = avaliar(construir_arvore(expr))
+        except ZeroDivisionError:
+            valor = None
+        resultados.append((expr, valor) if incluir_expressoes else valor)
+    return resultados
+
 
-    return parse()
+def avaliar_em_paralelo(total, semente=0, trabalhadores=None, tamanho_lote=1000,
+                        operandos=4, profundidade=None, incluir_expressoes=True):
+    """
+    Gera e avalia 'total' expressões aleatórias em paralelo, devolvendo os lotes em
+    ordem à medida que ficam prontos (um gerador de listas). Cada item é
+    (expressão, valor), ou só o valor se incluir_expressoes=False; divisões por zero
+    dão valor None. Com operandos grandes, limite a profundidade para que avaliar
+    não esbarre no limite de recursão.
+    """
+    n_lotes = (total + tamanho_lote - 1) // tamanho_lote
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+        # mantém só alguns lotes em voo para não acumular resultados na memória
+        em_voo = deque()
+        janela = 2 * trabalhadores
+        for indice in range(n_lotes):
+            quantidade = min(tamanho_lote, total - indice * tamanho_lote)
+            em_voo.append(executor.submit(_processar_lote, semente, indice, quantidade,
+                                          operandos, profundidade, incluir_expressoes))
+            if len(em_voo) >= janela:
+                yield em_voo.popleft().result()
+        while em_voo:
+            yield em_voo.popleft().result()
 
 
 # parte principal
@@ -81,9 +342,14 @@ if __name__ == "__main__":
     # Árvore fixa
     raiz_fixa = arvore_fixa()
     desenhar_arvore(raiz_fixa, "arvore_fixa")
+    print("Valor da árvore fixa:", compilar(raiz_fixa)())
 
     # Árvore aleatória
     expr = gerar_expressao_aleatoria()
     print("Expressão aleatória:", expr)
     raiz_aleatoria = construir_arvore(expr)
     desenhar_arvore(raiz_aleatoria, "arvore_aleatoria")
+    try:
+        print("Valor:", compilar(raiz_aleatoria)())
+    except ZeroDivisionError as e:
+        print("Não foi possível avaliar:", e)
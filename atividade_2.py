@@ -2,78 +2,234 @@
 # arvore binaria de busca (bst) com inserção, busca, remoção, altura e profundidade
 # visualização com graphviz
 
+import math
 import random
-from graphviz import Digraph
+from bisect import bisect_left
+from visualizacao import escrever_dot, renderizar
+from snapshot_binario import ArvoreMapeada, ler_arvore, salvar_arvore
+from cache_lru import AUSENTE, CacheLRU
+
+try:
+    import numpy as np
+except ImportError:  # numpy e opcional: sem ele search_many usa bisect
+    np = None
 
 class Node:
-    def __init__(self, valor):
+    def __init__(self, valor, dado=None):
         self.valor = valor
+        self.dado = dado  # valor associado a chave (usado pelo BinarySearchMap)
         self.left = None
         self.right = None
 
 class BinarySearchTree:
-    def __init__(self):
+    # alpha (entre 0.5 e 1) liga o modo bode expiatorio (scapegoat): a altura fica
+    # limitada a log(n) / log(1/alpha) + 1 sem guardar nada a mais nos nos.
+    # uma insercao que cai mais fundo que isso reconstroi balanceada a subarvore do
+    # primeiro ancestral desequilibrado (filho com mais de alpha dos nos dele), e
+    # depois que as remocoes derrubam n abaixo de alpha * maior n desde a ultima
+    # reconstrucao a arvore inteira e reconstruida. custo amortizado O(log n)
+    # alpha menor = arvore mais baixa e mais reconstrucoes; sem alpha nada muda
+    def __init__(self, alpha=None):
+        if alpha is not None and not 0.5 < alpha < 1:
+            raise ValueError(f"alpha deve estar entre 0.5 e 1: {alpha}")
         self.root = None
+        self._snapshot = None  # chaves ordenadas para search_many (refeito apos mudancas)
+        self.alpha = alpha
+        self._size = 0  # so contado com alpha
+        self._max_size = 0
+        self.rebuilds = 0
 
-    # inserir um valor
+    # inserir um valor (iterativo: nao estoura a pilha com entrada ordenada)
     def insert(self, valor):
+        if self.alpha is not None:
+            self._insert_scapegoat(valor, None)
+            return
+        self._snapshot = None
         if self.root is None:
             self.root = Node(valor)
-        else:
-            self._insert(self.root, valor)
-
-    def _insert(self, node, valor):
-        if valor < node.valor:
-            if node.left is None:
-                node.left = Node(valor)
+            return
+        node = self.root
+        while True:
+            if valor < node.valor:
+                if node.left is None:
+                    node.left = Node(valor)
+                    return
+                node = node.left
+            elif valor > node.valor:
+                if node.right is None:
+                    node.right = Node(valor)
+                    return
+                node = node.right
             else:
-                self._insert(node.left, valor)
-        elif valor > node.valor:
-            if node.right is None:
-                node.right = Node(valor)
+                return  # valor repetido: nada a fazer
+
+    # insert do modo scapegoat: a mesma descida guardando o caminho
+    # devolve o nó se o valor ja existia (e None quando criou um novo)
+    def _insert_scapegoat(self, valor, dado):
+        self._snapshot = None
+        if self.root is None:
+            self.root = Node(valor, dado)
+            self._size = self._max_size = 1
+            return None
+        caminho = []
+        node = self.root
+        while True:
+            caminho.append(node)
+            if valor < node.valor:
+                if node.left is None:
+                    node.left = novo = Node(valor, dado)
+                    break
+                node = node.left
+            elif valor > node.valor:
+                if node.right is None:
+                    node.right = novo = Node(valor, dado)
+                    break
+                node = node.right
             else:
-                self._insert(node.right, valor)
+                return node
+        self._size += 1
+        self._max_size = max(self._max_size, self._size)
+        # o nó novo esta na profundidade len(caminho)
+        if len(caminho) > math.log(self._size) / math.log(1 / self.alpha):
+            self._rebuild_scapegoat(caminho, novo)
+        return None
+
+    # sobe pelo caminho ate achar o bode expiatorio e reconstroi a subarvore dele
+    # os tamanhos sao contados na subida (o lado do caminho ja foi contado no passo
+    # anterior, so o irmao precisa ser percorrido)
+    def _rebuild_scapegoat(self, caminho, node):
+        tamanho = 1
+        for i in range(len(caminho) - 1, -1, -1):
+            pai = caminho[i]
+            irmao = pai.right if pai.left is node else pai.left
+            tamanho_pai = tamanho + 1 + self._count(irmao)
+            if tamanho > self.alpha * tamanho_pai:
+                novo = self._build_balanced(self._flatten(pai), 0, tamanho_pai)
+                if i == 0:
+                    self.root = novo
+                elif caminho[i - 1].left is pai:
+                    caminho[i - 1].left = novo
+                else:
+                    caminho[i - 1].right = novo
+                self.rebuilds += 1
+                return
+            node, tamanho = pai, tamanho_pai
+
+    # numero de nos da subarvore (sem recursao)
+    def _count(self, node):
+        total = 0
+        pilha = [node] if node is not None else []
+        while pilha:
+            node = pilha.pop()
+            total += 1
+            if node.left is not None:
+                pilha.append(node.left)
+            if node.right is not None:
+                pilha.append(node.right)
+        return total
+
+    # nos da subarvore em ordem (sem recursao)
+    def _flatten(self, node):
+        nodes = []
+        pilha = []
+        while pilha or node is not None:
+            while node is not None:
+                pilha.append(node)
+                node = node.left
+            node = pilha.pop()
+            nodes.append(node)
+            node = node.right
+        return nodes
+
+    # religa os nos[inicio:fim] (ja em ordem) numa subarvore perfeitamente balanceada
+    # reaproveitando os proprios nos (o dado vai junto); recursao de altura O(log n)
+    def _build_balanced(self, nodes, inicio, fim):
+        if inicio >= fim:
+            return None
+        meio = (inicio + fim) // 2
+        node = nodes[meio]
+        node.left = self._build_balanced(nodes, inicio, meio)
+        node.right = self._build_balanced(nodes, meio + 1, fim)
+        return node
 
     # buscar um valor
     def search(self, valor):
-        return self._search(self.root, valor)
+        node = self.root
+        while node is not None:
+            if node.valor == valor:
+                return True
+            elif valor < node.valor:
+                node = node.left
+            else:
+                node = node.right
+        return False
 
-    def _search(self, node, valor):
-        if node is None:
-            return False
-        if node.valor == valor:
-            return True
-        elif valor < node.valor:
-            return self._search(node.left, valor)
-        else:
-            return self._search(node.right, valor)
+    # buscar varios valores de uma vez (lista ou array numpy)
+    # com numpy a busca binaria e vetorizada sobre um snapshot ordenado da arvore
+    # e o retorno e um array de bool; sem numpy retorna uma lista de bool
+    def search_many(self, valores):
+        chaves = self._sorted_snapshot()
+        if np is not None:
+            consultas = np.asarray(valores)
+            if len(chaves) == 0:
+                return np.zeros(consultas.shape, dtype=bool)
+            pos = np.searchsorted(chaves, consultas)
+            pos_valida = np.minimum(pos, len(chaves) - 1)
+            return (pos < len(chaves)) & (chaves[pos_valida] == consultas)
+        resultado = []
+        for valor in valores:
+            pos = bisect_left(chaves, valor)
+            resultado.append(pos < len(chaves) and chaves[pos] == valor)
+        return resultado
+
+    def _sorted_snapshot(self):
+        if self._snapshot is None:
+            chaves = []
+            pilha = []
+            node = self.root
+            while pilha or node is not None:
+                while node is not None:
+                    pilha.append(node)
+                    node = node.left
+                node = pilha.pop()
+                chaves.append(node.valor)
+                node = node.right
+            self._snapshot = np.array(chaves) if np is not None else chaves
+        return self._snapshot
 
     # remover um valor
     def delete(self, valor):
-        self.root = self._delete(self.root, valor)
-
-    def _delete(self, node, valor):
+        self._snapshot = None
+        parent = None
+        node = self.root
+        while node is not None and node.valor != valor:
+            parent = node
+            node = node.left if valor < node.valor else node.right
         if node is None:
-            return node
-        if valor < node.valor:
-            node.left = self._delete(node.left, valor)
-        elif valor > node.valor:
-            node.right = self._delete(node.right, valor)
+            return
+        # caso 3: nó com dois filhos -> copia o sucessor (com o dado) e remove o nó do sucessor
+        if node.left is not None and node.right is not None:
+            parent = node
+            sucessor = node.right
+            while sucessor.left is not None:
+                parent = sucessor
+                sucessor = sucessor.left
+            node.valor, node.dado = sucessor.valor, sucessor.dado
+            node = sucessor
+        # casos 1 e 2: nó folha ou com um filho -> o filho ocupa o lugar do nó
+        filho = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = filho
+        elif parent.left is node:
+            parent.left = filho
         else:
-            # caso 1: nó folha
-            if node.left is None and node.right is None:
-                return None
-            # caso 2: nó com um filho
-            elif node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            # caso 3: nó com dois filhos
-            else:
-                sucessor = self._min_value_node(node.right)
-                node.valor = sucessor.valor
-                node.right = self._delete(node.right, sucessor.valor)
-        return node
+            parent.right = filho
+        if self.alpha is not None:
+            self._size -= 1
+            if self._size < self.alpha * self._max_size:
+                self.root = self._build_balanced(self._flatten(self.root), 0, self._size)
+                self._max_size = self._size
+                self.rebuilds += 1
 
     def _min_value_node(self, node):
         atual = node
@@ -81,44 +237,169 @@ class BinarySearchTree:
             atual = atual.left
         return atual
 
-    # calcular altura da arvore
+    # calcular altura da arvore (percurso por niveis, sem recursao)
     def height(self):
-        return self._height(self.root)
-
-    def _height(self, node):
-        if node is None:
-            return -1
-        return 1 + max(self._height(node.left), self._height(node.right))
+        altura = -1
+        nivel = [self.root] if self.root else []
+        while nivel:
+            altura += 1
+            nivel = [filho for node in nivel for filho in (node.left, node.right) if filho]
+        return altura
 
     # calcular profundidade de um nó
     def depth(self, valor):
-        return self._depth(self.root, valor, 0)
+        node = self.root
+        nivel = 0
+        while node is not None:
+            if node.valor == valor:
+                return nivel
+            elif valor < node.valor:
+                node = node.left
+            else:
+                node = node.right
+            nivel += 1
+        return -1
 
-    def _depth(self, node, valor, nivel):
-        if node is None:
-            return -1
-        if node.valor == valor:
-            return nivel
-        elif valor < node.valor:
-            return self._depth(node.left, valor, nivel + 1)
-        else:
-            return self._depth(node.right, valor, nivel + 1)
+    # gravar a arvore num arquivo binario (formato de snapshot_binario)
+    # a forma e preservada, entao search/depth dao o mesmo resultado depois de carregar
+    def salvar(self, path):
+        return salvar_arvore(self.root, path, lambda node: (node.left, node.right),
+                             lambda node: node.valor)
+
+    # ler um arquivo gravado por salvar
+    # somente_leitura=True devolve uma ArvoreMapeada (mmap, sem criar nos)
+    @classmethod
+    def carregar(cls, path, somente_leitura=False):
+        if somente_leitura:
+            return ArvoreMapeada(path)
+        chaves, esquerda, direita, raiz = ler_arvore(path)
+        bst = cls()
+        nodes = [Node(valor) for valor in chaves]
+        for i, node in enumerate(nodes):
+            if esquerda[i] != -1:
+                node.left = nodes[esquerda[i]]
+            if direita[i] != -1:
+                node.right = nodes[direita[i]]
+        bst.root = nodes[raiz] if raiz != -1 else None
+        return bst
 
     # mostrar a arvore com graphviz
-    def visualize(self, filename="tree"):
-        dot = Digraph()
-        if self.root:
-            self._add_nodes(dot, self.root)
-        dot.render(filename, format="png", cleanup=True)
-        print(f"arvore gerada: {filename}.png")
-
-    def _add_nodes(self, dot, node):
-        if node.left:
-            dot.edge(str(node.valor), str(node.left.valor))
-            self._add_nodes(dot, node.left)
-        if node.right:
-            dot.edge(str(node.valor), str(node.right.valor))
-            self._add_nodes(dot, node.right)
+    # o arquivo dot e escrito em streaming, com ids sequenciais (valores repetidos e
+    # raiz sozinha aparecem certo); profundidade_max/colapsar resumem subarvores e
+    # em_segundo_plano=True devolve um Future em vez de esperar a renderizacao
+    def visualize(self, filename="tree", profundidade_max=None, colapsar=None, em_segundo_plano=False):
+        caminho_dot = f"{filename}.dot"
+        escrever_dot(self.root, caminho_dot, lambda node: (node.left, node.right),
+                     lambda node: node.valor, profundidade_max, colapsar)
+        resultado = renderizar(caminho_dot, f"{filename}.png", em_segundo_plano=em_segundo_plano)
+        if not em_segundo_plano:
+            print(f"arvore gerada: {filename}.png")
+        return resultado
+
+
+# modo mapa: cada nó guarda um dado junto da chave (dispensa o dict paralelo)
+# tamanho_cache > 0 coloca um cache LRU na frente do get; ele e invalidado
+# quando a chave e removida ou tem o dado trocado
+class BinarySearchMap(BinarySearchTree):
+    def __init__(self, tamanho_cache=0, alpha=None):
+        super().__init__(alpha)
+        self.cache = CacheLRU(tamanho_cache) if tamanho_cache else None
+
+    def _find(self, valor):
+        node = self.root
+        while node is not None and node.valor != valor:
+            node = node.left if valor < node.valor else node.right
+        return node
+
+    # valor da chave, ou padrao se ela nao existir
+    def get(self, valor, padrao=None):
+        if self.cache is not None:
+            dado = self.cache.buscar(valor)
+            if dado is not AUSENTE:
+                return dado
+        node = self._find(valor)
+        if node is None:
+            return padrao
+        if self.cache is not None:
+            self.cache.guardar(valor, node.dado)
+        return node.dado
+
+    # inserir a chave com o dado, ou trocar o dado se ela ja existir (uma descida so)
+    def put(self, valor, dado):
+        if self.alpha is not None:
+            node = self._insert_scapegoat(valor, dado)
+            if node is not None:
+                node.dado = dado
+                if self.cache is not None:
+                    self.cache.invalidar(valor)
+            return
+        self._snapshot = None
+        if self.root is None:
+            self.root = Node(valor, dado)
+            return
+        node = self.root
+        while True:
+            if valor < node.valor:
+                if node.left is None:
+                    node.left = Node(valor, dado)
+                    return
+                node = node.left
+            elif valor > node.valor:
+                if node.right is None:
+                    node.right = Node(valor, dado)
+                    return
+                node = node.right
+            else:
+                node.dado = dado
+                if self.cache is not None:
+                    self.cache.invalidar(valor)
+                return
+
+    # remover a chave e devolver o dado (KeyError sem padrao, como dict.pop)
+    def pop(self, valor, padrao=AUSENTE):
+        node = self._find(valor)
+        if node is None:
+            if padrao is AUSENTE:
+                raise KeyError(valor)
+            return padrao
+        dado = node.dado
+        self.delete(valor)
+        return dado
+
+    def delete(self, valor):
+        super().delete(valor)
+        if self.cache is not None:
+            self.cache.invalidar(valor)
+
+    # vizinhos: devolvem o par (chave, dado) ou None
+    def floor(self, valor):
+        return self._neighbor(valor, below=True, inclusive=True)
+
+    def ceiling(self, valor):
+        return self._neighbor(valor, below=False, inclusive=True)
+
+    def predecessor(self, valor):
+        return self._neighbor(valor, below=True, inclusive=False)
+
+    def successor(self, valor):
+        return self._neighbor(valor, below=False, inclusive=False)
+
+    # desce um caminho so guardando o melhor candidato visto
+    def _neighbor(self, valor, below, inclusive):
+        melhor = None
+        node = self.root
+        while node is not None:
+            if inclusive and node.valor == valor:
+                return node.valor, node.dado
+            if (node.valor < valor) if below else (node.valor > valor):
+                melhor = node
+                node = node.right if below else node.left
+            else:
+                node = node.left if below else node.right
+        return None if melhor is None else (melhor.valor, melhor.dado)
+
+    def cache_stats(self):
+        return None if self.cache is None else self.cache.estatisticas()
 
 
 #testes e pipipi popopo
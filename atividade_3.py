@@ -3,7 +3,8 @@
 # visualização com graphviz
 
 import random
-from graphviz import Digraph
+from collections import deque
+from visualizacao import escrever_dot, renderizar
 
 class Node:
     def __init__(self, valor):
@@ -34,48 +35,86 @@ class BinaryTree:
             else:
                 self._insert(node.right, valor)
 
+    # as travessias sao geradores com pilha explicita: usam memoria O(altura),
+    # nao copiam listas e podem ser interrompidas no meio (ex.: islice)
+
     # inorder: esquerda - raiz - direita
     def inorder(self):
-        return self._inorder(self.root)
-
-    def _inorder(self, node):
-        if node is None:
-            return []
-        return self._inorder(node.left) + [node.valor] + self._inorder(node.right)
+        return list(self.iter_inorder())
+
+    def iter_inorder(self):
+        pilha = []
+        node = self.root
+        while pilha or node is not None:
+            while node is not None:
+                pilha.append(node)
+                node = node.left
+            node = pilha.pop()
+            yield node.valor
+            node = node.right
 
     # preorder: raiz - esquerda - direita
     def preorder(self):
-        return self._preorder(self.root)
-
-    def _preorder(self, node):
-        if node is None:
-            return []
-        return [node.valor] + self._preorder(node.left) + self._preorder(node.right)
+        return list(self.iter_preorder())
+
+    def iter_preorder(self):
+        pilha = [self.root] if self.root else []
+        while pilha:
+            node = pilha.pop()
+            yield node.valor
+            # a direita entra primeiro para a esquerda sair primeiro
+            if node.right:
+                pilha.append(node.right)
+            if node.left:
+                pilha.append(node.left)
 
     # postorder: esquerda - direita - raiz
     def postorder(self):
-        return self._postorder(self.root)
-
-    def _postorder(self, node):
-        if node is None:
-            return []
-        return self._postorder(node.left) + self._postorder(node.right) + [node.valor]
+        return list(self.iter_postorder())
+
+    def iter_postorder(self):
+        pilha = []
+        node = self.root
+        ultimo = None  # ultimo no emitido, para saber se a direita ja foi visitada
+        while pilha or node is not None:
+            if node is not None:
+                pilha.append(node)
+                node = node.left
+            else:
+                topo = pilha[-1]
+                if topo.right is not None and ultimo is not topo.right:
+                    node = topo.right
+                else:
+                    yield topo.valor
+                    ultimo = pilha.pop()
+
+    # por niveis: raiz, depois filhos da esquerda para a direita
+    # (a fila guarda no maximo um nivel inteiro, nao a altura)
+    def levelorder(self):
+        return list(self.iter_levelorder())
+
+    def iter_levelorder(self):
+        fila = deque([self.root] if self.root else [])
+        while fila:
+            node = fila.popleft()
+            yield node.valor
+            if node.left:
+                fila.append(node.left)
+            if node.right:
+                fila.append(node.right)
 
     # mostrar a arvore com graphviz
-    def visualize(self, filename="tree"):
-        dot = Digraph()
-        if self.root:
-            self._add_nodes(dot, self.root)
-        dot.render(filename, format="png", cleanup=True)
-        print(f"arvore gerada: {filename}.png")
-
-    def _add_nodes(self, dot, node):
-        if node.left:
-            dot.edge(str(node.valor), str(node.left.valor))
-            self._add_nodes(dot, node.left)
-        if node.right:
-            dot.edge(str(node.valor), str(node.right.valor))
-            self._add_nodes(dot, node.right)
+    # o arquivo dot e escrito em streaming, com ids sequenciais (valores repetidos e
+    # raiz sozinha aparecem certo); profundidade_max/colapsar resumem subarvores e
+    # em_segundo_plano=True devolve um Future em vez de esperar a renderizacao
+    def visualize(self, filename="tree", profundidade_max=None, colapsar=None, em_segundo_plano=False):
+        caminho_dot = f"{filename}.dot"
+        escrever_dot(self.root, caminho_dot, lambda node: (node.left, node.right),
+                     lambda node: node.valor, profundidade_max, colapsar)
+        resultado = renderizar(caminho_dot, f"{filename}.png", em_segundo_plano=em_segundo_plano)
+        if not em_segundo_plano:
+            print(f"arvore gerada: {filename}.png")
+        return resultado
 
 
 # ----------------- testes -----------------
@@ -91,6 +130,7 @@ if __name__ == "__main__":
     print("inorder:", arvore_fixa.inorder())
     print("preorder:", arvore_fixa.preorder())
     print("postorder:", arvore_fixa.postorder())
+    print("levelorder:", arvore_fixa.levelorder())
 
     # arvore com valores aleatorios
     print("\n==== arvore com valores aleatorios ====")
@@ -105,3 +145,4 @@ if __name__ == "__main__":
     print("inorder:", arvore_randomica.inorder())
     print("preorder:", arvore_randomica.preorder())
     print("postorder:", arvore_randomica.postorder())
+    print("levelorder:", arvore_randomica.levelorder())
@@ -1,15 +1,31 @@
 # -*- coding: utf-8 -*-
 
+import operator
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from snapshot_binario import ArvoreMapeada, ler_arvore, salvar_arvore
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele as consultas em lote usam bisect
+    np = None
+
 class No:
     """
     Representa um nó na Árvore AVL.
-    Cada nó armazena uma chave, referências para os filhos e sua altura.
+    Cada nó armazena uma chave, o valor associado a ela (usado pelo MapaAVL),
+    referências para os filhos, sua altura e o tamanho (número de nós) da
+    subárvore que ele enraíza.
     """
-    def __init__(self, chave):
+    def __init__(self, chave, valor=None):
         self.chave = chave
+        self.valor = valor
         self.esquerda = None
         self.direita = None
         self.altura = 1  # A altura de um novo nó (folha) é sempre 1
+        self.tamanho = 1
 
 class ArvoreAVL:
     """
@@ -17,6 +33,10 @@ class ArvoreAVL:
     """
     def __init__(self):
         self.raiz = None
+        self._snapshot = None  # cópia achatada usada nas consultas em lote
+
+    def __len__(self):
+        return self.obter_tamanho(self.raiz)
 
     # ===============================================================
     # TAREFA 0: IMPLEMENTAR MÉTODOS AUXILIARES E ROTAÇÕES
@@ -36,14 +56,22 @@ class ArvoreAVL:
             return 0
         return self.obter_altura(no.esquerda) - self.obter_altura(no.direita)
 
+    def obter_tamanho(self, no):
+        """
+        Retorna o número de nós da subárvore. Se o nó for nulo, o tamanho é 0.
+        """
+        return 0 if no is None else no.tamanho
+
     def _atualizar_altura(self, no):
         """
         Atualiza a altura de um nó com base na altura máxima de seus filhos.
         A altura é 1 + max(altura(esquerda), altura(direita)).
+        Também recalcula o tamanho da subárvore, que as rotações precisam manter.
         """
         if no is None:
             return
         no.altura = 1 + max(self.obter_altura(no.esquerda), self.obter_altura(no.direita))
+        no.tamanho = 1 + self.obter_tamanho(no.esquerda) + self.obter_tamanho(no.direita)
 
     def obter_no_valor_minimo(self, no):
         """
@@ -91,118 +119,610 @@ class ArvoreAVL:
         return y
 
     # ===============================================================
-    # TAREFA 1: IMPLEMENTAR INSERÇÃO E DELEÇÃO COM BALANCEAMENTO
+    # CARGA EM LOTE
     # ===============================================================
 
-    def inserir(self, chave):
-        """Método público para inserir uma chave na árvore."""
-        self.raiz = self._inserir_recursivo(self.raiz, chave)
+    @classmethod
+    def from_iterable(cls, chaves, presorted=False):
+        """
+        Constrói uma árvore perfeitamente balanceada a partir de um iterável de chaves.
+        Se presorted for False as chaves são ordenadas antes; com presorted=True a
+        construção é O(n). Chaves duplicadas geram ValueError, como em inserir.
+        """
+        chaves = list(chaves) if presorted else sorted(chaves)
+        if not all(map(operator.lt, chaves, islice(chaves, 1, None))):
+            for anterior, chave in zip(chaves, islice(chaves, 1, None)):
+                if anterior == chave:
+                    raise ValueError(f"Chave duplicada: {chave}")
+                if anterior > chave:
+                    raise ValueError(f"Chaves fora de ordem com presorted=True: {anterior} > {chave}")
+        arvore = cls()
+        arvore.raiz = arvore._construir_balanceada(chaves, 0, len(chaves))
+        return arvore
+
+    def _construir_balanceada(self, chaves, inicio, fim):
+        """
+        Monta a subárvore com as chaves[inicio:fim] usando o elemento do meio como raiz.
+        A profundidade da recursão é O(log n) e cada nó é criado uma única vez.
+        """
+        if inicio >= fim:
+            return None
+        meio = (inicio + fim) // 2
+        no = No(chaves[meio])
+        no.esquerda = self._construir_balanceada(chaves, inicio, meio)
+        no.direita = self._construir_balanceada(chaves, meio + 1, fim)
+        self._atualizar_altura(no)
+        return no
+
+    # ===============================================================
+    # SNAPSHOT BINÁRIO EM DISCO
+    # ===============================================================
 
-    def _inserir_recursivo(self, no_atual, chave):
-        # Passo 1: Realiza a inserção padrão de uma BST.
-        if no_atual is None:
-            return No(chave)
+    def salvar(self, caminho):
+        """
+        Grava a árvore (com a forma atual) no formato de snapshot_binario.
+        As chaves precisam ser todas inteiros de 64 bits ou todas floats.
+        """
+        return salvar_arvore(self.raiz, caminho, lambda no: (no.esquerda, no.direita),
+                             lambda no: no.chave)
 
-        if chave < no_atual.chave:
-            no_atual.esquerda = self._inserir_recursivo(no_atual.esquerda, chave)
-        elif chave > no_atual.chave:
-            no_atual.direita = self._inserir_recursivo(no_atual.direita, chave)
-        else:
+    @classmethod
+    def carregar(cls, caminho, somente_leitura=False):
+        """
+        Lê um snapshot gravado por salvar. Com somente_leitura=True retorna uma
+        ArvoreMapeada, que consulta o arquivo via mmap sem criar nenhum nó.
+        """
+        if somente_leitura:
+            return ArvoreMapeada(caminho)
+        chaves, esquerda, direita, raiz = ler_arvore(caminho)
+        arvore = cls()
+        nos = [No(chave) for chave in chaves]
+        # em pré-ordem todo filho vem depois do pai: de trás para frente, os filhos
+        # de cada nó já têm altura e tamanho prontos quando ele é visitado
+        for i in range(len(nos) - 1, -1, -1):
+            no = nos[i]
+            if esquerda[i] != -1:
+                no.esquerda = nos[esquerda[i]]
+            if direita[i] != -1:
+                no.direita = nos[direita[i]]
+            arvore._atualizar_altura(no)
+        arvore.raiz = nos[raiz] if raiz != -1 else None
+        return arvore
+
+    # ===============================================================
+    # TAREFA 1: IMPLEMENTAR INSERÇÃO E DELEÇÃO COM BALANCEAMENTO
+    # ===============================================================
+
+    def inserir(self, chave, valor=None):
+        """Método público para inserir uma chave (e, opcionalmente, seu valor) na árvore."""
+        if self._inserir_no(chave, valor) is not None:
             # Chaves duplicadas não são permitidas
             raise ValueError(f"Chave duplicada: {chave}")
 
-        # ---- LÓGICA DE BALANCEAMENTO AVL ----
-        # Passo 2: Atualiza a altura do nó atual (ancestral) após a inserção.
-        self._atualizar_altura(no_atual)
+    def _inserir_no(self, chave, valor):
+        """
+        Insere a chave e retorna None; se ela já existir, não muda nada e retorna o nó
+        dela (MapaAVL.put troca o valor sem uma segunda descida).
+        """
+        self._snapshot = None
+        # Passo 1: Desce como numa BST, guardando o caminho percorrido (sem recursão).
+        caminho = []
+        atual = self.raiz
+        while atual is not None:
+            caminho.append(atual)
+            if chave < atual.chave:
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                atual = atual.direita
+            else:
+                return atual
+
+        novo = No(chave, valor)
+        if not caminho:
+            self.raiz = novo
+            return None
+        pai = caminho[-1]
+        if chave < pai.chave:
+            pai.esquerda = novo
+        else:
+            pai.direita = novo
 
-        # Passo 3: Calcula o fator de balanceamento para verificar se o nó ficou desbalanceado.
-        balance = self.obter_fator_balanceamento(no_atual)
+        # Passo 2: Sobe pelo caminho atualizando alturas e rotacionando.
+        self._rebalancear_caminho(caminho)
+        return None
 
-        # Passo 4: Verifica se o nó ficou desbalanceado e aplica as rotações corretas.
-        # Caso 1: Left Left
-        if balance > 1 and chave < no_atual.esquerda.chave:
-            return self._rotacao_direita(no_atual)
+    def deletar(self, chave):
+        """Método público para deletar uma chave da árvore."""
+        self._snapshot = None
+        # Passo 1: Localiza o nó guardando o caminho desde a raiz.
+        caminho = []
+        atual = self.raiz
+        while atual is not None:
+            if chave < atual.chave:
+                caminho.append(atual)
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                caminho.append(atual)
+                atual = atual.direita
+            else:
+                break
+        if atual is None:
+            return  # chave não encontrada; nada a fazer
+
+        # Caso 2: Nó com dois filhos — copia o sucessor (menor na subárvore direita,
+        # com o seu valor) para cá e passa a remover o nó do sucessor, que tem no máximo um filho.
+        if atual.esquerda is not None and atual.direita is not None:
+            caminho.append(atual)
+            sucessor = atual.direita
+            while sucessor.esquerda is not None:
+                caminho.append(sucessor)
+                sucessor = sucessor.esquerda
+            atual.chave, atual.valor = sucessor.chave, sucessor.valor
+            atual = sucessor
+
+        # Caso 1: Nó com um filho ou nenhum filho — o filho ocupa o lugar do nó.
+        filho = atual.esquerda if atual.esquerda is not None else atual.direita
+        if not caminho:
+            self.raiz = filho
+            return
+        pai = caminho[-1]
+        if pai.esquerda is atual:
+            pai.esquerda = filho
+        else:
+            pai.direita = filho
+
+        # Passo 2: Rebalanceia do pai do nó removido até a raiz.
+        self._rebalancear_caminho(caminho)
 
-        # Caso 2: Right Right
-        if balance < -1 and chave > no_atual.direita.chave:
-            return self._rotacao_esquerda(no_atual)
+    def _rebalancear_caminho(self, caminho):
+        """
+        Percorre o caminho de baixo para cima aplicando _balancear em cada nó e
+        religando a nova raiz de cada subárvore ao seu pai (ou à raiz da árvore).
+        Quando a altura de uma subárvore não muda, os ancestrais não precisam mais
+        de rotação: deles em diante só _atualizar_tamanho é chamado.
+        """
+        i = len(caminho) - 1
+        while i >= 0:
+            no = caminho[i]
+            altura_antiga = no.altura
+            nova_raiz = self._balancear(no)
+            if nova_raiz is not no:
+                if i == 0:
+                    self.raiz = nova_raiz
+                elif caminho[i - 1].esquerda is no:
+                    caminho[i - 1].esquerda = nova_raiz
+                else:
+                    caminho[i - 1].direita = nova_raiz
+            i -= 1
+            if nova_raiz.altura == altura_antiga:
+                break
+        for j in range(i, -1, -1):
+            self._atualizar_tamanho(caminho[j])
+
+    def _atualizar_tamanho(self, no):
+        """
+        Recalcula o que muda num ancestral cuja altura ficou igual. Subclasses que
+        guardam outros agregados da subárvore nos nós (ver avl_merkle) os atualizam aqui.
+        """
+        no.tamanho = 1 + self.obter_tamanho(no.esquerda) + self.obter_tamanho(no.direita)
 
-        # Caso 3: Left Right
-        if balance > 1 and chave > no_atual.esquerda.chave:
-            no_atual.esquerda = self._rotacao_esquerda(no_atual.esquerda)
-            return self._rotacao_direita(no_atual)
+    def _balancear(self, no):
+        """
+        Atualiza a altura do nó e, se ele ficou desbalanceado, aplica as rotações corretas.
+        Retorna a nova raiz da subárvore.
+        """
+        self._atualizar_altura(no)
+        balance = self.obter_fator_balanceamento(no)
 
-        # Caso 4: Right Left
-        if balance < -1 and chave < no_atual.direita.chave:
-            no_atual.direita = self._rotacao_direita(no_atual.direita)
-            return self._rotacao_esquerda(no_atual)
+        if balance > 1:
+            # Left Right: o filho esquerdo pende para a direita
+            if self.obter_fator_balanceamento(no.esquerda) < 0:
+                no.esquerda = self._rotacao_esquerda(no.esquerda)
+            # Left Left
+            return self._rotacao_direita(no)
 
-        # Retorna o nó (potencialmente a nova raiz da subárvore após rotação).
-        return no_atual
+        if balance < -1:
+            # Right Left: o filho direito pende para a esquerda
+            if self.obter_fator_balanceamento(no.direita) > 0:
+                no.direita = self._rotacao_direita(no.direita)
+            # Right Right
+            return self._rotacao_esquerda(no)
 
-    def deletar(self, chave):
-        """Método público para deletar uma chave da árvore."""
-        self.raiz = self._deletar_recursivo(self.raiz, chave)
+        return no
+
+    # ===============================================================
+    # OPERAÇÕES DE CONJUNTO (split / join)
+    # ===============================================================
+    # dividir e juntar consomem as árvores de entrada: os nós são reaproveitados no
+    # resultado e as entradas ficam vazias. União, interseção e diferença retornam uma
+    # árvore nova e, por padrão, trabalham sobre cópias dos nós (O(n + m) a mais) e
+    # deixam as entradas intactas; com consumir=True elas reaproveitam os nós das
+    # entradas, que ficam vazias, e custam O(m log(n/m + 1)) (m <= n). Os valores
+    # (MapaAVL) acompanham os nós; na união vale o desta árvore.
+    # Quando uma árvore é muito menor que a outra (m * LIMIAR_PONTUAL < n),
+    # inserir/consultar chave a chave custa O(m log n), que no CPython sai mais
+    # barato que a recursão de split/join.
+    LIMIAR_PONTUAL = 8
+
+    def dividir(self, chave):
+        """
+        Divide a árvore em (menores, encontrada, maiores): duas ArvoreAVL com as chaves
+        < chave e > chave, e um bool dizendo se a chave existia. Custa O(log n) e
+        deixa esta árvore vazia.
+        """
+        menores, encontrada, maiores = self._dividir_nos(self.raiz, chave)
+        self._esvaziar()
+        return self._nova_arvore(menores), encontrada, self._nova_arvore(maiores)
+
+    @classmethod
+    def juntar(cls, esquerda, chave, direita, valor=None):
+        """
+        Junta duas árvores em que todas as chaves de esquerda < chave < todas as de
+        direita, com chave (e seu valor) no meio. Custa O(|altura(esquerda) - altura(direita)| + 1)
+        e deixa as duas árvores de entrada vazias.
+        """
+        maior = esquerda._no_extremo("direita")
+        menor = direita._no_extremo("esquerda")
+        if (maior is not None and not maior.chave < chave) or (menor is not None and not chave < menor.chave):
+            raise ValueError(f"juntar exige esquerda < {chave} < direita")
+        arvore = esquerda._nova_arvore(esquerda._juntar_nos(esquerda.raiz, No(chave, valor), direita.raiz))
+        esquerda._esvaziar()
+        direita._esvaziar()
+        return arvore
+
+    def uniao(self, outra, trabalhadores=None, consumir=False):
+        """
+        Retorna uma nova árvore com as chaves das duas. Com consumir=True os nós das
+        duas são reaproveitados e elas ficam vazias.
+        """
+        return self._operar_conjunto("uniao", outra, trabalhadores, consumir)
+
+    def intersecao(self, outra, trabalhadores=None, consumir=False):
+        """
+        Retorna uma nova árvore com as chaves comuns às duas (com os valores desta).
+        Com consumir=True os nós das duas são reaproveitados e elas ficam vazias.
+        """
+        return self._operar_conjunto("intersecao", outra, trabalhadores, consumir)
+
+    def diferenca(self, outra, trabalhadores=None, consumir=False):
+        """
+        Retorna uma nova árvore com as chaves desta que não estão na outra. Com
+        consumir=True os nós das duas são reaproveitados e elas ficam vazias.
+        """
+        return self._operar_conjunto("diferenca", outra, trabalhadores, consumir)
+
+    def copiar(self):
+        """Cópia independente da árvore, com a mesma forma, em O(n)."""
+        return self._nova_arvore(self._copiar_nos(self.raiz))
 
-    def _deletar_recursivo(self, no_atual, chave):
-        # Passo 1: Realiza a deleção padrão de uma BST.
-        if no_atual is None:
-            return no_atual  # chave não encontrada; nada a fazer
+    def _copiar_nos(self, no):
+        if no is None:
+            return None
+        copia = No.__new__(type(no))
+        copia.__dict__.update(no.__dict__)  # leva o valor e o que a subclasse guardar no nó
+        copia.esquerda = self._copiar_nos(no.esquerda)
+        copia.direita = self._copiar_nos(no.direita)
+        return copia
+
+    def _nova_arvore(self, raiz=None):
+        """Cria uma árvore do mesmo tipo desta com a raiz dada."""
+        arvore = type(self)()
+        arvore.raiz = raiz
+        return arvore
+
+    def _esvaziar(self):
+        self.raiz = None
+        self._snapshot = None
+
+    def _no_extremo(self, lado):
+        """Nó mais à esquerda ou mais à direita da árvore (None se vazia)."""
+        atual = self.raiz
+        while atual is not None and getattr(atual, lado) is not None:
+            atual = getattr(atual, lado)
+        return atual
+
+    def _operar_conjunto(self, operacao, outra, trabalhadores, consumir):
+        """
+        Aplica a operação às raízes das duas árvores (ou de cópias delas). Com
+        trabalhadores > 1 os primeiros níveis da recursão são divididos aqui e as
+        subárvores resultantes são processadas em paralelo num ProcessPoolExecutor
+        (vale para árvores grandes: as subárvores são serializadas para ir e voltar
+        dos processos).
+        """
+        if consumir:
+            if outra is self:
+                raise ValueError("As duas árvores de uma operação de conjunto devem ser distintas")
+            a, b = self.raiz, outra.raiz
+            self._esvaziar()
+            outra._esvaziar()
+        else:
+            a, b = self._copiar_nos(self.raiz), self._copiar_nos(outra.raiz)
+        n_a, n_b = self.obter_tamanho(a), self.obter_tamanho(b)
+        if min(n_a, n_b) * self.LIMIAR_PONTUAL < max(n_a, n_b):
+            return self._operar_pontual(operacao, self._nova_arvore(a), self._nova_arvore(b))
+        if not trabalhadores or trabalhadores <= 1:
+            return self._nova_arvore(self._operar_nos(operacao, a, b))
+
+        tarefas = []
+        plano = self._planejar(operacao, a, b, (trabalhadores - 1).bit_length(), tarefas)
+        with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+            resultados = list(executor.map(_operar_em_processo, [self._nova_arvore()] * len(tarefas),
+                                           [operacao] * len(tarefas), *zip(*tarefas)))
+        return self._nova_arvore(self._montar(plano, resultados))
+
+    def _operar_pontual(self, operacao, a, b):
+        """
+        Operação de conjunto chave a chave, percorrendo a menor das duas árvores. a e b
+        são descartáveis (cópias ou árvores consumidas); os nós de a são reaproveitados,
+        então o valor de cada chave de a vai junto para o resultado.
+        """
+        menor, maior = (a, b) if len(a) <= len(b) else (b, a)
+        if operacao == "uniao":
+            for no in menor._nos_em_ordem():
+                existente = maior._localizar(no.chave)
+                if existente is None:
+                    maior.inserir(no.chave, no.valor)
+                elif menor is a:
+                    existente.valor = no.valor  # chave nas duas: vale o valor de a
+            return maior
+        if operacao == "intersecao":
+            if a is menor:
+                comuns = [no for no in a._nos_em_ordem() if b._localizar(no.chave) is not None]
+            else:
+                comuns = [no for no in map(a._localizar, b.percurso_em_ordem()) if no is not None]
+            return self._nova_arvore(self._religar_balanceada(comuns, 0, len(comuns)))
+        if operacao == "diferenca":
+            if b is menor:
+                for chave in b.percurso_em_ordem():
+                    a.deletar(chave)
+                return a
+            restantes = [no for no in a._nos_em_ordem() if b._localizar(no.chave) is None]
+            return self._nova_arvore(self._religar_balanceada(restantes, 0, len(restantes)))
+        raise ValueError(f"Operação de conjunto desconhecida: {operacao}")
+
+    def _localizar(self, chave):
+        """Nó com a chave, ou None."""
+        atual = self.raiz
+        while atual is not None:
+            if chave < atual.chave:
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                atual = atual.direita
+            else:
+                return atual
+        return None
 
-        if chave < no_atual.chave:
-            no_atual.esquerda = self._deletar_recursivo(no_atual.esquerda, chave)
-        elif chave > no_atual.chave:
-            no_atual.direita = self._deletar_recursivo(no_atual.direita, chave)
+    def _nos_em_ordem(self):
+        """Lista dos nós em ordem de chave."""
+        nos = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            atual = pilha.pop()
+            nos.append(atual)
+            atual = atual.direita
+        return nos
+
+    def _religar_balanceada(self, nos, inicio, fim):
+        """Como _construir_balanceada, mas religando os nós[inicio:fim] já existentes."""
+        if inicio >= fim:
+            return None
+        meio = (inicio + fim) // 2
+        no = nos[meio]
+        no.esquerda = self._religar_balanceada(nos, inicio, meio)
+        no.direita = self._religar_balanceada(nos, meio + 1, fim)
+        self._atualizar_altura(no)
+        return no
+
+    def _planejar(self, operacao, a, b, niveis, tarefas):
+        """
+        Desdobra 'niveis' níveis da recursão de _operar_nos, guardando os pares de
+        subárvores independentes em tarefas. Retorna o plano para remontar o resultado.
+        """
+        if niveis == 0 or a is None or b is None:
+            tarefas.append((a, b))
+            return len(tarefas) - 1
+        if operacao == "diferenca":
+            esquerda_a, _, direita_a = self._dividir_nos(a, b.chave)
+            pares = ((esquerda_a, b.esquerda), (direita_a, b.direita))
+            meio = None
+        else:
+            esquerda_b, encontrada, direita_b = self._dividir_nos(b, a.chave)
+            pares = ((a.esquerda, esquerda_b), (a.direita, direita_b))
+            meio = a if operacao == "uniao" or encontrada else None
+        return (meio,
+                self._planejar(operacao, pares[0][0], pares[0][1], niveis - 1, tarefas),
+                self._planejar(operacao, pares[1][0], pares[1][1], niveis - 1, tarefas))
+
+    def _montar(self, plano, resultados):
+        if isinstance(plano, int):
+            return resultados[plano]
+        meio, esquerdo, direito = plano
+        esquerda = self._montar(esquerdo, resultados)
+        direita = self._montar(direito, resultados)
+        if meio is None:
+            return self._concatenar_nos(esquerda, direita)
+        return self._juntar_nos(esquerda, meio, direita)
+
+    def _operar_nos(self, operacao, a, b):
+        """União, interseção ou diferença de duas subárvores (recursão de altura O(log n))."""
+        if operacao == "uniao":
+            if a is None:
+                return b
+            if b is None:
+                return a
+            esquerda_a, direita_a = a.esquerda, a.direita
+            esquerda_b, _, direita_b = self._dividir_nos(b, a.chave)
+            return self._juntar_nos(self._operar_nos(operacao, esquerda_a, esquerda_b), a,
+                                    self._operar_nos(operacao, direita_a, direita_b))
+        if operacao == "intersecao":
+            if a is None or b is None:
+                return None
+            esquerda_a, direita_a = a.esquerda, a.direita
+            esquerda_b, encontrada, direita_b = self._dividir_nos(b, a.chave)
+            esquerda = self._operar_nos(operacao, esquerda_a, esquerda_b)
+            direita = self._operar_nos(operacao, direita_a, direita_b)
+            if encontrada:
+                return self._juntar_nos(esquerda, a, direita)
+            return self._concatenar_nos(esquerda, direita)
+        if operacao == "diferenca":
+            if a is None or b is None:
+                return a
+            esquerda_b, direita_b = b.esquerda, b.direita
+            esquerda_a, _, direita_a = self._dividir_nos(a, b.chave)
+            return self._concatenar_nos(self._operar_nos(operacao, esquerda_a, esquerda_b),
+                                        self._operar_nos(operacao, direita_a, direita_b))
+        raise ValueError(f"Operação de conjunto desconhecida: {operacao}")
+
+    def _dividir_nos(self, no, chave):
+        """
+        Split da subárvore: retorna (nós < chave, se a chave existia, nós > chave).
+        O nó com a chave, se existir, é descartado.
+        """
+        if no is None:
+            return None, False, None
+        if chave < no.chave:
+            menores, encontrada, maiores = self._dividir_nos(no.esquerda, chave)
+            return menores, encontrada, self._juntar_nos(maiores, no, no.direita)
+        if chave > no.chave:
+            menores, encontrada, maiores = self._dividir_nos(no.direita, chave)
+            return self._juntar_nos(no.esquerda, no, menores), encontrada, maiores
+        return no.esquerda, True, no.direita
+
+    def _juntar_nos(self, esquerda, meio, direita):
+        """
+        Join AVL: usa o nó meio para unir as subárvores (chaves de esquerda < meio <
+        chaves de direita). Desce pela borda da árvore mais alta até uma subárvore de
+        altura compatível, pendura o meio ali e rebalanceia o caminho de volta.
+        """
+        he, hd = self.obter_altura(esquerda), self.obter_altura(direita)
+        if abs(he - hd) <= 1:
+            meio.esquerda, meio.direita = esquerda, direita
+            self._atualizar_altura(meio)
+            return meio
+        # desce pela borda direita da esquerda (ou pela borda esquerda da direita)
+        alta, lado, altura_baixa = (esquerda, "direita", hd) if he > hd else (direita, "esquerda", he)
+        caminho = []
+        atual = alta
+        while self.obter_altura(atual) > altura_baixa + 1:
+            caminho.append(atual)
+            atual = getattr(atual, lado)
+        if he > hd:
+            meio.esquerda, meio.direita = atual, direita
         else:
-            # Nó encontrado — trata os casos de deleção
-            # Caso 1: Nó com um filho ou nenhum filho.
-            if no_atual.esquerda is None:
-                temp = no_atual.direita
-                no_atual = None
-                return temp
-            elif no_atual.direita is None:
-                temp = no_atual.esquerda
-                no_atual = None
-                return temp
-
-            # Caso 2: Nó com dois filhos — encontra o sucessor (menor na subárvore direita)
-            temp = self.obter_no_valor_minimo(no_atual.direita)
-            no_atual.chave = temp.chave  # copia o sucessor para aqui
-            no_atual.direita = self._deletar_recursivo(no_atual.direita, temp.chave)  # deleta o sucessor
-
-        # Se a árvore só tinha um nó e foi deletado
-        if no_atual is None:
-            return no_atual
-
-        # ---- LÓGICA DE BALANCEAMENTO AVL APÓS DELEÇÃO ----
-        # Passo 2: Atualiza a altura do nó atual.
-        self._atualizar_altura(no_atual)
-
-        # Passo 3: Calcula o fator de balanceamento.
-        balance = self.obter_fator_balanceamento(no_atual)
-
-        # Passo 4: Verifica o desbalanceamento e aplica as rotações.
-
-        # Left Left
-        if balance > 1 and self.obter_fator_balanceamento(no_atual.esquerda) >= 0:
-            return self._rotacao_direita(no_atual)
-
-        # Left Right
-        if balance > 1 and self.obter_fator_balanceamento(no_atual.esquerda) < 0:
-            no_atual.esquerda = self._rotacao_esquerda(no_atual.esquerda)
-            return self._rotacao_direita(no_atual)
-
-        # Right Right
-        if balance < -1 and self.obter_fator_balanceamento(no_atual.direita) <= 0:
-            return self._rotacao_esquerda(no_atual)
-
-        # Right Left
-        if balance < -1 and self.obter_fator_balanceamento(no_atual.direita) > 0:
-            no_atual.direita = self._rotacao_direita(no_atual.direita)
-            return self._rotacao_esquerda(no_atual)
-
-        # Retorna o nó (potencialmente a nova raiz da subárvore).
-        return no_atual
+            meio.esquerda, meio.direita = esquerda, atual
+        self._atualizar_altura(meio)
+        filho = meio
+        for no in reversed(caminho):
+            setattr(no, lado, filho)
+            filho = self._balancear(no)
+        return filho
+
+    def _concatenar_nos(self, esquerda, direita):
+        """Join sem nó do meio: o maior nó da esquerda passa a ser o meio."""
+        if esquerda is None:
+            return direita
+        if direita is None:
+            return esquerda
+        resto, maior = self._separar_maximo(esquerda)
+        return self._juntar_nos(resto, maior, direita)
+
+    def _separar_maximo(self, no):
+        """Retorna (subárvore sem o maior nó, maior nó)."""
+        if no.direita is None:
+            return no.esquerda, no
+        resto, maior = self._separar_maximo(no.direita)
+        return self._juntar_nos(no.esquerda, no, resto), maior
+
+    # ===============================================================
+    # ESCRITAS EM LOTE (uma descida para várias chaves)
+    # ===============================================================
+
+    def aplicar_lote(self, operacoes):
+        """
+        Aplica uma sequência de pares (operacao, chave), com operacao "inserir" ou
+        "deletar", numa única descida: o lote é ordenado por chave (de forma estável,
+        então pedidos da mesma chave seguem a ordem dada) e dividido em cada nó entre
+        as duas subárvores; só os ramos que têm chaves do lote são visitados e, na
+        volta, cada nó é religado com join, o que rebalanceia uma vez por nó do caminho
+        compartilhado em vez de uma vez por chave. Custa O(m log(n/m + 1)) para m
+        operações. Retorna uma lista, na ordem das operações, com None ou o
+        ValueError que inserir teria gerado (chave duplicada); nada é interrompido.
+        """
+        operacoes = list(operacoes)
+        for operacao, _ in operacoes:
+            if operacao not in ("inserir", "deletar"):
+                raise ValueError(f"Operação de lote desconhecida: {operacao}")
+        ordem = sorted(range(len(operacoes)), key=lambda i: operacoes[i][1])
+        chaves = [operacoes[i][1] for i in ordem]
+        erros = [None] * len(operacoes)
+        if not operacoes:
+            return erros
+        self._snapshot = None
+        self.raiz = self._aplicar_lote_nos(self.raiz, operacoes, ordem, chaves, 0, len(ordem), erros)
+        return erros
+
+    def _aplicar_lote_nos(self, no, operacoes, ordem, chaves, inicio, fim, erros):
+        """Aplica as operações ordem[inicio:fim] à subárvore e retorna a nova raiz dela."""
+        if fim - inicio == 1:
+            return self._aplicar_na_subarvore(no, operacoes, ordem[inicio], erros)
+        if no is None:
+            # só as chaves que terminam inseridas viram nós, numa subárvore balanceada
+            novas = []
+            while inicio < fim:
+                inicio, novo = self._resolver_chave(None, operacoes, ordem, chaves, inicio, fim, erros)
+                if novo is not None:
+                    novas.append(novo.chave)
+            return self._construir_balanceada(novas, 0, len(novas))
+        i = bisect_left(chaves, no.chave, inicio, fim)
+        j = bisect_right(chaves, no.chave, i, fim)
+        esquerda, direita, meio = no.esquerda, no.direita, no
+        if inicio < i:
+            esquerda = self._aplicar_lote_nos(esquerda, operacoes, ordem, chaves, inicio, i, erros)
+        if j < fim:
+            direita = self._aplicar_lote_nos(direita, operacoes, ordem, chaves, j, fim, erros)
+        if i < j:
+            _, meio = self._resolver_chave(no, operacoes, ordem, chaves, i, j, erros)
+        if meio is None:
+            return self._concatenar_nos(esquerda, direita)
+        # com alturas compatíveis o join só religa os filhos e atualiza o nó
+        return self._juntar_nos(esquerda, meio, direita)
+
+    def _aplicar_na_subarvore(self, no, operacoes, i, erros):
+        """
+        Uma operação sozinha num ramo segue o caminho iterativo de inserir/deletar
+        (com as sobrescritas da subclasse), com a subárvore no lugar da raiz.
+        """
+        operacao, chave = operacoes[i]
+        raiz, self.raiz = self.raiz, no
+        try:
+            getattr(self, operacao)(chave)
+        except ValueError as erro:  # chave duplicada
+            erros[i] = erro
+        finally:
+            no, self.raiz = self.raiz, raiz
+        return no
+
+    def _resolver_chave(self, no, operacoes, ordem, chaves, inicio, fim, erros):
+        """
+        Aplica em sequência as operações da chave chaves[inicio] ao nó que a guarda
+        (None se ela não está na árvore). Retorna (índice da próxima chave, nó final).
+        """
+        chave = chaves[inicio]
+        while inicio < fim and chaves[inicio] == chave:
+            i = ordem[inicio]
+            operacao = operacoes[i][0]
+            if operacao == "deletar":
+                no = None
+            elif no is not None:
+                erros[i] = ValueError(f"Chave duplicada: {chave}")
+            else:
+                no = No(chave)
+            inicio += 1
+        return inicio, no
 
     # ===============================================================
     # TAREFA 2 E 3: IMPLEMENTAR BUSCAS
@@ -212,21 +732,116 @@ class ArvoreAVL:
         """
         Encontra e retorna uma lista com todas as chaves no intervalo [chave1, chave2].
         """
-        resultado = []
-        def _in_order_intervalo(no):
-            if no is None:
+        return list(self.iter_intervalo(chave1, chave2))
+
+    def iter_intervalo(self, chave1, chave2, reverse=False, after=None):
+        """
+        Gera sob demanda as chaves no intervalo [chave1, chave2], em ordem crescente
+        (ou decrescente com reverse=True), usando uma pilha explícita de tamanho O(altura).
+        after é um cursor: só são geradas as chaves estritamente depois dele no sentido
+        do percurso. Posicionar o cursor custa O(log n), independente de quantas chaves
+        ficaram para trás. A árvore não deve ser alterada durante a iteração.
+        """
+        if reverse:
+            chave1, chave2 = chave2, chave1
+            primeiro, segundo = "direita", "esquerda"
+            antes = operator.gt  # "antes" no sentido do percurso
+        else:
+            primeiro, segundo = "esquerda", "direita"
+            antes = operator.lt
+        # limite de partida: chave1 inclusivo, ou o cursor exclusivo se ele estiver adiante
+        inicio, inclusivo = chave1, True
+        if after is not None and not antes(after, chave1):
+            inicio, inclusivo = after, False
+
+        # desce até o ponto de partida empilhando os nós que ainda serão gerados
+        pilha = []
+        atual = self.raiz
+        while atual is not None:
+            if antes(inicio, atual.chave) or (inclusivo and inicio == atual.chave):
+                pilha.append(atual)
+                atual = getattr(atual, primeiro)
+            else:
+                atual = getattr(atual, segundo)
+
+        while pilha:
+            no = pilha.pop()
+            if antes(chave2, no.chave):
                 return
-            # se possível, visita esquerda (podem haver valores >= chave1)
-            if no.chave > chave1:
-                _in_order_intervalo(no.esquerda)
-            # se no valor está no intervalo, adiciona
-            if chave1 <= no.chave <= chave2:
-                resultado.append(no.chave)
-            # visita direita se possível
-            if no.chave < chave2:
-                _in_order_intervalo(no.direita)
-        _in_order_intervalo(self.raiz)
-        return resultado
+            yield no.chave
+            atual = getattr(no, segundo)
+            while atual is not None:
+                pilha.append(atual)
+                atual = getattr(atual, primeiro)
+
+    def pagina_intervalo(self, chave1, chave2, limit, after=None, reverse=False):
+        """
+        Retorna uma página (lista com até limit chaves) do intervalo [chave1, chave2] e
+        o cursor para a próxima página, ou None se o intervalo acabou.
+        Para continuar, passe o cursor retornado como after. Cada página custa
+        O(log n + limit), qualquer que seja o deslocamento.
+        """
+        if limit <= 0:
+            raise ValueError(f"limit deve ser positivo: {limit}")
+        pagina = list(islice(self.iter_intervalo(chave1, chave2, reverse, after), limit + 1))
+        if len(pagina) > limit:
+            pagina.pop()
+            return pagina, pagina[-1]
+        return pagina, None
+
+    # ===============================================================
+    # ESTATÍSTICAS DE ORDEM (usam o tamanho das subárvores, O(log n))
+    # ===============================================================
+
+    def rank(self, chave):
+        """
+        Retorna quantas chaves da árvore são estritamente menores que a chave.
+        Se a chave existir, é a sua posição (a partir de 0) no percurso em ordem.
+        """
+        return self._contar_menores(chave, inclusivo=False)
+
+    def select(self, k):
+        """
+        Retorna a k-ésima menor chave (k a partir de 0), de forma que select(rank(c)) == c.
+        Gera IndexError se k estiver fora de [0, len(arvore)).
+        """
+        if not 0 <= k < self.obter_tamanho(self.raiz):
+            raise IndexError(f"Posição fora da árvore: {k}")
+        atual = self.raiz
+        while True:
+            tamanho_esquerda = self.obter_tamanho(atual.esquerda)
+            if k < tamanho_esquerda:
+                atual = atual.esquerda
+            elif k > tamanho_esquerda:
+                k -= tamanho_esquerda + 1
+                atual = atual.direita
+            else:
+                return atual.chave
+
+    def contar_intervalo(self, chave1, chave2):
+        """
+        Conta as chaves no intervalo [chave1, chave2] sem materializá-las.
+        """
+        if chave1 > chave2:
+            return 0
+        return self._contar_menores(chave2, inclusivo=True) - self._contar_menores(chave1, inclusivo=False)
+
+    def _contar_menores(self, chave, inclusivo):
+        """
+        Conta as chaves < chave (ou <= chave se inclusivo) descendo um único caminho.
+        """
+        contagem = 0
+        atual = self.raiz
+        while atual is not None:
+            if chave < atual.chave:
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                contagem += self.obter_tamanho(atual.esquerda) + 1
+                atual = atual.direita
+            else:
+                contagem += self.obter_tamanho(atual.esquerda)
+                return contagem + 1 if inclusivo else contagem
+        return contagem
 
     def obter_profundidade_no(self, chave):
         """
@@ -245,6 +860,58 @@ class ArvoreAVL:
             nivel += 1
         return -1  # não encontrado
 
+    # ===============================================================
+    # CONSULTAS EM LOTE
+    # ===============================================================
+
+    def profundidade_many(self, chaves):
+        """
+        Versão em lote de obter_profundidade_no: recebe uma lista ou array NumPy de
+        chaves e retorna a profundidade de cada uma (-1 se não existir).
+        Com NumPy a busca é vetorizada (np.searchsorted) sobre um snapshot ordenado
+        da árvore e o retorno é um array int64; sem NumPy retorna uma lista.
+        O snapshot é criado na primeira chamada e descartado em inserir/deletar.
+        """
+        ordenadas, profundidades = self._obter_snapshot()
+        if np is not None:
+            consultas = np.asarray(chaves)
+            resultado = np.full(consultas.shape, -1, dtype=np.int64)
+            if len(ordenadas):
+                pos = np.searchsorted(ordenadas, consultas)
+                pos_valida = np.minimum(pos, len(ordenadas) - 1)
+                achou = (pos < len(ordenadas)) & (ordenadas[pos_valida] == consultas)
+                resultado[achou] = profundidades[pos_valida[achou]]
+            return resultado
+        resultado = []
+        for chave in chaves:
+            pos = bisect_left(ordenadas, chave)
+            achou = pos < len(ordenadas) and ordenadas[pos] == chave
+            resultado.append(profundidades[pos] if achou else -1)
+        return resultado
+
+    def _obter_snapshot(self):
+        """
+        Retorna (chaves em ordem, profundidade de cada chave), montando-o se preciso
+        com um percurso em ordem iterativo.
+        """
+        if self._snapshot is None:
+            chaves = []
+            profundidades = []
+            pilha = []
+            atual, nivel = self.raiz, 0
+            while pilha or atual is not None:
+                while atual is not None:
+                    pilha.append((atual, nivel))
+                    atual, nivel = atual.esquerda, nivel + 1
+                no, nivel = pilha.pop()
+                chaves.append(no.chave)
+                profundidades.append(nivel)
+                atual, nivel = no.direita, nivel + 1
+            if np is not None:
+                chaves, profundidades = np.array(chaves), np.array(profundidades, dtype=np.int64)
+            self._snapshot = (chaves, profundidades)
+        return self._snapshot
+
     # Funções auxiliares para debug / verificação
     def percurso_em_ordem(self):
         """Retorna lista das chaves em ordem (in-order)."""
@@ -274,6 +941,11 @@ class ArvoreAVL:
         if no.direita:
             self.imprimir_arvore(no.direita, nivel+1, prefixo="R---")
 
+def _operar_em_processo(modelo, operacao, a, b):
+    """Executa uma operação de conjunto num processo do pool (ver ArvoreAVL._operar_conjunto)."""
+    return modelo._operar_nos(operacao, a, b)
+
+
 # --- Bloco de Teste e Demonstração da Atividade AVL ---
 if __name__ == "__main__":
     arvore_avl = ArvoreAVL()
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Árvore AVL com armazenamento compacto (struct-of-arrays).
+
+Em vez de um objeto Python por nó, os nós ficam em arrays tipados paralelos
+indexados por inteiro: chave, filho esquerdo, filho direito e altura. O índice
+-1 faz o papel de None. Posições liberadas por deletar entram numa lista livre
+(encadeada pelo próprio array de filhos esquerdos) e são reaproveitadas.
+
+A API pública é a mesma de atividade_5.ArvoreAVL.
+"""
+
+from array import array
+
+NULO = -1
+
+
+class ArvoreAVLCompacta:
+    """
+    Árvore AVL cujos nós vivem em arrays tipados.
+    tipo_chave é o typecode do array de chaves ('q' para inteiros de 64 bits,
+    'd' para floats); as chaves precisam caber nesse tipo.
+    """
+    def __init__(self, tipo_chave="q"):
+        self._chave = array(tipo_chave)
+        self._esq = array("i")
+        self._dir = array("i")
+        self._alt = array("b")  # altura 0 marca uma posição livre
+        self._livre = NULO
+        self._tamanho = 0
+        self.raiz = NULO
+
+    def __len__(self):
+        return self._tamanho
+
+    # ===============================================================
+    # ALOCAÇÃO DE NÓS
+    # ===============================================================
+
+    def _novo_no(self, chave):
+        """Ocupa uma posição da lista livre (ou cresce os arrays) e retorna seu índice."""
+        i = self._livre
+        if i != NULO:
+            # a chave primeiro: se ela não couber no typecode (TypeError/OverflowError)
+            # a lista livre continua intacta
+            self._chave[i] = chave
+            self._livre = self._esq[i]
+            self._esq[i] = NULO
+            self._dir[i] = NULO
+            self._alt[i] = 1
+        else:
+            i = len(self._chave)
+            self._chave.append(chave)
+            self._esq.append(NULO)
+            self._dir.append(NULO)
+            self._alt.append(1)
+        self._tamanho += 1
+        return i
+
+    def _liberar(self, i):
+        """Devolve a posição i para a lista livre."""
+        self._esq[i] = self._livre
+        self._dir[i] = NULO
+        self._alt[i] = 0
+        self._livre = i
+        self._tamanho -= 1
+
+    # ===============================================================
+    # AUXILIARES E ROTAÇÕES
+    # ===============================================================
+
+    def _altura(self, i):
+        return 0 if i == NULO else self._alt[i]
+
+    def _atualizar_altura(self, i):
+        self._alt[i] = 1 + max(self._altura(self._esq[i]), self._altura(self._dir[i]))
+
+    def _fator(self, i):
+        return self._altura(self._esq[i]) - self._altura(self._dir[i])
+
+    def _rotacao_direita(self, y):
+        x = self._esq[y]
+        self._esq[y] = self._dir[x]
+        self._dir[x] = y
+        self._atualizar_altura(y)
+        self._atualizar_altura(x)
+        return x
+
+    def _rotacao_esquerda(self, x):
+        y = self._dir[x]
+        self._dir[x] = self._esq[y]
+        self._esq[y] = x
+        self._atualizar_altura(x)
+        self._atualizar_altura(y)
+        return y
+
+    def _balancear(self, i):
+        """Mesma lógica de ArvoreAVL._balancear, trabalhando com índices."""
+        self._atualizar_altura(i)
+        balance = self._fator(i)
+        if balance > 1:
+            if self._fator(self._esq[i]) < 0:
+                self._esq[i] = self._rotacao_esquerda(self._esq[i])
+            return self._rotacao_direita(i)
+        if balance < -1:
+            if self._fator(self._dir[i]) > 0:
+                self._dir[i] = self._rotacao_direita(self._dir[i])
+            return self._rotacao_esquerda(i)
+        return i
+
+    def _rebalancear_caminho(self, caminho):
+        esq, dir_ = self._esq, self._dir
+        for pos in range(len(caminho) - 1, -1, -1):
+            i = caminho[pos]
+            altura_antiga = self._alt[i]
+            nova_raiz = self._balancear(i)
+            if nova_raiz != i:
+                if pos == 0:
+                    self.raiz = nova_raiz
+                elif esq[caminho[pos - 1]] == i:
+                    esq[caminho[pos - 1]] = nova_raiz
+                else:
+                    dir_[caminho[pos - 1]] = nova_raiz
+            if self._alt[nova_raiz] == altura_antiga:
+                break
+
+    # ===============================================================
+    # INSERÇÃO E DELEÇÃO
+    # ===============================================================
+
+    def inserir(self, chave):
+        """Insere uma chave; chaves duplicadas geram ValueError."""
+        chaves, esq, dir_ = self._chave, self._esq, self._dir
+        caminho = []
+        atual = self.raiz
+        while atual != NULO:
+            caminho.append(atual)
+            if chave < chaves[atual]:
+                atual = esq[atual]
+            elif chave > chaves[atual]:
+                atual = dir_[atual]
+            else:
+                raise ValueError(f"Chave duplicada: {chave}")
+
+        novo = self._novo_no(chave)
+        if not caminho:
+            self.raiz = novo
+            return
+        pai = caminho[-1]
+        if chave < chaves[pai]:
+            esq[pai] = novo
+        else:
+            dir_[pai] = novo
+        self._rebalancear_caminho(caminho)
+
+    def deletar(self, chave):
+        """Remove a chave se ela existir."""
+        chaves, esq, dir_ = self._chave, self._esq, self._dir
+        caminho = []
+        atual = self.raiz
+        while atual != NULO:
+            if chave < chaves[atual]:
+                caminho.append(atual)
+                atual = esq[atual]
+            elif chave > chaves[atual]:
+                caminho.append(atual)
+                atual = dir_[atual]
+            else:
+                break
+        if atual == NULO:
+            return
+
+        # dois filhos: copia a chave do sucessor e remove a posição do sucessor
+        if esq[atual] != NULO and dir_[atual] != NULO:
+            caminho.append(atual)
+            sucessor = dir_[atual]
+            while esq[sucessor] != NULO:
+                caminho.append(sucessor)
+                sucessor = esq[sucessor]
+            chaves[atual] = chaves[sucessor]
+            atual = sucessor
+
+        filho = esq[atual] if esq[atual] != NULO else dir_[atual]
+        if not caminho:
+            self.raiz = filho
+        else:
+            pai = caminho[-1]
+            if esq[pai] == atual:
+                esq[pai] = filho
+            else:
+                dir_[pai] = filho
+        self._liberar(atual)
+        if caminho:
+            self._rebalancear_caminho(caminho)
+
+    # ===============================================================
+    # BUSCAS
+    # ===============================================================
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        """Retorna, em ordem, as chaves no intervalo [chave1, chave2]."""
+        chaves, esq, dir_ = self._chave, self._esq, self._dir
+        resultado = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual != NULO:
+            # desce à esquerda apenas enquanto ainda pode haver chaves >= chave1
+            while atual != NULO:
+                pilha.append(atual)
+                atual = esq[atual] if chaves[atual] > chave1 else NULO
+            i = pilha.pop()
+            if chaves[i] > chave2:
+                break
+            if chaves[i] >= chave1:
+                resultado.append(chaves[i])
+            atual = dir_[i]
+        return resultado
+
+    def obter_profundidade_no(self, chave):
+        """Profundidade (raiz = 0) do nó com a chave, ou -1 se não existir."""
+        chaves, esq, dir_ = self._chave, self._esq, self._dir
+        nivel = 0
+        atual = self.raiz
+        while atual != NULO:
+            if chave == chaves[atual]:
+                return nivel
+            elif chave < chaves[atual]:
+                atual = esq[atual]
+            else:
+                atual = dir_[atual]
+            nivel += 1
+        return -1
+
+    def percurso_em_ordem(self):
+        """Retorna lista das chaves em ordem (in-order)."""
+        chaves, esq, dir_ = self._chave, self._esq, self._dir
+        resultado = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual != NULO:
+            while atual != NULO:
+                pilha.append(atual)
+                atual = esq[atual]
+            i = pilha.pop()
+            resultado.append(chaves[i])
+            atual = dir_[i]
+        return resultado
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Fachada thread-safe para atividade_5.ArvoreAVL.
+
+Leituras (obter_profundidade_no, encontrar_nos_intervalo, ...) rodam em paralelo sob
+a parte de leitura de uma trava leitores-escritor. Escritas entram numa fila e são
+aplicadas em lotes ("flat combining"): a thread que consegue a trava de escrita
+esvazia a fila inteira e aplica os pedidos de todas as threads que estavam
+esperando; essas threads desistem da trava assim que veem o próprio pedido feito,
+sem passar por ela. Lotes com pelo menos LOTE_MINIMO pedidos vão para
+ArvoreAVL.aplicar_lote, que ordena as chaves e faz uma única descida para todas,
+rebalanceando uma vez por nó do caminho compartilhado. Lotes menores são aplicados
+pedido a pedido: no CPython a descida iterativa de inserir/deletar sai mais barata
+que a recursão compartilhada até umas dezenas de chaves (ver
+benchmarks.concorrencia_mista).
+
+Não há uma segunda trava para escolher quem combina nem para as métricas (cada
+thread soma as suas): no CPython uma thread acordada de uma trava disputada
+espera o GIL até o intervalo de troca (5 ms), e era isso que dominava o p99.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from atividade_5 import ArvoreAVL
+
+
+class TravaLeitoresEscritor:
+    """
+    Trava leitores-escritor com preferência para escritores: enquanto houver um
+    escritor esperando, novos leitores aguardam (evita inanição das escritas).
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._leitores = 0
+        self._escrevendo = False
+        self._escritores_esperando = 0
+
+    def adquirir_leitura(self):
+        with self._cond:
+            while self._escrevendo or self._escritores_esperando:
+                self._cond.wait()
+            self._leitores += 1
+
+    def liberar_leitura(self):
+        with self._cond:
+            self._leitores -= 1
+            if self._leitores == 0:
+                self._cond.notify_all()
+
+    def adquirir_escrita(self, desistir=None):
+        """
+        Espera a trava de escrita. desistir é consultado a cada vez que a thread
+        acorda: se retornar True a espera acaba sem a trava e o método retorna False.
+        """
+        with self._cond:
+            self._escritores_esperando += 1
+            while self._escrevendo or self._leitores:
+                if desistir is not None and desistir():
+                    self._escritores_esperando -= 1
+                    return False
+                self._cond.wait()
+            self._escritores_esperando -= 1
+            self._escrevendo = True
+            return True
+
+    def liberar_escrita(self):
+        with self._cond:
+            self._escrevendo = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def leitura(self):
+        self.adquirir_leitura()
+        try:
+            yield
+        finally:
+            self.liberar_leitura()
+
+    @contextmanager
+    def escrita(self):
+        self.adquirir_escrita()
+        try:
+            yield
+        finally:
+            self.liberar_escrita()
+
+
+class _Pedido:
+    """Uma escrita pendente na fila; feito/erro são preenchidos por quem aplicar o lote."""
+    __slots__ = ("operacao", "chave", "feito", "erro")
+
+    def __init__(self, operacao, chave):
+        self.operacao = operacao
+        self.chave = chave
+        self.feito = False
+        self.erro = None
+
+
+class _Metrica:
+    """
+    Contagem, soma e máximo de latências (em segundos) de um tipo de operação.
+    Cada thread atualiza só as suas; estatisticas soma as de todas.
+    """
+    __slots__ = ("contagem", "total", "maximo")
+
+    def __init__(self):
+        self.contagem = 0
+        self.total = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, segundos):
+        self.contagem += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    @classmethod
+    def somar(cls, metricas):
+        soma = cls()
+        for metrica in metricas:
+            soma.contagem += metrica.contagem
+            soma.total += metrica.total
+            soma.maximo = max(soma.maximo, metrica.maximo)
+        return soma
+
+    def resumo(self, decorrido):
+        return {
+            "operacoes": self.contagem,
+            "por_segundo": self.contagem / decorrido if decorrido else 0.0,
+            "latencia_media": self.total / self.contagem if self.contagem else 0.0,
+            "latencia_maxima": self.maximo,
+        }
+
+
+class ArvoreAVLConcorrente:
+    """
+    Envolve uma ArvoreAVL para uso por várias threads. inserir/deletar só retornam
+    depois que o pedido foi aplicado (e propagam o ValueError de chave duplicada),
+    então cada thread sempre enxerga as próprias escritas. Árvores sem aplicar_lote
+    recebem os pedidos de cada lote um por vez.
+    """
+    # lotes menores que isso são aplicados pedido a pedido (ver o docstring do módulo)
+    LOTE_MINIMO = 64
+
+    def __init__(self, arvore=None):
+        self._arvore = arvore if arvore is not None else ArvoreAVL()
+        self._trava = TravaLeitoresEscritor()
+        self._fila = deque()
+        self._inicio = time.perf_counter()
+        self._por_thread = threading.local()
+        self._trava_registro = threading.Lock()  # só no primeiro acesso de cada thread
+        self._metricas = []  # (leituras, escritas) de cada thread
+        self._lotes = 0
+        self._maior_lote = 0
+        self._descidas_em_lote = 0
+
+    def _minhas_metricas(self):
+        try:
+            return self._por_thread.metricas
+        except AttributeError:
+            metricas = self._por_thread.metricas = (_Metrica(), _Metrica())
+            with self._trava_registro:
+                self._metricas.append(metricas)
+            return metricas
+
+    # ===============================================================
+    # LEITURAS
+    # ===============================================================
+
+    def _ler(self, funcao, *args):
+        inicio = time.perf_counter()
+        with self._trava.leitura():
+            resultado = funcao(*args)
+        self._minhas_metricas()[0].registrar(time.perf_counter() - inicio)
+        return resultado
+
+    def obter_profundidade_no(self, chave):
+        return self._ler(self._arvore.obter_profundidade_no, chave)
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        return self._ler(self._arvore.encontrar_nos_intervalo, chave1, chave2)
+
+    def contar_intervalo(self, chave1, chave2):
+        return self._ler(self._arvore.contar_intervalo, chave1, chave2)
+
+    def percurso_em_ordem(self):
+        return self._ler(self._arvore.percurso_em_ordem)
+
+    def __len__(self):
+        return self._ler(len, self._arvore)
+
+    # ===============================================================
+    # ESCRITAS (enfileiradas e aplicadas em lote)
+    # ===============================================================
+
+    def inserir(self, chave):
+        self._escrever("inserir", chave)
+
+    def deletar(self, chave):
+        self._escrever("deletar", chave)
+
+    def _escrever(self, operacao, chave):
+        inicio = time.perf_counter()
+        pedido = _Pedido(operacao, chave)
+        self._fila.append(pedido)
+        # quem pega a trava aplica a fila inteira; quem ainda espera desiste ao ver
+        # o próprio pedido aplicado por outra thread
+        if self._trava.adquirir_escrita(lambda: pedido.feito):
+            try:
+                if not pedido.feito:
+                    self._aplicar_fila()
+            finally:
+                self._trava.liberar_escrita()
+        self._minhas_metricas()[1].registrar(time.perf_counter() - inicio)
+        if pedido.erro is not None:
+            raise pedido.erro
+
+    def _aplicar_fila(self):
+        """Chamado com a trava de escrita: aplica todos os pedidos da fila."""
+        lote = []
+        while self._fila:
+            lote.append(self._fila.popleft())
+        aplicar_lote = getattr(self._arvore, "aplicar_lote", None)
+        if len(lote) >= self.LOTE_MINIMO and aplicar_lote is not None:
+            try:
+                erros = aplicar_lote([(pedido.operacao, pedido.chave) for pedido in lote])
+            except Exception as erro:  # por exemplo, chaves que não se comparam
+                erros = [erro] * len(lote)
+            for pedido, erro in zip(lote, erros):
+                pedido.erro = erro
+                pedido.feito = True
+            self._descidas_em_lote += 1
+        else:
+            for pedido in lote:
+                try:
+                    getattr(self._arvore, pedido.operacao)(pedido.chave)
+                except Exception as erro:  # devolvido à thread dona do pedido
+                    pedido.erro = erro
+                pedido.feito = True
+        self._lotes += 1
+        self._maior_lote = max(self._maior_lote, len(lote))
+
+    # ===============================================================
+    # MÉTRICAS
+    # ===============================================================
+
+    def estatisticas(self):
+        """
+        Retorna contadores de vazão e latência (segundos, incluindo a espera pelas
+        travas) de leituras e escritas, além do tamanho dos lotes aplicados. Com
+        threads rodando, os números podem estar uma operação atrasados.
+        """
+        decorrido = time.perf_counter() - self._inicio
+        with self._trava_registro:
+            metricas = list(self._metricas)
+        leituras = _Metrica.somar(m[0] for m in metricas)
+        escritas = _Metrica.somar(m[1] for m in metricas)
+        return {
+            "leituras": leituras.resumo(decorrido),
+            "escritas": escritas.resumo(decorrido),
+            "lotes": self._lotes,
+            "tamanho_medio_lote": escritas.contagem / self._lotes if self._lotes else 0.0,
+            "maior_lote": self._maior_lote,
+            "descidas_em_lote": self._descidas_em_lote,
+        }
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Hash de Merkle das subárvores da atividade_5.ArvoreAVL, para comparar e sincronizar
+réplicas do mesmo conjunto de chaves sem percorrê-las inteiras.
+
+Réplicas com as mesmas chaves quase nunca têm a mesma forma (a forma de uma AVL
+depende da ordem das inserções e remoções), então o hash de cada nó não pode
+depender da forma: ele é a soma, módulo 2^64, do hash (blake2b de 64 bits) de cada
+chave da subárvore. Assim o hash da raiz só depende do conjunto, e o hash de qualquer
+faixa de chaves sai em O(log n) somando os hashes das subárvores à esquerda de um
+caminho, do mesmo jeito que rank soma os tamanhos. O hash de cada nó é mantido em
+_atualizar_altura, por onde passam inserir, deletar, as rotações, o split/join e a
+carga em lote, e em _atualizar_tamanho, que corrige os ancestrais acima do ponto em
+que a altura para de mudar.
+
+diferencas compara as duas árvores por faixas: faixas com o mesmo (tamanho, hash)
+são puladas; as outras são divididas na mediana até ficarem pequenas, e só então
+as chaves são listadas. Com d chaves diferentes o custo é O(d log^2 n), em vez do
+O(n) de comparar os percursos em ordem.
+
+A soma não é um hash criptográfico do conjunto (alguém escolhendo chaves de propósito
+consegue forçar colisões); serve para detectar divergência entre réplicas honestas.
+"""
+
+from hashlib import blake2b
+
+from atividade_5 import ArvoreAVL
+
+MASCARA = (1 << 64) - 1
+
+
+def hash_chave(chave):
+    """
+    Hash de 64 bits de uma chave, igual em qualquer processo ou máquina (o hash() do
+    Python é aleatório por processo para str). Chaves iguais em ArvoreAVL (1 e 1.0)
+    têm o mesmo hash.
+    """
+    if isinstance(chave, float) and chave.is_integer():
+        chave = int(chave)
+    if isinstance(chave, int):
+        dados = b"i" + chave.to_bytes(chave.bit_length() // 8 + 1, "little", signed=True)
+    else:
+        dados = b"r" + repr(chave).encode()
+    return int.from_bytes(blake2b(dados, digest_size=8).digest(), "little")
+
+
+def _chaves_da_faixa(arvore, inicio, fim):
+    """Chaves de [inicio, fim) usando só rank e select (funciona com uma réplica remota)."""
+    primeira = 0 if inicio is None else arvore.rank(inicio)
+    ultima = arvore.resumo_intervalo(None, fim)[0]
+    return [arvore.select(k) for k in range(primeira, ultima)]
+
+
+class ArvoreAVLMerkle(ArvoreAVL):
+    """
+    ArvoreAVL em que cada nó guarda o hash do conjunto de chaves da sua subárvore.
+    Os valores (modo mapa) não entram no hash: só o conjunto de chaves é comparado.
+    """
+    # faixas com até tantas chaves (somando as duas árvores) são comparadas chave a chave
+    LIMIAR_LISTAGEM = 16
+
+    def _atualizar_altura(self, no):
+        """
+        Além de altura e tamanho, recalcula o hash da subárvore. Não chama a versão
+        da base porque roda em toda rotação e em todo nó do caminho.
+        """
+        if no is None:
+            return
+        esquerda, direita = no.esquerda, no.direita
+        altura = tamanho = 1
+        soma = 0
+        if esquerda is not None:
+            altura += esquerda.altura
+            tamanho += esquerda.tamanho
+            soma = getattr(esquerda, "hash", None)
+            if soma is None:  # folha recém-criada por inserir, que não passa por aqui
+                self._atualizar_altura(esquerda)
+                soma = esquerda.hash
+        if direita is not None:
+            altura = max(altura, 1 + direita.altura)
+            tamanho += direita.tamanho
+            hash_direita = getattr(direita, "hash", None)
+            if hash_direita is None:
+                self._atualizar_altura(direita)
+                hash_direita = direita.hash
+            soma += hash_direita
+        no.altura = altura
+        no.tamanho = tamanho
+        no.hash = (self._hash_proprio(no) + soma) & MASCARA
+
+    def _hash(self, no):
+        """Hash da subárvore, calculado na hora se o nó ainda não tem (folha nova, nó da classe base)."""
+        if no is None:
+            return 0
+        if getattr(no, "hash", None) is None:
+            self._atualizar_altura(no)
+        return no.hash
+
+    def _hash_proprio(self, no):
+        """
+        Hash só da chave do nó. Fica guardado no nó junto com a chave a que ele se
+        refere, porque deletar copia a chave do sucessor para outro nó.
+        """
+        guardado = getattr(no, "hash_chave", None)
+        if guardado is None or guardado[0] is not no.chave:
+            guardado = no.hash_chave = (no.chave, hash_chave(no.chave))
+        return guardado[1]
+
+    def _atualizar_tamanho(self, no):
+        """
+        Ancestral cuja altura não mudou (ver ArvoreAVL._rebalancear_caminho): o hash
+        também é recalculado, para a mudança chegar até a raiz.
+        """
+        esquerda, direita = no.esquerda, no.direita
+        tamanho, soma = 1, self._hash_proprio(no)
+        if esquerda is not None:
+            tamanho += esquerda.tamanho
+            soma += self._hash(esquerda)
+        if direita is not None:
+            tamanho += direita.tamanho
+            soma += self._hash(direita)
+        no.tamanho = tamanho
+        no.hash = soma & MASCARA
+
+    def assinatura(self):
+        """(número de chaves, hash do conjunto): iguais nas réplicas com as mesmas chaves."""
+        return len(self), self._hash(self.raiz)
+
+    # ===============================================================
+    # RESUMO DE FAIXAS
+    # ===============================================================
+
+    def _prefixo(self, chave):
+        """(quantidade, hash) das chaves < chave; chave None quer dizer a árvore toda."""
+        if chave is None:
+            return self.assinatura()
+        quantidade = soma = 0
+        atual = self.raiz
+        while atual is not None:
+            if chave <= atual.chave:
+                atual = atual.esquerda
+            else:
+                quantidade += self.obter_tamanho(atual.esquerda) + 1
+                soma += self._hash(atual.esquerda) + self._hash_proprio(atual)
+                atual = atual.direita
+        return quantidade, soma & MASCARA
+
+    def resumo_intervalo(self, inicio=None, fim=None):
+        """
+        (quantidade, hash) das chaves de [inicio, fim), em O(log n). None deixa o
+        lado correspondente aberto.
+        """
+        quantidade_fim, hash_fim = self._prefixo(fim)
+        if inicio is None:
+            return quantidade_fim, hash_fim
+        quantidade_inicio, hash_inicio = self._prefixo(inicio)
+        return quantidade_fim - quantidade_inicio, (hash_fim - hash_inicio) & MASCARA
+
+    # ===============================================================
+    # DIFERENÇA E SINCRONIZAÇÃO
+    # ===============================================================
+
+    def diferencas(self, outra):
+        """
+        Gera, em ordem crescente, as chaves que estão em só uma das árvores, como pares
+        (chave, True) se a chave só existe nesta e (chave, False) se só existe na outra.
+        Da outra árvore só são usados resumo_intervalo, rank e select, então ela pode
+        ser qualquer objeto que responda a esses métodos (por exemplo, um cliente de
+        uma réplica remota). As árvores não devem ser alteradas durante a iteração.
+        """
+        pilha = [(None, None)]
+        while pilha:
+            inicio, fim = pilha.pop()
+            nesta = self.resumo_intervalo(inicio, fim)
+            na_outra = outra.resumo_intervalo(inicio, fim)
+            if nesta == na_outra:
+                continue
+            if nesta[0] + na_outra[0] <= self.LIMIAR_LISTAGEM:
+                chaves_nesta = _chaves_da_faixa(self, inicio, fim)
+                chaves_na_outra = set(_chaves_da_faixa(outra, inicio, fim))
+                so_nesta = set(chaves_nesta).difference(chaves_na_outra)
+                diferentes = [(chave, True) for chave in so_nesta]
+                diferentes += [(chave, False) for chave in chaves_na_outra.difference(chaves_nesta)]
+                diferentes.sort(key=lambda par: par[0])
+                yield from diferentes
+                continue
+            # divide a faixa na chave mediana da árvore que tem mais chaves nela; as
+            # duas metades ficam estritamente menores, então a descida termina
+            maior, quantidade = (self, nesta[0]) if nesta[0] >= na_outra[0] else (outra, na_outra[0])
+            primeira = 0 if inicio is None else maior.rank(inicio)
+            meio = maior.select(primeira + quantidade // 2)
+            pilha.append((meio, fim))
+            pilha.append((inicio, meio))
+
+    def sincronizar_com(self, origem):
+        """
+        Aplica nesta árvore a diferença para a origem, deixando as duas com as mesmas
+        chaves. Retorna (inseridas, removidas).
+        """
+        diferencas = list(self.diferencas(origem))
+        inseridas = removidas = 0
+        for chave, so_nesta in diferencas:
+            if so_nesta:
+                self.deletar(chave)
+                removidas += 1
+            else:
+                self.inserir(chave)
+                inseridas += 1
+        return inseridas, removidas
+
+
+if __name__ == "__main__":
+    import random
+
+    chaves = random.sample(range(1_000_000), 100_000)
+    primaria = ArvoreAVLMerkle.from_iterable(chaves)
+    replica = ArvoreAVLMerkle()
+    for chave in reversed(chaves):  # mesma coleção, outra forma
+        replica.inserir(chave)
+    print("mesmas chaves:", primaria.assinatura() == replica.assinatura())
+    replica.deletar(chaves[0])
+    replica.inserir(-1)
+    print("diferenças:", list(primaria.diferencas(replica)))
+    print("sincronizar a réplica:", replica.sincronizar_com(primaria))
+    print("mesmas chaves:", primaria.assinatura() == replica.assinatura())
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+ArvoreAVL particionada por faixas de chave entre processos trabalhadores.
+
+Cada trabalhador é um processo com a sua própria atividade_5.ArvoreAVL, então as
+partições usam núcleos diferentes sem disputar o GIL. A fachada guarda os limites
+entre as faixas: a partição i fica com as chaves c tais que limites[i - 1] <= c < limites[i].
+Operações pontuais vão só para a partição da chave; encontrar_nos_intervalo e
+percurso_em_ordem consultam as partições envolvidas ao mesmo tempo e concatenam as
+respostas (as faixas são disjuntas e crescentes, então o resultado já sai ordenado).
+
+A comunicação é por Pipe, com mensagens em lote: as versões *_many agrupam as chaves
+por partição, mandam uma mensagem para cada partição e só depois esperam as
+respostas, de forma que os trabalhadores processam em paralelo. Uma chamada pontual
+custa uma ida e volta no pipe; quem quer vazão deve usar os lotes.
+
+Quando uma partição passa de fator_desequilibrio vezes o tamanho médio, os limites
+são recalculados com select nas partições (cada novo limite é a chave de posição
+k * n / trabalhadores na ordem global) e as chaves migram entre vizinhas com
+dividir/juntar.
+"""
+
+import multiprocessing
+from bisect import bisect_right
+
+from atividade_5 import ArvoreAVL
+
+
+# ===============================================================
+# LADO DO TRABALHADOR
+# ===============================================================
+
+def _inserir_lote(arvore, chaves):
+    """Insere as chaves ignorando as que já existem; retorna quantas eram novas."""
+    novas = 0
+    for chave in chaves:
+        try:
+            arvore.inserir(chave)
+            novas += 1
+        except ValueError:
+            pass
+    return novas
+
+
+def _deletar_lote(arvore, chaves):
+    """Remove as chaves (as ausentes são ignoradas); retorna quantas existiam."""
+    antes = len(arvore)
+    for chave in chaves:
+        arvore.deletar(chave)
+    return antes - len(arvore)
+
+
+def _profundidade_lote(arvore, chaves):
+    return [arvore.obter_profundidade_no(chave) for chave in chaves]
+
+
+def _extrair_maiores(arvore, chave):
+    """Tira da árvore as chaves >= chave e as retorna em ordem."""
+    menores, encontrada, maiores = arvore.dividir(chave)
+    arvore.raiz = menores.raiz
+    return ([chave] if encontrada else []) + maiores.percurso_em_ordem()
+
+
+def _extrair_menores(arvore, chave):
+    """Tira da árvore as chaves < chave e as retorna em ordem."""
+    menores, encontrada, maiores = arvore.dividir(chave)
+    if encontrada:
+        maiores = ArvoreAVL.juntar(ArvoreAVL(), chave, maiores)
+    arvore.raiz = maiores.raiz
+    return menores.percurso_em_ordem()
+
+
+def _anexar(arvore, chaves):
+    """
+    Junta chaves ordenadas que ficam inteiramente antes ou depois das chaves da árvore
+    (as que chegam de uma partição vizinha), em O(m + log n) com juntar.
+    """
+    if not chaves:
+        return 0
+    if arvore.raiz is None:
+        arvore.raiz = ArvoreAVL.from_iterable(chaves, presorted=True).raiz
+    elif chaves[-1] < arvore.select(0):
+        arvore.raiz = ArvoreAVL.juntar(ArvoreAVL.from_iterable(chaves[:-1], presorted=True),
+                                       chaves[-1], arvore).raiz
+    else:
+        arvore.raiz = ArvoreAVL.juntar(arvore, chaves[0],
+                                       ArvoreAVL.from_iterable(chaves[1:], presorted=True)).raiz
+    return len(chaves)
+
+
+def _carregar(arvore, chaves):
+    arvore.raiz = ArvoreAVL.from_iterable(chaves, presorted=True).raiz
+    return len(chaves)
+
+
+_OPERACOES_LOCAIS = {
+    "inserir_lote": _inserir_lote,
+    "deletar_lote": _deletar_lote,
+    "profundidade_lote": _profundidade_lote,
+    "extrair_maiores": _extrair_maiores,
+    "extrair_menores": _extrair_menores,
+    "anexar": _anexar,
+    "carregar": _carregar,
+}
+
+
+def _trabalhador(conexao):
+    """
+    Laço de um processo trabalhador. Cada mensagem é uma lista de (operação, argumentos);
+    a resposta é a lista dos resultados na mesma ordem, com a exceção no lugar do
+    resultado quando uma operação falha. None encerra o processo.
+    """
+    arvore = ArvoreAVL()
+    while True:
+        mensagem = conexao.recv()
+        if mensagem is None:
+            break
+        respostas = []
+        for operacao, argumentos in mensagem:
+            funcao = _OPERACOES_LOCAIS.get(operacao)
+            try:
+                if funcao is not None:
+                    respostas.append(funcao(arvore, *argumentos))
+                else:
+                    respostas.append(getattr(arvore, operacao)(*argumentos))
+            except Exception as erro:  # volta para a fachada, que decide se relança
+                respostas.append(erro)
+        conexao.send(respostas)
+    conexao.close()
+
+
+# ===============================================================
+# FACHADA
+# ===============================================================
+
+class ArvoreAVLParticionada:
+    """
+    Conjunto de chaves distribuído entre 'trabalhadores' processos por faixas de chave.
+    Sem limites, todas as chaves começam na primeira partição e os limites são
+    definidos no primeiro rebalanceamento (quando houver minimo_rebalanceamento chaves).
+    Use como gerenciador de contexto ou chame close() para encerrar os processos.
+    """
+    def __init__(self, trabalhadores=4, limites=None, fator_desequilibrio=1.5, minimo_rebalanceamento=1024):
+        if trabalhadores < 1:
+            raise ValueError(f"É preciso ao menos um trabalhador: {trabalhadores}")
+        limites = list(limites) if limites is not None else []
+        if len(limites) > trabalhadores - 1 or any(a >= b for a, b in zip(limites, limites[1:])):
+            raise ValueError(f"Limites devem ser crescentes e no máximo {trabalhadores - 1}: {limites}")
+        self.trabalhadores = trabalhadores
+        self.fator_desequilibrio = fator_desequilibrio
+        self.minimo_rebalanceamento = minimo_rebalanceamento
+        # partições além de len(limites) ficam vazias até o primeiro rebalanceamento
+        self._limites = limites
+        self._tamanhos = [0] * trabalhadores
+        self.rebalanceamentos = 0
+        self._conexoes = []
+        self._processos = []
+        for _ in range(trabalhadores):
+            local, remota = multiprocessing.Pipe()
+            processo = multiprocessing.Process(target=_trabalhador, args=(remota,), daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    @classmethod
+    def from_iterable(cls, chaves, trabalhadores=4, presorted=False, **opcoes):
+        """
+        Distribui as chaves em partições de tamanhos iguais, cada uma construída com
+        ArvoreAVL.from_iterable no seu processo. Chaves duplicadas geram ValueError.
+        """
+        chaves = list(chaves) if presorted else sorted(chaves)
+        for anterior, chave in zip(chaves, chaves[1:]):
+            if not anterior < chave:
+                raise ValueError(f"Chave duplicada ou fora de ordem: {anterior}, {chave}")
+        cortes = [len(chaves) * i // trabalhadores for i in range(trabalhadores + 1)]
+        limites = [chaves[corte] for corte in cortes[1:-1] if corte < len(chaves)]
+        if len(set(limites)) != len(limites):
+            limites = []  # poucas chaves para todas as partições: fica tudo na primeira
+            cortes = [0] + [len(chaves)] * trabalhadores
+        arvore = cls(trabalhadores, limites, **opcoes)
+        arvore._executar({i: [("carregar", (chaves[cortes[i]:cortes[i + 1]],))]
+                          for i in range(trabalhadores) if cortes[i] < cortes[i + 1]})
+        arvore._tamanhos = [cortes[i + 1] - cortes[i] for i in range(trabalhadores)]
+        return arvore
+
+    def close(self):
+        """Encerra os processos trabalhadores."""
+        for conexao in self._conexoes:
+            try:
+                conexao.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conexao.close()
+        for processo in self._processos:
+            processo.join()
+        self._conexoes = []
+        self._processos = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.close()
+
+    def __len__(self):
+        return sum(self._tamanhos)
+
+    @property
+    def limites(self):
+        return list(self._limites)
+
+    def tamanhos(self):
+        """Número de chaves de cada partição."""
+        return list(self._tamanhos)
+
+    # ===============================================================
+    # COMUNICAÇÃO
+    # ===============================================================
+
+    def _particao(self, chave):
+        return bisect_right(self._limites, chave)
+
+    def _executar(self, pedidos):
+        """
+        Manda {partição: [(operação, argumentos), ...]} para todas as partições antes de
+        esperar qualquer resposta; retorna {partição: [resultados]}.
+        """
+        for indice, mensagem in pedidos.items():
+            self._conexoes[indice].send(mensagem)
+        return {indice: self._conexoes[indice].recv() for indice in pedidos}
+
+    def _chamar(self, indice, operacao, *argumentos):
+        """Uma operação numa partição; relança a exceção do trabalhador, se houver."""
+        resultado = self._executar({indice: [(operacao, argumentos)]})[indice][0]
+        if isinstance(resultado, Exception):
+            raise resultado
+        return resultado
+
+    def _contabilizar(self, respostas, sinal):
+        """
+        Aplica aos tamanhos das partições o resultado de inserir_lote (sinal=1) ou
+        deletar_lote (sinal=-1) e retorna o total. Uma partição que falhou pode ter
+        aplicado parte do lote, então o tamanho dela é consultado de novo antes de
+        relançar a exceção do trabalhador.
+        """
+        total = 0
+        falhas = {}
+        for indice, (resultado,) in respostas.items():
+            if isinstance(resultado, Exception):
+                falhas[indice] = resultado
+            else:
+                self._tamanhos[indice] += sinal * resultado
+                total += resultado
+        if falhas:
+            for indice, (tamanho,) in self._executar({i: [("__len__", ())] for i in falhas}).items():
+                self._tamanhos[indice] = tamanho
+            raise next(iter(falhas.values()))
+        return total
+
+    @staticmethod
+    def _relancar(respostas):
+        """Relança a primeira exceção de trabalhador entre as respostas de uma consulta."""
+        for resultados in respostas.values():
+            for resultado in resultados:
+                if isinstance(resultado, Exception):
+                    raise resultado
+
+    def _agrupar(self, chaves):
+        """{partição: (posições na entrada, chaves)} para as chaves dadas."""
+        grupos = {}
+        for posicao, chave in enumerate(chaves):
+            posicoes, doparticao = grupos.setdefault(self._particao(chave), ([], []))
+            posicoes.append(posicao)
+            doparticao.append(chave)
+        return grupos
+
+    # ===============================================================
+    # OPERAÇÕES PONTUAIS
+    # ===============================================================
+
+    def inserir(self, chave):
+        """Insere a chave na sua partição (chave duplicada gera ValueError, como em ArvoreAVL)."""
+        indice = self._particao(chave)
+        self._chamar(indice, "inserir", chave)
+        self._tamanhos[indice] += 1
+        self._verificar_desequilibrio()
+
+    def deletar(self, chave):
+        """Remove a chave, se existir."""
+        indice = self._particao(chave)
+        self._tamanhos[indice] -= self._chamar(indice, "deletar_lote", [chave])
+        self._verificar_desequilibrio()
+
+    def obter_profundidade_no(self, chave):
+        """Profundidade da chave dentro da árvore da sua partição (-1 se não existir)."""
+        return self._chamar(self._particao(chave), "obter_profundidade_no", chave)
+
+    def __contains__(self, chave):
+        return self.obter_profundidade_no(chave) != -1
+
+    # ===============================================================
+    # OPERAÇÕES EM LOTE
+    # ===============================================================
+
+    def inserir_many(self, chaves):
+        """Insere as chaves em paralelo nas partições, ignorando duplicatas; retorna quantas eram novas."""
+        grupos = self._agrupar(chaves)
+        respostas = self._executar({i: [("inserir_lote", (doparticao,))] for i, (_, doparticao) in grupos.items()})
+        novas = self._contabilizar(respostas, 1)
+        self._verificar_desequilibrio()
+        return novas
+
+    def deletar_many(self, chaves):
+        """Remove as chaves em paralelo nas partições; retorna quantas existiam."""
+        grupos = self._agrupar(chaves)
+        respostas = self._executar({i: [("deletar_lote", (doparticao,))] for i, (_, doparticao) in grupos.items()})
+        removidas = self._contabilizar(respostas, -1)
+        self._verificar_desequilibrio()
+        return removidas
+
+    def profundidade_many(self, chaves):
+        """obter_profundidade_no de cada chave, na ordem da entrada, consultando as partições em paralelo."""
+        chaves = list(chaves)
+        grupos = self._agrupar(chaves)
+        respostas = self._executar({i: [("profundidade_lote", (doparticao,))]
+                                    for i, (_, doparticao) in grupos.items()})
+        self._relancar(respostas)
+        resultado = [-1] * len(chaves)
+        for indice, (profundidades,) in respostas.items():
+            for posicao, profundidade in zip(grupos[indice][0], profundidades):
+                resultado[posicao] = profundidade
+        return resultado
+
+    # ===============================================================
+    # CONSULTAS EM VÁRIAS PARTIÇÕES
+    # ===============================================================
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        """Chaves de [chave1, chave2] em ordem, pedidas ao mesmo tempo às partições que cruzam o intervalo."""
+        if chave1 > chave2:
+            return []
+        envolvidas = range(self._particao(chave1), self._particao(chave2) + 1)
+        respostas = self._executar({i: [("encontrar_nos_intervalo", (chave1, chave2))]
+                                    for i in envolvidas if self._tamanhos[i]})
+        self._relancar(respostas)
+        resultado = []
+        for indice in sorted(respostas):
+            resultado.extend(respostas[indice][0])
+        return resultado
+
+    def percurso_em_ordem(self):
+        respostas = self._executar({i: [("percurso_em_ordem", ())] for i in range(self.trabalhadores)})
+        resultado = []
+        for indice in range(self.trabalhadores):
+            resultado.extend(respostas[indice][0])
+        return resultado
+
+    # ===============================================================
+    # REBALANCEAMENTO DOS LIMITES
+    # ===============================================================
+
+    def _verificar_desequilibrio(self):
+        total = sum(self._tamanhos)
+        if self.trabalhadores > 1 and total >= self.minimo_rebalanceamento and \
+                max(self._tamanhos) > self.fator_desequilibrio * total / self.trabalhadores:
+            self.rebalancear()
+
+    def rebalancear(self):
+        """
+        Recalcula os limites para partições de tamanhos iguais e migra as chaves.
+        Os novos limites saem de select nas partições (uma mensagem por partição);
+        depois uma passada da esquerda para a direita empurra para a vizinha da direita
+        as chaves que passaram do limite, e uma passada no sentido contrário faz o mesmo
+        para a esquerda. Cada migração é um dividir na origem e um juntar no destino.
+        """
+        total = sum(self._tamanhos)
+        if self.trabalhadores == 1 or total < self.trabalhadores:
+            return
+        # posição global k * total / trabalhadores -> (partição, posição dentro dela)
+        pedidos = {}
+        acumulado, indice = 0, 0
+        for k in range(1, self.trabalhadores):
+            posicao = total * k // self.trabalhadores
+            while posicao >= acumulado + self._tamanhos[indice]:
+                acumulado += self._tamanhos[indice]
+                indice += 1
+            pedidos.setdefault(indice, []).append(("select", (posicao - acumulado,)))
+        respostas = self._executar(pedidos)
+        novos = [limite for indice in sorted(respostas) for limite in respostas[indice]]
+        antigos = self._limites
+
+        for k in range(self.trabalhadores - 1):
+            # limites que ainda não existiam valem +infinito (partições vazias à direita)
+            if k >= len(antigos) or novos[k] < antigos[k]:
+                self._migrar(k, k + 1, "extrair_maiores", novos[k])
+        for k in range(min(len(antigos), self.trabalhadores - 1) - 1, -1, -1):
+            if novos[k] > antigos[k]:
+                self._migrar(k + 1, k, "extrair_menores", novos[k])
+        self._limites = novos
+        self.rebalanceamentos += 1
+
+    def _migrar(self, origem, destino, operacao, limite):
+        chaves = self._chamar(origem, operacao, limite)
+        if chaves:
+            self._chamar(destino, "anexar", chaves)
+            self._tamanhos[origem] -= len(chaves)
+            self._tamanhos[destino] += len(chaves)
+
+
+if __name__ == "__main__":
+    import random
+
+    with ArvoreAVLParticionada(trabalhadores=4, minimo_rebalanceamento=100) as arvore:
+        arvore.inserir_many(random.sample(range(10_000), 1_000))
+        print("limites:", arvore.limites, "tamanhos:", arvore.tamanhos())
+        print("intervalo [100, 200]:", arvore.encontrar_nos_intervalo(100, 200))
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Árvore AVL persistente (imutável, com cópia de caminho).
+
+inserir e deletar nunca alteram nós existentes: copiam apenas os O(log n) nós do
+caminho raiz-folha (mais os envolvidos nas rotações) e retornam uma nova versão,
+que compartilha todo o resto com a anterior. Assim uma versão antiga continua
+válida para sempre e pode ser lida por outras threads sem nenhuma trava.
+
+ArvoreAVLVersionada é um invólucro mutável para o caso "um escritor, vários
+leitores": o escritor troca a versão atual e os leitores pegam snapshot() em O(1).
+"""
+
+import threading
+from itertools import islice
+
+
+class NoPersistente:
+    """
+    Nó imutável (por convenção): chave, filhos, altura e tamanho da subárvore
+    são definidos na criação e nunca mais mudam.
+    """
+    __slots__ = ("chave", "esquerda", "direita", "altura", "tamanho")
+
+    def __init__(self, chave, esquerda=None, direita=None):
+        self.chave = chave
+        self.esquerda = esquerda
+        self.direita = direita
+        self.altura = 1 + max(_altura(esquerda), _altura(direita))
+        self.tamanho = 1 + _tamanho(esquerda) + _tamanho(direita)
+
+
+def _altura(no):
+    return 0 if no is None else no.altura
+
+
+def _tamanho(no):
+    return 0 if no is None else no.tamanho
+
+
+def _balancear(chave, esquerda, direita):
+    """
+    Cria o nó (chave, esquerda, direita) já balanceado, aplicando as rotações AVL
+    com nós novos em vez de mexer nos filhos.
+    """
+    he, hd = _altura(esquerda), _altura(direita)
+    if he > hd + 1:
+        if _altura(esquerda.esquerda) >= _altura(esquerda.direita):
+            # Left Left: rotação à direita
+            return NoPersistente(esquerda.chave, esquerda.esquerda,
+                                 NoPersistente(chave, esquerda.direita, direita))
+        # Left Right: rotação dupla
+        meio = esquerda.direita
+        return NoPersistente(meio.chave,
+                             NoPersistente(esquerda.chave, esquerda.esquerda, meio.esquerda),
+                             NoPersistente(chave, meio.direita, direita))
+    if hd > he + 1:
+        if _altura(direita.direita) >= _altura(direita.esquerda):
+            # Right Right: rotação à esquerda
+            return NoPersistente(direita.chave,
+                                 NoPersistente(chave, esquerda, direita.esquerda),
+                                 direita.direita)
+        # Right Left: rotação dupla
+        meio = direita.esquerda
+        return NoPersistente(meio.chave,
+                             NoPersistente(chave, esquerda, meio.esquerda),
+                             NoPersistente(direita.chave, meio.direita, direita.direita))
+    return NoPersistente(chave, esquerda, direita)
+
+
+def _reconstruir(caminho, subarvore):
+    """
+    Sobe pelo caminho [(nó, desceu_pela_esquerda), ...] recriando cada ancestral
+    com a subárvore nova no lugar do filho antigo. Retorna a nova raiz.
+    """
+    for no, pela_esquerda in reversed(caminho):
+        if pela_esquerda:
+            subarvore = _balancear(no.chave, subarvore, no.direita)
+        else:
+            subarvore = _balancear(no.chave, no.esquerda, subarvore)
+    return subarvore
+
+
+def _remover_minimo(no):
+    """Retorna (menor chave, subárvore sem ela) copiando só o caminho mais à esquerda."""
+    caminho = []
+    while no.esquerda is not None:
+        caminho.append((no, True))
+        no = no.esquerda
+    return no.chave, _reconstruir(caminho, no.direita)
+
+
+class ArvoreAVLPersistente:
+    """
+    Uma versão imutável da árvore. inserir/deletar retornam uma nova versão e
+    deixam esta intacta; a API de consulta é a mesma de atividade_5.ArvoreAVL.
+    """
+    __slots__ = ("raiz",)
+
+    def __init__(self, raiz=None):
+        self.raiz = raiz
+
+    @classmethod
+    def from_iterable(cls, chaves, presorted=False):
+        """Constrói uma versão balanceada a partir das chaves (duplicadas geram ValueError)."""
+        chaves = list(chaves) if presorted else sorted(chaves)
+        for anterior, chave in zip(chaves, islice(chaves, 1, None)):
+            if not anterior < chave:
+                raise ValueError(f"Chave duplicada ou fora de ordem: {chave}")
+
+        def construir(inicio, fim):
+            if inicio >= fim:
+                return None
+            meio = (inicio + fim) // 2
+            return NoPersistente(chaves[meio], construir(inicio, meio), construir(meio + 1, fim))
+
+        return cls(construir(0, len(chaves)))
+
+    def __len__(self):
+        return _tamanho(self.raiz)
+
+    def __contains__(self, chave):
+        return self.obter_profundidade_no(chave) != -1
+
+    def __iter__(self):
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            no = pilha.pop()
+            yield no.chave
+            atual = no.direita
+
+    # ===============================================================
+    # ATUALIZAÇÕES (retornam uma nova versão)
+    # ===============================================================
+
+    def inserir(self, chave):
+        """Retorna uma nova versão com a chave; chaves duplicadas geram ValueError."""
+        caminho = []
+        atual = self.raiz
+        while atual is not None:
+            if chave < atual.chave:
+                caminho.append((atual, True))
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                caminho.append((atual, False))
+                atual = atual.direita
+            else:
+                raise ValueError(f"Chave duplicada: {chave}")
+        return ArvoreAVLPersistente(_reconstruir(caminho, NoPersistente(chave)))
+
+    def deletar(self, chave):
+        """Retorna uma nova versão sem a chave (ou esta mesma, se ela não existir)."""
+        caminho = []
+        atual = self.raiz
+        while atual is not None:
+            if chave < atual.chave:
+                caminho.append((atual, True))
+                atual = atual.esquerda
+            elif chave > atual.chave:
+                caminho.append((atual, False))
+                atual = atual.direita
+            else:
+                break
+        if atual is None:
+            return self
+
+        if atual.esquerda is None:
+            substituto = atual.direita
+        elif atual.direita is None:
+            substituto = atual.esquerda
+        else:
+            # dois filhos: o sucessor sobe para o lugar do nó removido
+            sucessor, direita = _remover_minimo(atual.direita)
+            substituto = _balancear(sucessor, atual.esquerda, direita)
+        return ArvoreAVLPersistente(_reconstruir(caminho, substituto))
+
+    # ===============================================================
+    # CONSULTAS
+    # ===============================================================
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        """Retorna, em ordem, as chaves no intervalo [chave1, chave2]."""
+        resultado = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda if atual.chave > chave1 else None
+            no = pilha.pop()
+            if no.chave > chave2:
+                break
+            if no.chave >= chave1:
+                resultado.append(no.chave)
+            atual = no.direita
+        return resultado
+
+    def obter_profundidade_no(self, chave):
+        """Profundidade (raiz = 0) do nó com a chave, ou -1 se não existir."""
+        nivel = 0
+        atual = self.raiz
+        while atual is not None:
+            if chave == atual.chave:
+                return nivel
+            elif chave < atual.chave:
+                atual = atual.esquerda
+            else:
+                atual = atual.direita
+            nivel += 1
+        return -1
+
+    def percurso_em_ordem(self):
+        """Retorna lista das chaves em ordem (in-order)."""
+        return list(self)
+
+
+class ArvoreAVLVersionada:
+    """
+    Referência mutável para a versão atual de uma ArvoreAVLPersistente.
+    As escritas são serializadas entre si por uma trava; as leituras não usam
+    trava nenhuma: snapshot() só lê a referência da versão atual.
+    """
+    def __init__(self, versao=None):
+        self._versao = versao if versao is not None else ArvoreAVLPersistente()
+        self._escrita = threading.Lock()
+
+    def snapshot(self):
+        """Retorna a versão atual em O(1); ela nunca muda, mesmo com escritas depois."""
+        return self._versao
+
+    def inserir(self, chave):
+        with self._escrita:
+            self._versao = self._versao.inserir(chave)
+
+    def deletar(self, chave):
+        with self._escrita:
+            self._versao = self._versao.deletar(chave)
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        return self._versao.encontrar_nos_intervalo(chave1, chave2)
+
+    def obter_profundidade_no(self, chave):
+        return self._versao.obter_profundidade_no(chave)
+
+    def percurso_em_ordem(self):
+        return self._versao.percurso_em_ordem()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+ArvoreAVL durável: log de operações (write-ahead log) mais checkpoints.
+
+Cada inserir/deletar aplicado na árvore vira um registro de tamanho fixo no arquivo
+wal.log da pasta. Os registros ficam num buffer e são gravados juntos ("group
+commit"); quando o fsync acontece depende da política:
+
+    "sempre"     grava e faz fsync a cada operação (nada se perde)
+    "lote"       grava e faz fsync a cada tamanho_lote operações ou em sincronizar()
+    "intervalo"  como "lote", mas também faz fsync se já passaram intervalo_fsync
+                 segundos desde o último
+    "nunca"      grava a cada tamanho_lote operações e deixa o fsync para o sistema
+
+checkpoint() grava a árvore inteira com o formato de snapshot_binario em
+checkpoint.bin (num arquivo temporário trocado atomicamente) e depois zera o log;
+com checkpoint_a_cada ele roda sozinho depois desse número de operações.
+
+Na abertura a árvore é recuperada carregando o último checkpoint e reaplicando o
+log. O replay é idempotente (inserir de chave presente e deletar de chave ausente
+são ignorados), então um crash entre a troca do checkpoint e o truncamento do log
+não corrompe nada. Registros incompletos ou com CRC inválido no fim do log (escrita
+interrompida) são descartados.
+"""
+
+import os
+import struct
+import time
+import zlib
+
+from atividade_5 import ArvoreAVL
+
+MAGIC = b"AVLW"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sI")
+CORPO = struct.Struct("<cc8s")  # operação, typecode da chave, chave
+REGISTRO = struct.Struct("<cc8sI")  # corpo + crc32 do corpo
+_VALOR = {b"q": struct.Struct("<q"), b"d": struct.Struct("<d")}
+INSERIR = b"+"
+DELETAR = b"-"
+POLITICAS = ("sempre", "lote", "intervalo", "nunca")
+
+
+def _fsync_pasta(pasta):
+    """Garante que a troca de nomes dentro da pasta também foi para o disco."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(pasta, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _codificar(operacao, chave):
+    tipo = b"d" if isinstance(chave, float) else b"q"
+    try:
+        corpo = CORPO.pack(operacao, tipo, _VALOR[tipo].pack(chave))
+    except struct.error:
+        raise ValueError(f"Chave não cabe no registro do log: {chave!r}") from None
+    return corpo + zlib.crc32(corpo).to_bytes(4, "little")
+
+
+def ler_registros(dados):
+    """
+    Decodifica os registros válidos de um log lido para a memória.
+    Retorna (lista de (operação, chave), bytes válidos); a leitura para no primeiro
+    registro truncado ou com CRC inválido.
+    """
+    if len(dados) < CABECALHO.size:
+        return [], 0
+    magic, versao = CABECALHO.unpack_from(dados, 0)
+    if magic != MAGIC or versao != VERSAO:
+        raise ValueError("Arquivo não é um log de ArvoreAVL compatível")
+    registros = []
+    visao = memoryview(dados)
+    fim = CABECALHO.size + (len(dados) - CABECALHO.size) // REGISTRO.size * REGISTRO.size
+    validos = CABECALHO.size
+    for operacao, tipo, valor, crc in REGISTRO.iter_unpack(visao[CABECALHO.size:fim]):
+        if zlib.crc32(visao[validos:validos + CORPO.size]) != crc or tipo not in _VALOR:
+            break
+        registros.append((operacao, _VALOR[tipo].unpack(valor)[0]))
+        validos += REGISTRO.size
+    return registros, validos
+
+
+class ArvoreAVLDuravel:
+    """
+    ArvoreAVL cujas mutações sobrevivem a reinícios. pasta guarda checkpoint.bin e
+    wal.log; se já existirem, a árvore é recuperada deles na criação. As chaves
+    precisam ser todas inteiros de 64 bits ou todas floats (as mesmas do snapshot
+    binário).
+    """
+    def __init__(self, pasta, politica_fsync="lote", tamanho_lote=64,
+                 intervalo_fsync=0.05, checkpoint_a_cada=None):
+        if politica_fsync not in POLITICAS:
+            raise ValueError(f"Política de fsync desconhecida: {politica_fsync!r} (use uma de {POLITICAS})")
+        os.makedirs(pasta, exist_ok=True)
+        self.pasta = pasta
+        self.politica_fsync = politica_fsync
+        self.tamanho_lote = 1 if politica_fsync == "sempre" else max(1, tamanho_lote)
+        self.intervalo_fsync = intervalo_fsync
+        self.checkpoint_a_cada = checkpoint_a_cada
+        self._caminho_checkpoint = os.path.join(pasta, "checkpoint.bin")
+        self._caminho_log = os.path.join(pasta, "wal.log")
+        self._buffer = bytearray()
+        self._pendentes = 0
+        self._desde_checkpoint = 0
+        self._ultimo_fsync = time.monotonic()
+        self.registros_recuperados = 0
+        self.arvore = self._recuperar()
+        self._log = open(self._caminho_log, "r+b" if os.path.exists(self._caminho_log) else "w+b")
+        self._log.seek(0, os.SEEK_END)
+        if self._log.tell() == 0:
+            self._log.write(CABECALHO.pack(MAGIC, VERSAO))
+            self._sincronizar_arquivo(True)
+
+    # ===============================================================
+    # RECUPERAÇÃO
+    # ===============================================================
+
+    def _recuperar(self):
+        """Carrega o último checkpoint e reaplica o log em cima dele."""
+        if os.path.exists(self._caminho_checkpoint):
+            arvore = ArvoreAVL.carregar(self._caminho_checkpoint)
+        else:
+            arvore = ArvoreAVL()
+        if not os.path.exists(self._caminho_log):
+            return arvore
+        with open(self._caminho_log, "rb") as f:
+            dados = f.read()
+        registros, validos = ler_registros(dados)
+        for operacao, chave in registros:
+            if operacao == INSERIR:
+                try:
+                    arvore.inserir(chave)
+                except ValueError:  # já estava no checkpoint
+                    pass
+            else:
+                arvore.deletar(chave)
+        if validos < len(dados):
+            # descarta o final rasgado para os próximos registros ficarem legíveis
+            with open(self._caminho_log, "r+b") as f:
+                f.truncate(validos)
+        self.registros_recuperados = len(registros)
+        self._desde_checkpoint = len(registros)
+        return arvore
+
+    # ===============================================================
+    # MUTAÇÕES
+    # ===============================================================
+
+    def inserir(self, chave):
+        """
+        Insere na árvore e registra no log; chaves duplicadas geram ValueError. Uma
+        chave float numa árvore de inteiros (ou o contrário) gera TypeError antes de
+        tocar a árvore e o log, porque o checkpoint só grava um tipo de chave.
+        """
+        registro = _codificar(INSERIR, chave)
+        raiz = self.arvore.raiz
+        if raiz is not None and isinstance(raiz.chave, float) != isinstance(chave, float):
+            raise TypeError(f"Chave {chave!r} mistura int e float com as da árvore; "
+                            "o checkpoint guarda um único tipo")
+        self.arvore.inserir(chave)
+        self._registrar(registro)
+
+    def deletar(self, chave):
+        """Remove a chave (se existir) e registra no log."""
+        registro = _codificar(DELETAR, chave)
+        self.arvore.deletar(chave)
+        self._registrar(registro)
+
+    def _registrar(self, registro):
+        self._buffer += registro
+        self._pendentes += 1
+        self._desde_checkpoint += 1
+        if self._pendentes >= self.tamanho_lote:
+            self._gravar(self.politica_fsync != "nunca")
+        elif (self.politica_fsync == "intervalo"
+              and time.monotonic() - self._ultimo_fsync >= self.intervalo_fsync):
+            self._gravar(True)
+        if self.checkpoint_a_cada is not None and self._desde_checkpoint >= self.checkpoint_a_cada:
+            self.checkpoint()
+
+    def _gravar(self, fsync):
+        """Escreve o buffer inteiro no log de uma vez (group commit)."""
+        if self._buffer:
+            self._log.write(self._buffer)
+            self._buffer.clear()
+            self._pendentes = 0
+        self._sincronizar_arquivo(fsync)
+
+    def _sincronizar_arquivo(self, fsync):
+        self._log.flush()
+        if fsync:
+            os.fsync(self._log.fileno())
+            self._ultimo_fsync = time.monotonic()
+
+    def sincronizar(self):
+        """Grava as operações pendentes e faz fsync, qualquer que seja a política."""
+        self._gravar(True)
+
+    def checkpoint(self):
+        """Grava a árvore inteira em checkpoint.bin e zera o log."""
+        self.sincronizar()
+        temporario = self._caminho_checkpoint + ".tmp"
+        self.arvore.salvar(temporario)
+        with open(temporario, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(temporario, self._caminho_checkpoint)
+        _fsync_pasta(self.pasta)
+        # um crash aqui só faz o replay repetir operações já no checkpoint
+        self._log.seek(CABECALHO.size)
+        self._log.truncate()
+        self._sincronizar_arquivo(True)
+        self._desde_checkpoint = 0
+
+    def close(self):
+        if not self._log.closed:
+            self.sincronizar()
+            self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.close()
+
+    # ===============================================================
+    # CONSULTAS (direto na árvore em memória)
+    # ===============================================================
+
+    def __len__(self):
+        return len(self.arvore)
+
+    def obter_profundidade_no(self, chave):
+        return self.arvore.obter_profundidade_no(chave)
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        return self.arvore.encontrar_nos_intervalo(chave1, chave2)
+
+    def percurso_em_ordem(self):
+        return self.arvore.percurso_em_ordem()
@@ -0,0 +1,23 @@
+"""
+Benchmarks das estruturas do repositório.
+A suíte unificada (todas as árvores, saída JSON e comparação com baseline) roda com
+python -m benchmarks; cada módulo específico roda sozinho a partir da raiz do
+projeto: python -m benchmarks.<modulo>
+"""
+
+import sys
+import time
+
+
+def cronometrar(funcao, *args, **kwargs):
+    """Executa funcao uma vez e retorna (segundos, resultado)."""
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return time.perf_counter() - inicio, resultado
+
+
+def tamanhos_da_linha_de_comando(padrao):
+    """Lê os tamanhos (n) passados em sys.argv; sem argumentos usa o padrão."""
+    if len(sys.argv) > 1:
+        return [int(float(arg)) for arg in sys.argv[1:]]
+    return list(padrao)
@@ -0,0 +1,76 @@
+"""
+Linha de comando da suíte unificada (benchmarks/suite.py).
+
+Exemplos (a partir da raiz do projeto):
+    python -m benchmarks                                  # n = 10^4, todas as árvores
+    python -m benchmarks -n 1000 100000 --semente 7 --json resultado.json
+    python -m benchmarks --implementacoes ArvoreAVL ArvoreB(64) --cargas aleatoria zipf
+    python -m benchmarks --json novo.json --baseline antigo.json --limite 0.15
+
+Com --baseline o processo termina com código 1 se alguma linha ficar mais lenta que
+o baseline além do limite. Os benchmarks específicos continuam em
+python -m benchmarks.<modulo>.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.suite import CARGAS, IMPLEMENTACOES, comparar, executar
+
+
+def _argumentos(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Suíte de benchmarks das árvores do repositório.")
+    parser.add_argument("-n", "--tamanhos", nargs="+", type=lambda texto: int(float(texto)), default=[10**4],
+                        help="número de chaves de cada execução (aceita 1e5)")
+    parser.add_argument("--semente", type=int, default=0, help="semente das cargas aleatórias")
+    parser.add_argument("--implementacoes", nargs="+", choices=[imp.nome for imp in IMPLEMENTACOES],
+                        help="árvores a medir (padrão: todas)")
+    parser.add_argument("--cargas", nargs="+", choices=CARGAS, default=list(CARGAS),
+                        help="ordens de inserção (padrão: todas)")
+    parser.add_argument("--json", metavar="ARQUIVO", help="grava os resultados neste arquivo JSON")
+    parser.add_argument("--baseline", metavar="ARQUIVO", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--limite", type=float, default=0.2,
+                        help="queda de ops/s tolerada em relação ao baseline (padrão: 0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def _imprimir(resultado):
+    print(f"{'implementação':<20} | {'carga':<9} | {'fase':<9} | {'n':>7} | {'ops/s':>11} | "
+          f"{'p50 (µs)':>9} | {'p99 (µs)':>9} | {'pico (MB)':>9}")
+    for linha in resultado["resultados"]:
+        print(f"{linha['implementacao']:<20} | {linha['carga']:<9} | {linha['fase']:<9} | {linha['n']:>7} | "
+              f"{linha['ops_por_segundo']:>11.0f} | {linha['p50'] * 1e6:>9.2f} | {linha['p99'] * 1e6:>9.2f} | "
+              f"{linha['pico_memoria'] / 2**20:>9.2f}")
+    for pulado in resultado["pulados"]:
+        print(f"pulado: {pulado['implementacao']} / {pulado['carga']} / n={pulado['n']} "
+              "(árvore sem balanceamento com entrada ordenada)")
+
+
+def main(argv=None):
+    args = _argumentos(argv)
+    resultado = executar(args.tamanhos, args.semente, args.implementacoes, args.cargas,
+                         progresso=lambda texto: print(f"... {texto}", file=sys.stderr))
+    _imprimir(resultado)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2)
+        print(f"resultados gravados em {args.json}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressoes = comparar(resultado, baseline, args.limite)
+        if regressoes:
+            print(f"\n{len(regressoes)} regressão(ões) acima de {args.limite:.0%} em relação a {args.baseline}:")
+            for linha in regressoes:
+                print(f"  {linha['implementacao']} / {linha['carga']} / {linha['fase']} / n={linha['n']}: "
+                      f"{linha['ops_por_segundo_baseline']:.0f} -> {linha['ops_por_segundo']:.0f} ops/s "
+                      f"({linha['razao']:.0%} do baseline)")
+            return 1
+        print(f"\nsem regressões acima de {args.limite:.0%} em relação a {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
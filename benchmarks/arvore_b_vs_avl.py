@@ -0,0 +1,68 @@
+"""
+ArvoreB (várias ordens) contra ArvoreAVL e BinarySearchTree: inserções, buscas,
+consultas por intervalo e remoções com as mesmas chaves aleatórias.
+Uso: python -m benchmarks.arvore_b_vs_avl [n1 n2 ...]   (padrão: 10^4 10^5 10^6)
+"""
+
+import random
+
+from arvore_b import ArvoreB
+from atividade_2 import BinarySearchTree
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+CONSULTAS = 100_000
+INTERVALOS = 1_000
+LARGURA_INTERVALO = 1_000  # em chaves, aproximadamente
+
+
+def estruturas():
+    """(nome, construtor, inserir, deletar, profundidade, intervalo) de cada estrutura."""
+    yield ("ArvoreAVL", ArvoreAVL, ArvoreAVL.inserir, ArvoreAVL.deletar,
+           ArvoreAVL.obter_profundidade_no, ArvoreAVL.encontrar_nos_intervalo)
+    yield ("BinarySearchTree", BinarySearchTree, BinarySearchTree.insert, BinarySearchTree.delete,
+           BinarySearchTree.depth, None)
+    for ordem in (16, 64, 256):
+        yield (f"ArvoreB({ordem})", lambda ordem=ordem: ArvoreB(ordem), ArvoreB.inserir,
+               ArvoreB.deletar, ArvoreB.obter_profundidade_no, ArvoreB.encontrar_nos_intervalo)
+
+
+def main():
+    for n in tamanhos_da_linha_de_comando([10**4, 10**5, 10**6]):
+        chaves = random.sample(range(n * 10), n)
+        consultas = [random.choice(chaves) if i % 2 else random.randrange(n * 10)
+                     for i in range(CONSULTAS)]
+        inicios = [random.randrange(n * 10) for _ in range(INTERVALOS)]
+        print(f"n={n}  ({CONSULTAS} buscas, {INTERVALOS} intervalos de ~{LARGURA_INTERVALO} chaves)")
+        print(f"{'estrutura':<16} | {'inserir (s)':>11} | {'buscas (s)':>10} | {'intervalos (s)':>14} | {'deletar (s)':>11}")
+        esperado = None
+        for nome, construtor, inserir, deletar, profundidade, intervalo in estruturas():
+            arvore = construtor()
+
+            def inserir_todas():
+                for chave in chaves:
+                    inserir(arvore, chave)
+
+            def buscar_todas():
+                return [profundidade(arvore, c) != -1 for c in consultas]
+
+            def varrer():
+                return sum(len(intervalo(arvore, a, a + LARGURA_INTERVALO * 10)) for a in inicios)
+
+            def deletar_todas():
+                for chave in chaves:
+                    deletar(arvore, chave)
+
+            t_inserir, _ = cronometrar(inserir_todas)
+            t_buscas, encontrados = cronometrar(buscar_todas)
+            if esperado is None:
+                esperado = encontrados
+            assert encontrados == esperado
+            texto_intervalo = f"{cronometrar(varrer)[0]:>14.3f}" if intervalo else f"{'-':>14}"
+            t_deletar, _ = cronometrar(deletar_todas)
+            print(f"{nome:<16} | {t_inserir:>11.3f} | {t_buscas:>10.3f} | {texto_intervalo} | {t_deletar:>11.3f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Avaliação de árvores de expressão: recursiva (avaliar) x compilada x compilada com
+hash-consing das subárvores repetidas.
+As árvores têm 2^profundidade folhas montadas a partir de poucas "formas" por nível,
+então há muitas subárvores estruturalmente iguais (mas com objetos No distintos).
+Só + e - são usados para os valores não explodirem nem dividirem por zero.
+Uso: python -m benchmarks.avaliacao_expressoes [profundidade]   (padrão: 14)
+"""
+
+import random
+import sys
+import time
+
+from atividade_1 import No, avaliar, compilar
+from benchmarks import cronometrar
+
+FORMAS_POR_NIVEL = 4
+REPETICOES = 20
+
+
+def gerar_formas(profundidade, rng):
+    """formas[k][i] descreve a i-ésima subárvore de altura k por índices do nível k-1."""
+    formas = [[str(rng.randint(1, 9)) for _ in range(FORMAS_POR_NIVEL)]]
+    for _ in range(profundidade):
+        formas.append([(rng.choice("+-"), rng.randrange(FORMAS_POR_NIVEL), rng.randrange(FORMAS_POR_NIVEL))
+                       for _ in range(FORMAS_POR_NIVEL)])
+    return formas
+
+
+def construir(formas, nivel, indice):
+    """Cria objetos No novos para cada ocorrência (nada é compartilhado por referência)."""
+    if nivel == 0:
+        return No(formas[0][indice])
+    operador, a, b = formas[nivel][indice]
+    return No(operador, construir(formas, nivel - 1, a), construir(formas, nivel - 1, b))
+
+
+def por_avaliacao(funcao):
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        resultado = funcao()
+    return (time.perf_counter() - inicio) / REPETICOES, resultado
+
+
+def main():
+    profundidade = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    formas = gerar_formas(profundidade, random.Random(profundidade))
+    raiz = construir(formas, profundidade, 0)
+    print(f"profundidade {profundidade}: {2 ** (profundidade + 1) - 1} nós")
+
+    t_rec, esperado = por_avaliacao(lambda: avaliar(raiz))
+    t_comp, compilada = cronometrar(compilar, raiz, memoizar=False)
+    t_memo_comp, memoizada = cronometrar(compilar, raiz, memoizar=True)
+    t_exec, v1 = por_avaliacao(compilada)
+    t_exec_memo, v2 = por_avaliacao(memoizada)
+    assert esperado == v1 == v2
+
+    print(f"{'modo':<22} | {'compilação (ms)':>15} | {'instruções':>10} | {'por avaliação (ms)':>18}")
+    print(f"{'recursiva':<22} | {'-':>15} | {'-':>10} | {t_rec * 1e3:>18.3f}")
+    print(f"{'compilada':<22} | {t_comp * 1e3:>15.1f} | {len(compilada.instrucoes):>10} | {t_exec * 1e3:>18.3f}")
+    print(f"{'compilada + memo':<22} | {t_memo_comp * 1e3:>15.1f} | {len(memoizada.instrucoes):>10} | {t_exec_memo * 1e3:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Compara ArvoreAVL.from_iterable com inserções repetidas via inserir.
+Uso: python -m benchmarks.carga_em_lote [n1 n2 ...]   (padrão: 10^4 10^5 10^6)
+"""
+
+import random
+
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+
+def inserir_um_a_um(chaves):
+    arvore = ArvoreAVL()
+    for chave in chaves:
+        arvore.inserir(chave)
+    return arvore
+
+
+def main():
+    print(f"{'n':>9} | {'inserir (s)':>11} | {'from_iterable (s)':>17} | {'presorted (s)':>13} | {'ganho':>6}")
+    for n in tamanhos_da_linha_de_comando([10**4, 10**5, 10**6]):
+        chaves = random.sample(range(n * 10), n)
+        t_inserir, a = cronometrar(inserir_um_a_um, chaves)
+        t_lote, b = cronometrar(ArvoreAVL.from_iterable, chaves)
+        ordenadas = sorted(chaves)
+        t_ordenado, _ = cronometrar(ArvoreAVL.from_iterable, ordenadas, presorted=True)
+        assert a.percurso_em_ordem() == b.percurso_em_ordem()
+        print(f"{n:>9} | {t_inserir:>11.3f} | {t_lote:>17.3f} | {t_ordenado:>13.3f} | {t_inserir / t_lote:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
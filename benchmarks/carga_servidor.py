@@ -0,0 +1,91 @@
+"""
+Gerador de carga do servidor_avl: sobe uma instância local num subprocesso e mede
+vazão e latência (p50/p99/p99.9) com 1 a 1000 conexões simultâneas, cada uma mantendo
+uma janela de requisições em voo (pipelining).
+Mistura: 80% SEARCH, 10% INSERT, 10% DELETE sobre as chaves de range(10 * n).
+Uso: python -m benchmarks.carga_servidor [conexoes1 conexoes2 ...]   (padrão: 1 10 100 1000)
+"""
+
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+
+from benchmarks import tamanhos_da_linha_de_comando
+
+CHAVES = 100_000  # chaves pré-carregadas no servidor
+REQUISICOES = 100_000  # por rodada, divididas entre as conexões
+JANELA = 8  # requisições em voo por conexão
+
+
+def _requisicao(rng):
+    sorteio = rng.random()
+    chave = rng.randrange(CHAVES * 10)
+    if sorteio < 0.8:
+        return f"SEARCH {chave}\n"
+    if sorteio < 0.9:
+        return f"INSERT {chave}\n"
+    return f"DELETE {chave}\n"
+
+
+async def _cliente(host, porta, quantidade, semente, latencias):
+    rng = random.Random(semente)
+    reader, writer = await asyncio.open_connection(host, porta)
+    enviados = deque()  # instantes de envio das requisições em voo, em ordem
+    relogio = time.perf_counter
+    restantes = quantidade
+    recebidos = 0
+    while recebidos < quantidade:
+        # completa a janela e espera pela resposta mais antiga
+        lote = []
+        while restantes and len(enviados) < JANELA:
+            lote.append(_requisicao(rng))
+            enviados.append(relogio())
+            restantes -= 1
+        if lote:
+            writer.write("".join(lote).encode())
+        await reader.readline()
+        latencias.append(relogio() - enviados.popleft())
+        recebidos += 1
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _rodada(host, porta, conexoes):
+    latencias = []
+    por_conexao = max(1, REQUISICOES // conexoes)
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_cliente(host, porta, por_conexao, f"{conexoes}:{i}", latencias)
+                           for i in range(conexoes)))
+    decorrido = time.perf_counter() - inicio
+    latencias.sort()
+
+    def percentil(p):
+        return latencias[min(len(latencias) - 1, int(len(latencias) * p / 100))]
+
+    return len(latencias) / decorrido, percentil(50), percentil(99), percentil(99.9)
+
+
+def main():
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    servidor = subprocess.Popen(
+        [sys.executable, os.path.join(raiz, "servidor_avl.py"), "--porta", "0", "--precarregar", str(CHAVES)],
+        stdout=subprocess.PIPE, text=True)
+    try:
+        endereco = servidor.stdout.readline().split()[-1]
+        host, porta = endereco.rsplit(":", 1)
+        print(f"servidor em {endereco} com {CHAVES} chaves; {REQUISICOES} requisições por rodada, janela {JANELA}")
+        print(f"{'conexões':>8} | {'req/s':>9} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'p99.9 (ms)':>10}")
+        for conexoes in tamanhos_da_linha_de_comando([1, 10, 100, 1000]):
+            vazao, p50, p99, p999 = asyncio.run(_rodada(host, int(porta), conexoes))
+            print(f"{conexoes:>8} | {vazao:>9.0f} | {p50 * 1e3:>9.2f} | {p99 * 1e3:>9.2f} | {p999 * 1e3:>10.2f}")
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Carga mista multi-thread (leituras/escritas 95/5 e 50/50) na ArvoreAVLConcorrente,
+comparada com uma ArvoreAVL protegida por um único threading.Lock, e o custo de
+aplicar um lote de m inserções com ArvoreAVL.aplicar_lote (uma descida) contra
+inserir as m chaves uma a uma.
+Uso: python -m benchmarks.concorrencia_mista [threads] [segundos]   (padrão: 8 threads, 2 s)
+"""
+
+import random
+import sys
+import threading
+import time
+
+from atividade_5 import ArvoreAVL
+from avl_concorrente import ArvoreAVLConcorrente
+from benchmarks import cronometrar
+
+N_INICIAL = 100_000
+TAMANHOS_DE_LOTE = (2, 8, 64, 256, 1024, 8192)
+
+
+class ComTravaUnica:
+    """Linha de base: toda operação passa por um único Lock."""
+    def __init__(self, arvore):
+        self._arvore = arvore
+        self._trava = threading.Lock()
+
+    def __getattr__(self, nome):
+        funcao = getattr(self._arvore, nome)
+
+        def chamar(*args):
+            with self._trava:
+                return funcao(*args)
+        return chamar
+
+
+def trabalhador(arvore, indice, n_threads, fracao_leitura, largada, parar, latencias, erros):
+    rng = random.Random(indice)
+    presentes = set()
+    minhas = []
+    largada.wait()
+    try:
+        _laco(arvore, indice, n_threads, fracao_leitura, parar, rng, presentes, minhas)
+    except Exception as erro:
+        erros.append((indice, erro))
+        parar.set()
+    latencias[indice] = minhas
+
+
+def _laco(arvore, indice, n_threads, fracao_leitura, parar, rng, presentes, minhas):
+    while not parar.is_set():
+        inicio = time.perf_counter()
+        if rng.random() < fracao_leitura:
+            chave = rng.randrange(N_INICIAL)
+            if rng.random() < 0.7:
+                arvore.obter_profundidade_no(chave)
+            else:
+                arvore.encontrar_nos_intervalo(chave, chave + 100)
+        else:
+            # cada thread usa chaves próprias (as congruentes a indice módulo n_threads)
+            # para não gerar duplicatas entre threads
+            chave = N_INICIAL + indice + n_threads * rng.randrange(1000)
+            if chave in presentes:
+                arvore.deletar(chave)
+                presentes.discard(chave)
+            else:
+                arvore.inserir(chave)
+                presentes.add(chave)
+        minhas.append(time.perf_counter() - inicio)
+
+
+def rodar(nome, arvore, n_threads, fracao_leitura, segundos):
+    largada, parar = threading.Event(), threading.Event()
+    latencias = [[] for _ in range(n_threads)]
+    erros = []
+    threads = [threading.Thread(target=trabalhador,
+                                args=(arvore, i, n_threads, fracao_leitura, largada, parar, latencias, erros))
+               for i in range(n_threads)]
+    # todas as threads começam juntas: disparar threads com as outras já rodando
+    # demora (cada start disputa o GIL) e distorce a medição com muitas threads
+    for t in threads:
+        t.start()
+    largada.set()
+    time.sleep(segundos)
+    parar.set()
+    for t in threads:
+        t.join()
+    if erros:
+        indice, erro = erros[0]
+        print(f"{nome:<22} | falhou: thread {indice}: {type(erro).__name__}: {erro} "
+              f"({len(erros)} thread(s) com erro)")
+        return
+    todas = sorted(x for lista in latencias for x in lista)
+    p50 = todas[len(todas) // 2] * 1e6
+    p99 = todas[int(len(todas) * 0.99)] * 1e6
+    extra = ""
+    if isinstance(arvore, ArvoreAVLConcorrente):
+        est = arvore.estatisticas()
+        extra = f"lotes {est['lotes']}, média {est['tamanho_medio_lote']:.2f} escritas/lote"
+    print(f"{nome:<22} | {len(todas) / segundos:>10,.0f} | {p50:>8.1f} | {p99:>9.1f} | {extra}")
+
+
+def comparar_lotes():
+    print(f"\ninserir lotes em uma ArvoreAVL com {N_INICIAL} chaves (30000 chaves no total)")
+    print(f"{'m':>6} | {'uma a uma (s)':>13} | {'aplicar_lote (s)':>16} | {'ganho':>6}")
+    for m in TAMANHOS_DE_LOTE:
+        rng = random.Random(m)
+        lotes = [[("inserir", N_INICIAL + rng.randrange(10**8)) for _ in range(m)]
+                 for _ in range(max(1, 30000 // m))]
+
+        def uma_a_uma(arvore):
+            for lote in lotes:
+                for _, chave in lote:
+                    try:
+                        arvore.inserir(chave)
+                    except ValueError:
+                        pass
+
+        def em_lote(arvore):
+            for lote in lotes:
+                arvore.aplicar_lote(lote)
+
+        # melhor de 3, alternando as duas versões
+        separadas = juntas = float("inf")
+        for _ in range(3):
+            separadas = min(separadas, cronometrar(uma_a_uma, ArvoreAVL.from_iterable(range(N_INICIAL)))[0])
+            juntas = min(juntas, cronometrar(em_lote, ArvoreAVL.from_iterable(range(N_INICIAL)))[0])
+        print(f"{m:>6} | {separadas:>13.3f} | {juntas:>16.3f} | {separadas / juntas:>5.2f}x")
+
+
+def main():
+    n_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    for fracao in (0.95, 0.5):
+        print(f"\n{int(fracao * 100)}/{int(round((1 - fracao) * 100))} leituras/escritas, {n_threads} threads")
+        print(f"{'implementação':<22} | {'ops/s':>10} | {'p50 (us)':>8} | {'p99 (us)':>9} |")
+        rodar("ArvoreAVLConcorrente", ArvoreAVLConcorrente(ArvoreAVL.from_iterable(range(N_INICIAL))),
+              n_threads, fracao, segundos)
+        rodar("ArvoreAVL + Lock", ComTravaUnica(ArvoreAVL.from_iterable(range(N_INICIAL))),
+              n_threads, fracao, segundos)
+    comparar_lotes()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Vazão (chaves/s) das consultas uma a uma contra as versões em lote:
+BinarySearchTree.search x search_many e ArvoreAVL.obter_profundidade_no x profundidade_many.
+Uso: python -m benchmarks.consultas_em_lote [n]   (padrão: 10^6)
+"""
+
+import random
+import sys
+
+from atividade_2 import BinarySearchTree
+from atividade_5 import ArvoreAVL, np
+from benchmarks import cronometrar
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    universo = n * 2
+    chaves = random.sample(range(universo), n)
+    consultas = [random.randrange(universo) for _ in range(n)]
+    lote = np.array(consultas) if np is not None else consultas
+    print(f"n={n}, {len(consultas)} consultas, numpy {'disponível' if np is not None else 'ausente (bisect)'}")
+
+    bst = BinarySearchTree()
+    for chave in chaves:
+        bst.insert(chave)
+    avl = ArvoreAVL.from_iterable(chaves)
+
+    casos = (
+        ("BST search", lambda: [bst.search(c) for c in consultas],
+         "BST search_many", lambda: bst.search_many(lote)),
+        ("AVL obter_profundidade_no", lambda: [avl.obter_profundidade_no(c) for c in consultas],
+         "AVL profundidade_many", lambda: avl.profundidade_many(lote)),
+    )
+    for nome_um, um_a_um, nome_lote, em_lote in casos:
+        t_um, esperado = cronometrar(um_a_um)
+        t_snapshot, _ = cronometrar(em_lote)  # inclui a montagem do snapshot
+        t_lote, obtido = cronometrar(em_lote)
+        assert list(obtido) == esperado
+        print(f"  {nome_um:<26} {n / t_um:>14,.0f} chaves/s")
+        print(f"  {nome_lote:<26} {n / t_lote:>14,.0f} chaves/s  (1ª chamada, com snapshot: {n / t_snapshot:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
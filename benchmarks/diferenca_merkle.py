@@ -0,0 +1,55 @@
+"""
+Custo de ArvoreAVLMerkle.diferencas em função do número de chaves alteradas numa
+réplica, contra comparar os dois percurso_em_ordem() inteiros (o que se fazia antes),
+e o custo de manter os hashes: inserções numa ArvoreAVL e numa ArvoreAVLMerkle.
+Uso: python -m benchmarks.diferenca_merkle [n1 n2 ...]   (padrão: 10^5)
+"""
+
+import random
+
+from atividade_5 import ArvoreAVL
+from avl_merkle import ArvoreAVLMerkle
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+ALTERACOES = (0, 1, 10, 100, 1000, 10000)
+
+
+def inserir_todas(arvore, chaves):
+    for chave in chaves:
+        arvore.inserir(chave)
+
+
+def comparar_percursos(a, b):
+    atual, outra = set(a.percurso_em_ordem()), set(b.percurso_em_ordem())
+    return sorted(atual ^ outra)
+
+
+def main():
+    for n in tamanhos_da_linha_de_comando([10**5]):
+        chaves = random.sample(range(n * 10), n)
+        base, _ = cronometrar(inserir_todas, ArvoreAVL(), chaves)
+        merkle, _ = cronometrar(inserir_todas, ArvoreAVLMerkle(), chaves)
+        print(f"n={n}: inserir {n} chaves: ArvoreAVL {base:.3f} s, ArvoreAVLMerkle {merkle:.3f} s "
+              f"({merkle / base:.2f}x)")
+        print(f"{'alteradas':>9} | {'diferencas (s)':>14} | {'percursos (s)':>13} | {'sincronizar (s)':>15}")
+        primaria = ArvoreAVLMerkle.from_iterable(chaves)
+        presentes = set(chaves)
+        fora = [chave for chave in range(n * 10) if chave not in presentes][:max(ALTERACOES)]
+        for alteradas in ALTERACOES:
+            # réplica com outra forma: metade das alterações remove chaves, metade insere novas
+            replica = ArvoreAVLMerkle()
+            inserir_todas(replica, reversed(chaves))
+            for chave in chaves[:alteradas // 2]:
+                replica.deletar(chave)
+            inserir_todas(replica, fora[:alteradas - alteradas // 2])
+
+            segundos, diferencas = cronometrar(lambda: list(primaria.diferencas(replica)))
+            percursos, esperadas = cronometrar(comparar_percursos, primaria, replica)
+            assert [chave for chave, _ in diferencas] == esperadas
+            sincronizar, _ = cronometrar(replica.sincronizar_com, primaria)
+            assert replica.assinatura() == primaria.assinatura()
+            print(f"{alteradas:>9} | {segundos:>14.5f} | {percursos:>13.5f} | {sincronizar:>15.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Tempo e tamanho do arquivo DOT escrito em streaming, completo e com profundidade limitada.
+Uso: python -m benchmarks.exportacao_dot [n]   (padrão: 10^6)
+"""
+
+import os
+import sys
+import tempfile
+
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar
+from visualizacao import escrever_dot
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    arvore = ArvoreAVL.from_iterable(range(n), presorted=True)
+    filhos = lambda no: (no.esquerda, no.direita)  # noqa: E731
+    rotulo = lambda no: no.chave  # noqa: E731
+    print(f"n={n}")
+    print(f"{'visão':<22} | {'tempo (s)':>9} | {'nós escritos':>12} | {'arquivo':>10}")
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "arvore.dot")
+        for nome, profundidade in (("completa", None), ("profundidade_max=6", 6)):
+            segundos, escritos = cronometrar(escrever_dot, arvore.raiz, caminho, filhos, rotulo, profundidade)
+            tamanho = os.path.getsize(caminho)
+            print(f"{nome:<22} | {segundos:>9.2f} | {escritos:>12} | {tamanho / 2**20:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Custo da instrumentação: a mesma carga (inserir, buscar, intervalos, deletar) numa
+ArvoreAVL e numa BinarySearchTree nunca instrumentadas, instrumentadas e depois
+desinstrumentadas (deve custar o mesmo que nunca instrumentar) e instrumentadas.
+Uso: python -m benchmarks.instrumentacao_custo [n1 n2 ...]   (padrão: 10^4 10^5)
+"""
+
+import random
+
+from atividade_2 import BinarySearchTree
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+from instrumentacao import desinstrumentar, instrumentar
+
+REPETICOES = 5
+
+
+def carga_avl(arvore, chaves, consultas):
+    for chave in chaves:
+        arvore.inserir(chave)
+    for chave in consultas:
+        arvore.obter_profundidade_no(chave)
+    for chave in consultas[:1000]:
+        arvore.encontrar_nos_intervalo(chave, chave + 100)
+    for chave in chaves:
+        arvore.deletar(chave)
+
+
+def carga_bst(arvore, chaves, consultas):
+    for chave in chaves:
+        arvore.insert(chave)
+    for chave in consultas:
+        arvore.search(chave)
+    for chave in chaves:
+        arvore.delete(chave)
+
+
+def modos(classe):
+    """(nome, árvore nova pronta para a carga) de cada modo."""
+    def nunca():
+        return classe()
+
+    def desligada():
+        arvore = classe()
+        instrumentar(arvore)
+        desinstrumentar(arvore)
+        return arvore
+
+    def ligada():
+        arvore = classe()
+        instrumentar(arvore)
+        return arvore
+
+    return (("nunca instrumentada", nunca), ("desinstrumentada", desligada), ("instrumentada", ligada))
+
+
+def main():
+    print(f"melhor de {REPETICOES} execuções")
+    print(f"{'n':>7} | {'árvore':<16} | {'modo':<19} | {'tempo (s)':>9} | {'relativo':>8}")
+    for n in tamanhos_da_linha_de_comando([10**4, 10**5]):
+        chaves = random.sample(range(n * 10), n)
+        consultas = [random.randrange(n * 10) for _ in range(n)]
+        for nome, classe, carga in (("ArvoreAVL", ArvoreAVL, carga_avl),
+                                    ("BinarySearchTree", BinarySearchTree, carga_bst)):
+            # os modos se alternam a cada repetição para o ruído da máquina afetar todos igual
+            melhores = {}
+            for _ in range(REPETICOES):
+                for modo, criar in modos(classe):
+                    segundos, _ = cronometrar(carga, criar(), chaves, consultas)
+                    melhores[modo] = min(segundos, melhores.get(modo, segundos))
+            base = melhores["nunca instrumentada"]
+            for modo, melhor in melhores.items():
+                print(f"{n:>7} | {nome:<16} | {modo:<19} | {melhor:>9.3f} | {melhor / base:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
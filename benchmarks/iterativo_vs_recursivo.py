@@ -0,0 +1,158 @@
+"""
+Latência por operação das versões recursivas originais contra as iterativas atuais
+(ArvoreAVL.inserir/deletar e BinarySearchTree.insert/search/delete).
+Uso: python -m benchmarks.iterativo_vs_recursivo [n]   (padrão: 20000)
+"""
+
+import random
+import sys
+
+from atividade_2 import BinarySearchTree, Node
+from atividade_5 import ArvoreAVL, No
+from benchmarks import cronometrar
+
+
+class ArvoreAVLRecursiva(ArvoreAVL):
+    """Inserção e deleção como eram antes: uma chamada Python por nível."""
+
+    def inserir(self, chave):
+        self.raiz = self._inserir_recursivo(self.raiz, chave)
+
+    def _inserir_recursivo(self, no_atual, chave):
+        if no_atual is None:
+            return No(chave)
+        if chave < no_atual.chave:
+            no_atual.esquerda = self._inserir_recursivo(no_atual.esquerda, chave)
+        elif chave > no_atual.chave:
+            no_atual.direita = self._inserir_recursivo(no_atual.direita, chave)
+        else:
+            raise ValueError(f"Chave duplicada: {chave}")
+        return self._balancear(no_atual)
+
+    def deletar(self, chave):
+        self.raiz = self._deletar_recursivo(self.raiz, chave)
+
+    def _deletar_recursivo(self, no_atual, chave):
+        if no_atual is None:
+            return no_atual
+        if chave < no_atual.chave:
+            no_atual.esquerda = self._deletar_recursivo(no_atual.esquerda, chave)
+        elif chave > no_atual.chave:
+            no_atual.direita = self._deletar_recursivo(no_atual.direita, chave)
+        else:
+            if no_atual.esquerda is None:
+                return no_atual.direita
+            elif no_atual.direita is None:
+                return no_atual.esquerda
+            temp = self.obter_no_valor_minimo(no_atual.direita)
+            no_atual.chave = temp.chave
+            no_atual.direita = self._deletar_recursivo(no_atual.direita, temp.chave)
+        return self._balancear(no_atual)
+
+
+class BinarySearchTreeRecursiva(BinarySearchTree):
+    """insert/search/delete como eram antes."""
+
+    def insert(self, valor):
+        if self.root is None:
+            self.root = Node(valor)
+        else:
+            self._insert(self.root, valor)
+
+    def _insert(self, node, valor):
+        if valor < node.valor:
+            if node.left is None:
+                node.left = Node(valor)
+            else:
+                self._insert(node.left, valor)
+        elif valor > node.valor:
+            if node.right is None:
+                node.right = Node(valor)
+            else:
+                self._insert(node.right, valor)
+
+    def search(self, valor):
+        return self._search(self.root, valor)
+
+    def _search(self, node, valor):
+        if node is None:
+            return False
+        if node.valor == valor:
+            return True
+        elif valor < node.valor:
+            return self._search(node.left, valor)
+        else:
+            return self._search(node.right, valor)
+
+    def delete(self, valor):
+        self.root = self._delete(self.root, valor)
+
+    def _delete(self, node, valor):
+        if node is None:
+            return node
+        if valor < node.valor:
+            node.left = self._delete(node.left, valor)
+        elif valor > node.valor:
+            node.right = self._delete(node.right, valor)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            sucessor = self._min_value_node(node.right)
+            node.valor = sucessor.valor
+            node.right = self._delete(node.right, sucessor.valor)
+        return node
+
+
+def medir_avl(classe, chaves):
+    arvore = classe()
+    t_ins, _ = cronometrar(lambda: [arvore.inserir(c) for c in chaves])
+    t_del, _ = cronometrar(lambda: [arvore.deletar(c) for c in chaves])
+    return t_ins / len(chaves), t_del / len(chaves)
+
+
+def medir_bst(classe, chaves):
+    arvore = classe()
+    try:
+        t_ins, _ = cronometrar(lambda: [arvore.insert(c) for c in chaves])
+        t_bus, _ = cronometrar(lambda: [arvore.search(c) for c in chaves])
+        t_del, _ = cronometrar(lambda: [arvore.delete(c) for c in chaves])
+    except RecursionError:
+        return None
+    return t_ins / len(chaves), t_bus / len(chaves), t_del / len(chaves)
+
+
+def us(segundos):
+    return f"{segundos * 1e6:8.2f} us"
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 20000
+    aleatorias = random.sample(range(n * 10), n)
+    ordenadas = sorted(aleatorias)
+    # a BST sem balanceamento fica com altura n em entrada ordenada: limitamos n
+    # para que a comparação seja possível e mostramos onde a recursiva quebra
+    n_bst_ordenado = min(n, 900)
+
+    print(f"ArvoreAVL (n={n})")
+    for nome, chaves in (("aleatória", aleatorias), ("ordenada", ordenadas)):
+        for classe in (ArvoreAVLRecursiva, ArvoreAVL):
+            ins, dele = medir_avl(classe, chaves)
+            print(f"  {nome:<10} {classe.__name__:<20} inserir {us(ins)}  deletar {us(dele)}")
+
+    print(f"\nBinarySearchTree (aleatória n={n}, ordenada n={n_bst_ordenado} e n={n})")
+    casos = (("aleatória", aleatorias), ("ordenada", ordenadas[:n_bst_ordenado]), ("ordenada", ordenadas))
+    for nome, chaves in casos:
+        for classe in (BinarySearchTreeRecursiva, BinarySearchTree):
+            resultado = medir_bst(classe, chaves)
+            rotulo = f"  {nome:<10} n={len(chaves):<7} {classe.__name__:<26}"
+            if resultado is None:
+                print(f"{rotulo} RecursionError")
+            else:
+                ins, bus, dele = resultado
+                print(f"{rotulo} insert {us(ins)}  search {us(bus)}  delete {us(dele)}")
+
+
+if __name__ == "__main__":
+    main()
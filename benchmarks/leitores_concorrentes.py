@@ -0,0 +1,81 @@
+"""
+Vazão de leitores enquanto um escritor altera a árvore:
+ArvoreAVLVersionada (leitores sem trava, em snapshots) x ArvoreAVL protegida por threading.Lock.
+Uso: python -m benchmarks.leitores_concorrentes [n] [segundos] [leitores]
+     (padrão: 100000 chaves, 3 s, 4 leitores)
+"""
+
+import random
+import sys
+import threading
+import time
+
+from atividade_5 import ArvoreAVL
+from avl_persistente import ArvoreAVLPersistente, ArvoreAVLVersionada
+
+LARGURA = 1000  # chaves cobertas por cada leitura de intervalo
+
+
+def escritor(inserir, deletar, universo, parar, contagem):
+    rng = random.Random(1)
+    presentes = set()
+    while not parar.is_set():
+        chave = rng.randrange(universo, 2 * universo)  # fora das chaves iniciais
+        if chave in presentes:
+            deletar(chave)
+            presentes.discard(chave)
+        else:
+            inserir(chave)
+            presentes.add(chave)
+        contagem[0] += 1
+
+
+def leitor(ler, universo, parar, contagem, indice):
+    rng = random.Random(100 + indice)
+    while not parar.is_set():
+        inicio = rng.randrange(universo)
+        ler(inicio, inicio + LARGURA)
+        contagem[indice] += 1
+
+
+def rodar(nome, inserir, deletar, ler, universo, segundos, n_leitores):
+    parar = threading.Event()
+    escritas = [0]
+    leituras = [0] * n_leitores
+    threads = [threading.Thread(target=escritor, args=(inserir, deletar, universo, parar, escritas))]
+    threads += [threading.Thread(target=leitor, args=(ler, universo, parar, leituras, i)) for i in range(n_leitores)]
+    for t in threads:
+        t.start()
+    time.sleep(segundos)
+    parar.set()
+    for t in threads:
+        t.join()
+    print(f"{nome:<26} | {sum(leituras) / segundos:>14,.0f} | {escritas[0] / segundos:>14,.0f}")
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100_000
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    n_leitores = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    print(f"n={n}, {n_leitores} leitores de intervalos com {LARGURA} chaves, 1 escritor, {segundos} s")
+    print(f"{'modo':<26} | {'leituras/s':>14} | {'escritas/s':>14}")
+
+    versionada = ArvoreAVLVersionada(ArvoreAVLPersistente.from_iterable(range(n), presorted=True))
+    rodar("persistente (snapshot)", versionada.inserir, versionada.deletar,
+          lambda a, b: versionada.snapshot().encontrar_nos_intervalo(a, b), n, segundos, n_leitores)
+
+    arvore = ArvoreAVL.from_iterable(range(n), presorted=True)
+    trava = threading.Lock()
+
+    def com_trava(funcao):
+        def chamar(*args):
+            with trava:
+                return funcao(*args)
+        return chamar
+
+    rodar("ArvoreAVL + Lock", com_trava(arvore.inserir), com_trava(arvore.deletar),
+          com_trava(arvore.encontrar_nos_intervalo), n, segundos, n_leitores)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Buscas com distribuição Zipf no MapaAVL (com e sem cache LRU) contra o padrão antigo
+de ArvoreAVL + dict paralelo, e no BinarySearchMap.
+Uso: python -m benchmarks.mapa_zipf [n1 n2 ...]   (padrão: 10^4 10^5 10^6)
+"""
+
+import random
+from itertools import accumulate
+
+from atividade_2 import BinarySearchMap
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+from mapa_avl import MapaAVL
+
+BUSCAS = 200_000
+EXPOENTE_ZIPF = 1.1
+TAMANHOS_CACHE = (0, 100, 1000, 10000)
+
+
+def consultas_zipf(chaves, quantidade, expoente):
+    """Sorteia chaves com P(i-ésima mais popular) proporcional a 1 / i^expoente."""
+    populares = random.sample(chaves, len(chaves))
+    pesos = list(accumulate(1 / i ** expoente for i in range(1, len(chaves) + 1)))
+    return random.choices(populares, cum_weights=pesos, k=quantidade)
+
+
+def main():
+    print(f"{BUSCAS} buscas Zipf (s={EXPOENTE_ZIPF})")
+    print(f"{'n':>9} | {'estrutura':<27} | {'buscas/s':>10} | {'taxa de acerto':>14}")
+    for n in tamanhos_da_linha_de_comando([10**4, 10**5, 10**6]):
+        chaves = random.sample(range(n * 10), n)
+        consultas = consultas_zipf(chaves, BUSCAS, EXPOENTE_ZIPF)
+
+        # padrão antigo: a árvore só com chaves e um dict ao lado
+        arvore = ArvoreAVL.from_iterable(chaves)
+        valores = {chave: str(chave) for chave in chaves}
+        segundos, esperado = cronometrar(
+            lambda: [valores[c] if arvore.obter_profundidade_no(c) != -1 else None for c in consultas])
+        print(f"{n:>9} | {'ArvoreAVL + dict':<27} | {BUSCAS / segundos:>10.0f} | {'-':>14}")
+
+        for tamanho_cache in TAMANHOS_CACHE:
+            mapa = MapaAVL(tamanho_cache)
+            for chave in chaves:
+                mapa.put(chave, str(chave))
+            segundos, obtidos = cronometrar(lambda: [mapa.get(c) for c in consultas])
+            assert obtidos == esperado
+            estatisticas = mapa.estatisticas_cache()
+            taxa = f"{estatisticas['taxa_acerto']:>14.1%}" if estatisticas else f"{'-':>14}"
+            print(f"{n:>9} | {f'MapaAVL(cache={tamanho_cache})':<27} | {BUSCAS / segundos:>10.0f} | {taxa}")
+
+        bst = BinarySearchMap(1000)
+        for chave in chaves:
+            bst.put(chave, str(chave))
+        segundos, obtidos = cronometrar(lambda: [bst.get(c) for c in consultas])
+        assert obtidos == esperado
+        taxa = bst.cache_stats()["taxa_acerto"]
+        print(f"{n:>9} | {'BinarySearchMap(cache=1000)':<27} | {BUSCAS / segundos:>10.0f} | {taxa:>14.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Memória da ArvoreAVL (um objeto por nó) contra a ArvoreAVLCompacta (arrays tipados).
+Cada medição roda num subprocesso próprio para que o RSS de uma não contamine a outra.
+Uso: python -m benchmarks.memoria_compacta [n1 n2 ...]   (padrão: 10^5 10^6)
+"""
+
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from atividade_5 import ArvoreAVL
+from avl_compacta import ArvoreAVLCompacta
+from benchmarks import tamanhos_da_linha_de_comando
+
+VARIANTES = ("objetos", "compacta")
+
+
+def rss_bytes():
+    """RSS atual do processo (Linux); cai para o pico do getrusage em outros sistemas."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        fator = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * fator
+
+
+def construir(variante, chaves):
+    arvore = ArvoreAVL() if variante == "objetos" else ArvoreAVLCompacta()
+    for chave in chaves:
+        arvore.inserir(chave)
+    return arvore
+
+
+def medir(variante, n, modo):
+    """Executado no subprocesso: constrói a árvore e imprime as medidas em JSON."""
+    chaves = random.Random(n).sample(range(n * 10), n)
+    gc.collect()
+    if modo == "tracemalloc":
+        tracemalloc.start()
+        arvore = construir(variante, chaves)
+        atual, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"atual": atual, "pico": pico}
+    antes = rss_bytes()
+    inicio = time.perf_counter()
+    arvore = construir(variante, chaves)
+    segundos = time.perf_counter() - inicio
+    gc.collect()
+    inicio_gc = time.perf_counter()
+    gc.collect()
+    return {"rss": rss_bytes() - antes, "segundos": segundos,
+            "gc": time.perf_counter() - inicio_gc, "n": len(arvore.percurso_em_ordem())}
+
+
+def em_subprocesso(variante, n, modo):
+    saida = subprocess.run(
+        [sys.executable, "-m", "benchmarks.memoria_compacta", "--medir", variante, str(n), modo],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(saida.stdout)
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == "--medir":
+        print(json.dumps(medir(sys.argv[2], int(sys.argv[3]), sys.argv[4])))
+        return
+
+    print(f"{'n':>9} | {'variante':<9} | {'tracemalloc':>12} | {'B/nó':>6} | {'RSS':>10} | {'B/nó':>6} | {'inserção (s)':>12} | {'gc.collect (ms)':>15}")
+    for n in tamanhos_da_linha_de_comando([10**5, 10**6]):
+        for variante in VARIANTES:
+            tm = em_subprocesso(variante, n, "tracemalloc")
+            rss = em_subprocesso(variante, n, "rss")
+            print(f"{n:>9} | {variante:<9} | {tm['atual'] / 2**20:>9.1f} MB | {tm['atual'] / n:>6.1f} | "
+                  f"{rss['rss'] / 2**20:>7.1f} MB | {rss['rss'] / n:>6.1f} | {rss['segundos']:>12.2f} | {rss['gc'] * 1e3:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+União, interseção e diferença por split/join contra o laço ingênuo (percorrer uma
+árvore e inserir/consultar chave a chave), para uma árvore grande (n) e outra de
+tamanho m variável. As duas versões consomem as entradas (consumir=True), como o laço
+ingênuo que insere na árvore grande.
+Uso: python -m benchmarks.operacoes_conjunto [n] [trabalhadores]   (padrão: 10^6, sem paralelismo)
+"""
+
+import random
+import sys
+
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar
+
+
+def uniao_ingenua(grande, pequena):
+    for chave in pequena.percurso_em_ordem():
+        try:
+            grande.inserir(chave)
+        except ValueError:
+            pass
+    return grande
+
+
+def intersecao_ingenua(grande, pequena):
+    return ArvoreAVL.from_iterable(
+        [c for c in pequena.percurso_em_ordem() if grande.obter_profundidade_no(c) != -1], presorted=True)
+
+
+def diferenca_ingenua(grande, pequena):
+    for chave in pequena.percurso_em_ordem():
+        grande.deletar(chave)
+    return grande
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    trabalhadores = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    rng = random.Random(0)
+    grandes = rng.sample(range(4 * n), n)
+    print(f"n={n}, trabalhadores={trabalhadores or 1}")
+    print(f"{'operação':<11} | {'m':>8} | {'ingênua (s)':>11} | {'split/join (s)':>14} | {'ganho':>7}")
+    casos = (("uniao", uniao_ingenua), ("intersecao", intersecao_ingenua), ("diferenca", diferenca_ingenua))
+    m = 10
+    while m <= n:
+        pequenas = rng.sample(range(4 * n), m)
+        for nome, ingenua in casos:
+            t_ingenua, esperado = cronometrar(ingenua, ArvoreAVL.from_iterable(grandes),
+                                              ArvoreAVL.from_iterable(pequenas))
+            a, b = ArvoreAVL.from_iterable(grandes), ArvoreAVL.from_iterable(pequenas)
+            t_rapida, obtido = cronometrar(getattr(a, nome), b, trabalhadores, consumir=True)
+            assert obtido.percurso_em_ordem() == esperado.percurso_em_ordem()
+            print(f"{nome:<11} | {m:>8} | {t_ingenua:>11.4f} | {t_rapida:>14.4f} | {t_ingenua / t_rapida:>6.1f}x")
+        m *= 100
+
+
+if __name__ == "__main__":
+    main()
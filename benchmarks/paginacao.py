@@ -0,0 +1,39 @@
+"""
+Latência até o primeiro resultado e custo de página em diferentes deslocamentos
+para ArvoreAVL.iter_intervalo / pagina_intervalo.
+Uso: python -m benchmarks.paginacao [n]   (padrão: 10^6)
+"""
+
+import sys
+import time
+
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    arvore = ArvoreAVL.from_iterable(range(n), presorted=True)
+
+    t_lista, _ = cronometrar(arvore.encontrar_nos_intervalo, 0, n)
+    inicio = time.perf_counter()
+    next(arvore.iter_intervalo(0, n))
+    t_primeiro = time.perf_counter() - inicio
+    print(f"n={n}: lista completa {t_lista * 1e3:.1f} ms | primeiro item do iterador {t_primeiro * 1e6:.1f} us")
+
+    limite = 100
+    print(f"\npáginas de {limite} chaves")
+    print(f"{'deslocamento':>12} | {'página (us)':>11}")
+    deslocamento = 1
+    while deslocamento < n:
+        cursor = arvore.select(deslocamento - 1)
+        repeticoes = 200
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            arvore.pagina_intervalo(0, n, limite, after=cursor)
+        print(f"{deslocamento:>12} | {(time.perf_counter() - inicio) / repeticoes * 1e6:>11.1f}")
+        deslocamento *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Curva de escala do construir_arvore atual (tokenizador de uma passada + shunting-yard)
+contra o parser antigo (replace/split + tokens.pop(0) + recursão).
+Uso: python -m benchmarks.parser_expressoes [tokens_max]   (padrão: 10^6)
+"""
+
+import random
+import sys
+
+from atividade_1 import No, construir_arvore
+from benchmarks import cronometrar
+
+LIMITE_ANTIGO = 70_000  # acima disso o parser antigo (O(n^2)) leva tempo demais
+
+
+def construir_arvore_antigo(expr):
+    tokens = expr.replace("(", " ( ").replace(")", " ) ").split()
+
+    def parse():
+        token = tokens.pop(0)
+        if token == "(":
+            esquerdo = parse()
+            operador = tokens.pop(0)
+            direito = parse()
+            tokens.pop(0)
+            return No(operador, esquerdo, direito)
+        return No(token)
+
+    return parse()
+
+
+def expressao_balanceada(folhas, rng):
+    """Expressão totalmente parentizada (o único formato que o parser antigo aceita)."""
+    nivel = [str(rng.randint(1, 99)) for _ in range(folhas)]
+    while len(nivel) > 1:
+        proximo = [f"({a} {rng.choice('+-*/')} {b})" for a, b in zip(nivel[::2], nivel[1::2])]
+        if len(nivel) % 2:
+            proximo.append(nivel[-1])
+        nivel = proximo
+    return nivel[0]
+
+
+def main():
+    tokens_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(0)
+    print(f"{'tokens':>9} | {'antigo (s)':>10} | {'novo (s)':>9} | {'novo us/token':>13}")
+    folhas = 256
+    while folhas * 4 <= tokens_max * 1.1:
+        expr = expressao_balanceada(folhas, rng)
+        n_tokens = len(expr.replace("(", " ( ").replace(")", " ) ").split())
+        t_novo, _ = cronometrar(construir_arvore, expr)
+        antigo = f"{cronometrar(construir_arvore_antigo, expr)[0]:>10.3f}" if n_tokens <= LIMITE_ANTIGO else f"{'-':>10}"
+        print(f"{n_tokens:>9} | {antigo} | {t_novo:>9.3f} | {t_novo / n_tokens * 1e6:>13.2f}")
+        folhas *= 4
+
+    profundidade = 100_000
+    aninhada = "(" * profundidade + "1" + " + 1)" * profundidade
+    t_novo, _ = cronometrar(construir_arvore, aninhada)
+    try:
+        construir_arvore_antigo(aninhada)
+        antigo = "ok"
+    except RecursionError:
+        antigo = "RecursionError"
+    print(f"\naninhamento {profundidade}: antigo {antigo}, novo {t_novo:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
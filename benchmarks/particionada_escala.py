@@ -0,0 +1,88 @@
+"""
+Escala da ArvoreAVLParticionada com 1, 2, 4 e 8 processos trabalhadores, comparada com
+uma ArvoreAVL num único processo: inserções e buscas em lotes de LOTE chaves, intervalos
+(um pedido por vez) e a inserção de uma faixa nova de chaves, que desequilibra as
+partições e dispara rebalanceamentos.
+O ganho depende de haver núcleos livres: com menos núcleos que trabalhadores os processos
+disputam a CPU e só sobra o custo de serializar as mensagens (os.cpu_count() é impresso).
+Uso: python -m benchmarks.particionada_escala [n1 n2 ...]   (padrão: 2*10^5)
+"""
+
+import os
+import random
+
+from atividade_5 import ArvoreAVL
+from avl_particionada import ArvoreAVLParticionada
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+TRABALHADORES = (1, 2, 4, 8)
+LOTE = 10_000
+INTERVALOS = 500
+
+
+def em_lotes(funcao, chaves):
+    for inicio in range(0, len(chaves), LOTE):
+        funcao(chaves[inicio:inicio + LOTE])
+
+
+def carga_local(chaves, consultas, intervalos, faixa_nova):
+    arvore = ArvoreAVL()
+
+    def inserir_lote(lote):
+        for chave in lote:
+            arvore.inserir(chave)
+
+    def buscar_lote(lote):
+        for chave in lote:
+            arvore.obter_profundidade_no(chave)
+
+    def intervalos_um_a_um(lista):
+        for inicio, fim in lista:
+            arvore.encontrar_nos_intervalo(inicio, fim)
+
+    return (cronometrar(em_lotes, inserir_lote, chaves)[0],
+            cronometrar(em_lotes, buscar_lote, consultas)[0],
+            cronometrar(intervalos_um_a_um, intervalos)[0],
+            cronometrar(em_lotes, inserir_lote, faixa_nova)[0],
+            0)
+
+
+def carga_particionada(trabalhadores, chaves, consultas, intervalos, faixa_nova):
+    # limites iniciais tirados de uma amostra, como faria quem já conhece a distribuição
+    amostra = sorted(chaves[:1000])
+    limites = [amostra[len(amostra) * i // trabalhadores] for i in range(1, trabalhadores)]
+    with ArvoreAVLParticionada(trabalhadores, limites) as arvore:
+        def intervalos_um_a_um(lista):
+            for inicio, fim in lista:
+                arvore.encontrar_nos_intervalo(inicio, fim)
+
+        tempos = (cronometrar(em_lotes, arvore.inserir_many, chaves)[0],
+                  cronometrar(em_lotes, arvore.profundidade_many, consultas)[0],
+                  cronometrar(intervalos_um_a_um, intervalos)[0],
+                  cronometrar(em_lotes, arvore.inserir_many, faixa_nova)[0],
+                  arvore.rebalanceamentos)
+    return tempos
+
+
+def main():
+    print(f"núcleos disponíveis: {os.cpu_count()}; lotes de {LOTE} chaves")
+    print(f"{'n':>7} | {'configuração':<22} | {'inserir/s':>10} | {'buscar/s':>10} | "
+          f"{'intervalos/s':>12} | {'faixa nova/s':>12} | {'rebal.':>6}")
+    for n in tamanhos_da_linha_de_comando([2 * 10**5]):
+        rng = random.Random(n)
+        chaves = rng.sample(range(n * 10), n)
+        consultas = [rng.randrange(n * 10) for _ in range(n)]
+        intervalos = [(inicio, inicio + 100) for inicio in (rng.randrange(n * 10) for _ in range(INTERVALOS))]
+        # chaves acima de todas as outras: caem todas na última partição
+        faixa_nova = list(range(n * 10, n * 10 + n // 2))
+        linhas = [("ArvoreAVL (1 processo)", carga_local(chaves, consultas, intervalos, faixa_nova))]
+        for trabalhadores in TRABALHADORES:
+            linhas.append((f"particionada x{trabalhadores}",
+                           carga_particionada(trabalhadores, chaves, consultas, intervalos, faixa_nova)))
+        for nome, (inserir, buscar, intervalo, faixa, rebalanceamentos) in linhas:
+            print(f"{n:>7} | {nome:<22} | {n / inserir:>10.0f} | {n / buscar:>10.0f} | "
+                  f"{INTERVALOS / intervalo:>12.0f} | {len(faixa_nova) / faixa:>12.0f} | {rebalanceamentos:>6}")
+
+
+if __name__ == "__main__":
+    main()
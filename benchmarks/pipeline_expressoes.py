@@ -0,0 +1,32 @@
+"""
+Vazão do pipeline paralelo de geração + construir_arvore + avaliação por número de
+processos, conferindo que o resultado é o mesmo para qualquer número de processos.
+Uso: python -m benchmarks.pipeline_expressoes [total] [trabalhadores...]
+     (padrão: 200000 expressões com 1, 2, 4 e 8 processos)
+"""
+
+import hashlib
+import sys
+import time
+
+from atividade_1 import avaliar_em_paralelo
+
+
+def main():
+    total = int(float(sys.argv[1])) if len(sys.argv) > 1 else 200_000
+    contagens = [int(a) for a in sys.argv[2:]] or [1, 2, 4, 8]
+    print(f"{total} expressões, 8 operandos, lotes de 2000")
+    print(f"{'processos':>9} | {'tempo (s)':>9} | {'expressões/s':>12} | {'por processo':>12} | resumo")
+    for trabalhadores in contagens:
+        resumo = hashlib.sha256()
+        inicio = time.perf_counter()
+        for lote in avaliar_em_paralelo(total, semente=42, trabalhadores=trabalhadores, tamanho_lote=2000,
+                                        operandos=8, incluir_expressoes=False):
+            resumo.update(repr(lote).encode())
+        segundos = time.perf_counter() - inicio
+        print(f"{trabalhadores:>9} | {segundos:>9.2f} | {total / segundos:>12,.0f} | "
+              f"{total / segundos / trabalhadores:>12,.0f} | {resumo.hexdigest()[:12]}")
+
+
+if __name__ == "__main__":
+    main()
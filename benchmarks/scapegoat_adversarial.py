@@ -0,0 +1,58 @@
+"""
+Modo scapegoat da BinarySearchTree (alpha) contra a BinarySearchTree sem balanceamento
+em entradas adversariais (ordenada, inversa, quase ordenada) e aleatória: altura,
+profundidade média das buscas, tempo de inserção, buscas/s e número de reconstruções.
+Depois remove metade das chaves para mostrar as reconstruções globais.
+Uso: python -m benchmarks.scapegoat_adversarial [n1 n2 ...]   (padrão: 2000 8000)
+"""
+
+import random
+
+from atividade_2 import BinarySearchTree
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+ALPHAS = (None, 0.6, 0.7, 0.8)
+
+
+def entradas(n):
+    """(nome, ordem de inserção) de cada entrada."""
+    ordenada = list(range(n))
+    quase = list(ordenada)
+    for _ in range(n // 100):  # 1% de trocas entre vizinhos próximos
+        i = random.randrange(n - 10)
+        j = i + random.randrange(1, 10)
+        quase[i], quase[j] = quase[j], quase[i]
+    yield "ordenada", ordenada
+    yield "inversa", ordenada[::-1]
+    yield "quase ordenada", quase
+    yield "aleatoria", random.sample(ordenada, n)
+
+
+def inserir_todas(arvore, chaves):
+    for chave in chaves:
+        arvore.insert(chave)
+
+
+def main():
+    for n in tamanhos_da_linha_de_comando([2000, 8000]):
+        consultas = [random.randrange(n) for _ in range(n)]
+        print(f"n={n}")
+        print(f"{'entrada':<14} | {'alpha':<6} | {'altura':>6} | {'prof. média':>11} | {'inserir (s)':>11} | "
+              f"{'buscas/s':>10} | {'reconstr.':>9} | {'altura após remover':>19}")
+        for nome, chaves in entradas(n):
+            for alpha in ALPHAS:
+                arvore = BinarySearchTree(alpha)
+                inserir, _ = cronometrar(inserir_todas, arvore, chaves)
+                buscar, achados = cronometrar(lambda: [arvore.search(c) for c in consultas])
+                assert all(achados)
+                media = sum(arvore.depth(c) for c in consultas) / len(consultas)
+                altura = arvore.height()
+                for chave in chaves[::2]:
+                    arvore.delete(chave)
+                rotulo = "sem" if alpha is None else str(alpha)
+                print(f"{nome:<14} | {rotulo:<6} | {altura:>6} | {media:>11.1f} | {inserir:>11.3f} | "
+                      f"{len(consultas) / buscar:>10.0f} | {arvore.rebuilds:>9} | {arvore.height():>19}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Partida a frio da ArvoreAVL: reconstruir com inserir, carregar o snapshot binário
+para nós Python e abrir o snapshot via mmap (somente leitura).
+Uso: python -m benchmarks.snapshot_disco [n1 n2 ...]   (padrão: 10^4 10^5 10^6)
+"""
+
+import os
+import random
+import tempfile
+
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+
+def reconstruir(chaves):
+    arvore = ArvoreAVL()
+    for chave in chaves:
+        arvore.inserir(chave)
+    return arvore
+
+
+def abrir_e_consultar(caminho, chave):
+    arvore = ArvoreAVL.carregar(caminho, somente_leitura=True)
+    arvore.obter_profundidade_no(chave)
+    return arvore
+
+
+def main():
+    print(f"{'n':>9} | {'inserir (s)':>11} | {'salvar (s)':>10} | {'carregar (s)':>12} | {'mmap + 1ª busca (ms)':>20} | {'arquivo (MB)':>12}")
+    with tempfile.TemporaryDirectory() as pasta:
+        for n in tamanhos_da_linha_de_comando([10**4, 10**5, 10**6]):
+            chaves = random.sample(range(n * 10), n)
+            caminho = os.path.join(pasta, f"avl_{n}.bin")
+            t_inserir, arvore = cronometrar(reconstruir, chaves)
+            t_salvar, _ = cronometrar(arvore.salvar, caminho)
+            t_carregar, carregada = cronometrar(ArvoreAVL.carregar, caminho)
+            t_mmap, mapeada = cronometrar(abrir_e_consultar, caminho, chaves[0])
+            amostra = random.sample(chaves, min(n, 1000))
+            assert all(mapeada.obter_profundidade_no(c) == arvore.obter_profundidade_no(c)
+                       == carregada.obter_profundidade_no(c) for c in amostra)
+            mapeada.close()
+            tamanho = os.path.getsize(caminho) / 2**20
+            print(f"{n:>9} | {t_inserir:>11.3f} | {t_salvar:>10.3f} | {t_carregar:>12.3f} | {t_mmap * 1000:>20.3f} | {tamanho:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
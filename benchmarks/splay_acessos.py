@@ -0,0 +1,61 @@
+"""
+SplayTree contra ArvoreAVL e BinarySearchTree em buscas uniformes, Zipf e
+varreduras sequenciais: tempo e profundidade média da chave em cada acesso.
+Uso: python -m benchmarks.splay_acessos [n1 n2 ...]   (padrão: 10^4 10^5)
+"""
+
+import random
+
+from arvore_splay import SplayTree
+from atividade_2 import BinarySearchTree
+from atividade_5 import ArvoreAVL
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+from benchmarks.mapa_zipf import consultas_zipf
+
+BUSCAS = 200_000
+
+
+def cargas(chaves):
+    """(nome, sequência de buscas) de cada padrão de acesso."""
+    ordenadas = sorted(chaves)
+    yield "uniforme", [random.choice(chaves) for _ in range(BUSCAS)]
+    yield "zipf 1.1", consultas_zipf(chaves, BUSCAS, 1.1)
+    yield "sequencial", [ordenadas[i % len(ordenadas)] for i in range(BUSCAS)]
+
+
+def estruturas(chaves):
+    """(nome, busca, profundidade, árvore nova) de cada estrutura."""
+    def bst(cls):
+        arvore = cls()
+        for chave in chaves:
+            arvore.insert(chave)
+        return arvore
+    yield ("ArvoreAVL", lambda a, c: a.obter_profundidade_no(c) != -1, ArvoreAVL.obter_profundidade_no,
+           lambda: ArvoreAVL.from_iterable(chaves))
+    yield "BinarySearchTree", BinarySearchTree.search, BinarySearchTree.depth, lambda: bst(BinarySearchTree)
+    yield "SplayTree", SplayTree.search, SplayTree.depth, lambda: bst(SplayTree)
+
+
+def main():
+    for n in tamanhos_da_linha_de_comando([10**4, 10**5]):
+        chaves = random.sample(range(n * 10), n)
+        print(f"n={n}, {BUSCAS} buscas")
+        print(f"{'carga':<10} | {'estrutura':<16} | {'buscas/s':>10} | {'profundidade média':>18}")
+        for nome_carga, consultas in cargas(chaves):
+            for nome, buscar, profundidade, construir in estruturas(chaves):
+                arvore = construir()
+                segundos, achados = cronometrar(lambda: [buscar(arvore, c) for c in consultas])
+                assert all(achados)
+                # segunda passada numa árvore nova: profundidade da chave logo antes de cada
+                # acesso (na splay o acesso muda a forma, então mede e busca em seguida)
+                arvore = construir()
+                total = 0
+                for chave in consultas:
+                    total += profundidade(arvore, chave)
+                    buscar(arvore, chave)
+                print(f"{nome_carga:<10} | {nome:<16} | {BUSCAS / segundos:>10.0f} | {total / BUSCAS:>18.2f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
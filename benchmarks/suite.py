@@ -0,0 +1,237 @@
+"""
+Suíte unificada de benchmarks: todas as árvores do repositório sob as mesmas cargas.
+
+Para cada implementação e cada ordem de inserção (aleatória, ordenada, inversa, Zipf)
+mede as fases inserir, buscar, intervalo, percorrer e deletar: operações por segundo,
+latências p50/p99 (cada operação cronometrada) e o pico de memória da construção
+(numa passada separada com tracemalloc, que não entra nos tempos).
+Os resultados viram um dict serializável em JSON, que pode ser comparado com um
+baseline salvo de uma execução anterior. A linha de comando fica em benchmarks/__main__.py.
+"""
+
+import platform
+import random
+import time
+import tracemalloc
+from itertools import accumulate
+
+from arvore_b import ArvoreB
+from arvore_splay import SplayTree
+from atividade_2 import BinarySearchTree
+from atividade_3 import BinaryTree
+from atividade_5 import ArvoreAVL
+from avl_compacta import ArvoreAVLCompacta
+from avl_persistente import ArvoreAVLPersistente
+
+CARGAS = ("aleatoria", "ordenada", "inversa", "zipf")
+FASES = ("inserir", "buscar", "intervalo", "percorrer", "deletar")
+
+
+class Implementacao:
+    """
+    Adaptador de uma árvore para a suíte. inserir/deletar retornam a árvore (as versões
+    persistentes devolvem uma nova); intervalo e percorrer são None quando a árvore
+    não oferece a operação. limite_degenerado é o maior n rodado com entrada ordenada
+    nas árvores sem balanceamento (viram uma lista: O(n^2), e a BinaryTree é recursiva).
+    """
+    def __init__(self, nome, criar, inserir, buscar, deletar=None, intervalo=None,
+                 percorrer=None, limite_degenerado=None):
+        self.nome = nome
+        self.criar = criar
+        self.inserir = inserir
+        self.buscar = buscar
+        self.deletar = deletar
+        self.intervalo = intervalo
+        self.percorrer = percorrer
+        self.limite_degenerado = limite_degenerado
+
+
+def _mutavel(metodo):
+    def aplicar(arvore, chave):
+        metodo(arvore, chave)
+        return arvore
+    return aplicar
+
+
+def _busca_binary_tree(arvore, chave):
+    node = arvore.root
+    while node is not None and node.valor != chave:
+        node = node.left if chave < node.valor else node.right
+    return node is not None
+
+
+IMPLEMENTACOES = (
+    Implementacao("ArvoreAVL", ArvoreAVL, _mutavel(ArvoreAVL.inserir), ArvoreAVL.obter_profundidade_no,
+                  _mutavel(ArvoreAVL.deletar), ArvoreAVL.encontrar_nos_intervalo, ArvoreAVL.percurso_em_ordem),
+    Implementacao("ArvoreAVLCompacta", ArvoreAVLCompacta, _mutavel(ArvoreAVLCompacta.inserir),
+                  ArvoreAVLCompacta.obter_profundidade_no, _mutavel(ArvoreAVLCompacta.deletar),
+                  ArvoreAVLCompacta.encontrar_nos_intervalo, ArvoreAVLCompacta.percurso_em_ordem),
+    Implementacao("ArvoreAVLPersistente", ArvoreAVLPersistente, ArvoreAVLPersistente.inserir,
+                  ArvoreAVLPersistente.obter_profundidade_no, ArvoreAVLPersistente.deletar,
+                  ArvoreAVLPersistente.encontrar_nos_intervalo, ArvoreAVLPersistente.percurso_em_ordem),
+    Implementacao("ArvoreB(64)", ArvoreB, _mutavel(ArvoreB.inserir), ArvoreB.obter_profundidade_no,
+                  _mutavel(ArvoreB.deletar), ArvoreB.encontrar_nos_intervalo, ArvoreB.percurso_em_ordem),
+    Implementacao("BinarySearchTree", BinarySearchTree, _mutavel(BinarySearchTree.insert),
+                  BinarySearchTree.search, _mutavel(BinarySearchTree.delete), limite_degenerado=3000),
+    Implementacao("SplayTree", SplayTree, _mutavel(SplayTree.insert), SplayTree.search,
+                  _mutavel(SplayTree.delete)),
+    Implementacao("BinaryTree", BinaryTree, _mutavel(BinaryTree.insert), _busca_binary_tree,
+                  percorrer=BinaryTree.inorder, limite_degenerado=800),
+)
+
+
+# ===============================================================
+# CARGAS
+# ===============================================================
+
+def ordem_de_insercao(chaves, carga, rng):
+    """Ordena as chaves (distintas) na sequência de inserção da carga."""
+    if carga == "aleatoria":
+        return rng.sample(chaves, len(chaves))
+    if carga == "ordenada":
+        return sorted(chaves)
+    if carga == "inversa":
+        return sorted(chaves, reverse=True)
+    if carga == "zipf":
+        # sorteios Zipf (s = 1.1) sobre as chaves em ordem: as chaves "populares" chegam
+        # primeiro e várias vezes; repetições são descartadas e o resto vem no fim
+        ordenadas = sorted(chaves)
+        pesos = list(accumulate(1 / i ** 1.1 for i in range(1, len(ordenadas) + 1)))
+        sequencia = dict.fromkeys(rng.choices(ordenadas, cum_weights=pesos, k=len(ordenadas)))
+        restantes = [chave for chave in ordenadas if chave not in sequencia]
+        rng.shuffle(restantes)
+        return list(sequencia) + restantes
+    raise ValueError(f"Carga desconhecida: {carga!r} (use uma de {CARGAS})")
+
+
+def _percentil(ordenadas, p):
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p / 100))]
+
+
+def _medir(operacao, argumentos):
+    """Cronometra operacao(arg) para cada argumento; retorna (ops/s, p50, p99, resultado)."""
+    latencias = []
+    relogio = time.perf_counter
+    resultado = None
+    for argumento in argumentos:
+        inicio = relogio()
+        resultado = operacao(argumento)
+        latencias.append(relogio() - inicio)
+    total = sum(latencias)
+    latencias.sort()
+    return (len(latencias) / total if total else 0.0, _percentil(latencias, 50),
+            _percentil(latencias, 99), resultado)
+
+
+def _pico_de_memoria(implementacao, ordem):
+    tracemalloc.start()
+    arvore = implementacao.criar()
+    for chave in ordem:
+        arvore = implementacao.inserir(arvore, chave)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico
+
+
+def executar_carga(implementacao, n, carga, semente):
+    """Roda todas as fases de uma carga numa implementação e retorna as linhas de resultado."""
+    rng = random.Random(f"{semente}:{carga}:{n}")
+    chaves = rng.sample(range(n * 10), n)
+    ordem = ordem_de_insercao(chaves, carga, rng)
+    # metade das buscas acerta, metade procura chaves que não estão na árvore
+    consultas = [rng.choice(chaves) if i % 2 else rng.randrange(n * 10) for i in range(n)]
+    intervalos = [(inicio, inicio + 1000) for inicio in (rng.randrange(n * 10) for _ in range(max(1, n // 100)))]
+    remocoes = rng.sample(chaves, n)
+
+    estado = {"arvore": implementacao.criar()}
+
+    def inserir(chave):
+        estado["arvore"] = implementacao.inserir(estado["arvore"], chave)
+
+    def deletar(chave):
+        estado["arvore"] = implementacao.deletar(estado["arvore"], chave)
+
+    fases = [("inserir", inserir, ordem),
+             ("buscar", lambda chave: implementacao.buscar(estado["arvore"], chave), consultas)]
+    if implementacao.intervalo is not None:
+        fases.append(("intervalo", lambda limites: implementacao.intervalo(estado["arvore"], *limites), intervalos))
+    if implementacao.percorrer is not None:
+        fases.append(("percorrer", lambda _: implementacao.percorrer(estado["arvore"]), range(3)))
+    if implementacao.deletar is not None:
+        fases.append(("deletar", deletar, remocoes))
+
+    pico = _pico_de_memoria(implementacao, ordem)
+    linhas = []
+    for fase, operacao, argumentos in fases:
+        ops, p50, p99, resultado = _medir(operacao, argumentos)
+        if fase == "percorrer":
+            assert list(resultado) == sorted(chaves), f"{implementacao.nome}: percurso fora de ordem"
+            ops *= n  # chaves percorridas por segundo
+        linhas.append({
+            "implementacao": implementacao.nome,
+            "carga": carga,
+            "fase": fase,
+            "n": n,
+            "ops_por_segundo": ops,
+            "p50": p50,
+            "p99": p99,
+            "pico_memoria": pico,
+        })
+    return linhas
+
+
+def executar(tamanhos, semente=0, implementacoes=None, cargas=CARGAS, progresso=None):
+    """
+    Roda a suíte e retorna {"meta": ..., "resultados": [linhas], "pulados": [...]}.
+    implementacoes filtra pelos nomes; progresso(texto) é chamado antes de cada carga.
+    """
+    escolhidas = [imp for imp in IMPLEMENTACOES if implementacoes is None or imp.nome in implementacoes]
+    resultados = []
+    pulados = []
+    for n in tamanhos:
+        for implementacao in escolhidas:
+            for carga in cargas:
+                degenerada = carga in ("ordenada", "inversa")
+                if degenerada and implementacao.limite_degenerado is not None and n > implementacao.limite_degenerado:
+                    pulados.append({"implementacao": implementacao.nome, "carga": carga, "n": n})
+                    continue
+                if progresso is not None:
+                    progresso(f"{implementacao.nome} / {carga} / n={n}")
+                resultados.extend(executar_carga(implementacao, n, carga, semente))
+    return {
+        "meta": {
+            "tamanhos": list(tamanhos),
+            "semente": semente,
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "resultados": resultados,
+        "pulados": pulados,
+    }
+
+
+# ===============================================================
+# COMPARAÇÃO COM BASELINE
+# ===============================================================
+
+def _chave_linha(linha):
+    return linha["implementacao"], linha["carga"], linha["fase"], linha["n"]
+
+
+def comparar(atual, baseline, limite):
+    """
+    Compara ops/s linha a linha com o baseline. Retorna a lista de regressões: linhas
+    cuja vazão caiu mais que a fração limite (0.2 = 20% mais lenta), com as duas medidas.
+    Linhas sem correspondente no baseline são ignoradas.
+    """
+    anteriores = {_chave_linha(linha): linha for linha in baseline["resultados"]}
+    regressoes = []
+    for linha in atual["resultados"]:
+        anterior = anteriores.get(_chave_linha(linha))
+        if anterior is None or not anterior["ops_por_segundo"]:
+            continue
+        razao = linha["ops_por_segundo"] / anterior["ops_por_segundo"]
+        if razao < 1 - limite:
+            regressoes.append({**linha, "ops_por_segundo_baseline": anterior["ops_por_segundo"], "razao": razao})
+    return regressoes
@@ -0,0 +1,68 @@
+"""
+Travessias da BinaryTree: listas concatenadas (versão antiga) contra os geradores.
+Uso: python -m benchmarks.travessias [n]   (padrão: 10^5)
+"""
+
+import random
+import sys
+import tracemalloc
+from itertools import islice
+
+from atividade_3 import BinaryTree
+from benchmarks import cronometrar
+
+
+# versões antigas, que montavam a lista com esquerda + [valor] + direita em cada nó
+def inorder_antigo(node):
+    if node is None:
+        return []
+    return inorder_antigo(node.left) + [node.valor] + inorder_antigo(node.right)
+
+
+def preorder_antigo(node):
+    if node is None:
+        return []
+    return [node.valor] + preorder_antigo(node.left) + preorder_antigo(node.right)
+
+
+def postorder_antigo(node):
+    if node is None:
+        return []
+    return postorder_antigo(node.left) + postorder_antigo(node.right) + [node.valor]
+
+
+def pico_de_memoria(funcao):
+    tracemalloc.start()
+    funcao()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**5
+    arvore = BinaryTree()
+    for v in random.sample(range(n * 10), n):
+        arvore.insert(v)
+
+    print(f"n={n}")
+    print(f"{'travessia':<10} | {'lista antiga (s)':>16} | {'gerador (s)':>11} | {'primeiros 10 (s)':>16} | {'pico antiga':>11} | {'pico gerador':>12}")
+    casos = (
+        ("inorder", inorder_antigo, arvore.iter_inorder),
+        ("preorder", preorder_antigo, arvore.iter_preorder),
+        ("postorder", postorder_antigo, arvore.iter_postorder),
+    )
+    for nome, antigo, gerador in casos:
+        t_antigo, lista = cronometrar(antigo, arvore.root)
+        t_novo, nova = cronometrar(lambda: list(gerador()))
+        assert lista == nova
+        t_k, _ = cronometrar(lambda: list(islice(gerador(), 10)))
+        # pico medido consumindo o gerador sem materializar a lista
+        pico_antigo = pico_de_memoria(lambda: antigo(arvore.root))
+        pico_novo = pico_de_memoria(lambda: sum(1 for _ in gerador()))
+        print(f"{nome:<10} | {t_antigo:>16.3f} | {t_novo:>11.3f} | {t_k:>16.6f} | "
+              f"{pico_antigo / 2**20:>8.1f} MB | {pico_novo / 2**10:>9.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
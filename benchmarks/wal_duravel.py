@@ -0,0 +1,57 @@
+"""
+ArvoreAVLDuravel: vazão de mutações por política de fsync e tempo de recuperação
+em função do tamanho do log.
+Uso: python -m benchmarks.wal_duravel [n1 n2 ...]   (tamanhos do log; padrão: 10^3 10^4 10^5 10^6)
+"""
+
+import os
+import random
+import tempfile
+
+from avl_wal import ArvoreAVLDuravel, POLITICAS
+from benchmarks import cronometrar, tamanhos_da_linha_de_comando
+
+OPERACOES_POR_POLITICA = {"sempre": 2000, "lote": 50000, "intervalo": 50000, "nunca": 50000}
+
+
+def aplicar(arvore, chaves):
+    for i, chave in enumerate(chaves):
+        # uma remoção a cada quatro operações, de uma chave inserida antes
+        if i % 4 == 3:
+            arvore.deletar(chaves[i - 1])
+        else:
+            arvore.inserir(chave)
+    arvore.sincronizar()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as pasta:
+        print(f"{'política':<10} | {'operações':>9} | {'ops/s':>10}")
+        for politica in POLITICAS:
+            n = OPERACOES_POR_POLITICA[politica]
+            chaves = random.sample(range(n * 10), n)
+            with ArvoreAVLDuravel(os.path.join(pasta, politica), politica) as arvore:
+                segundos, _ = cronometrar(aplicar, arvore, chaves)
+            print(f"{politica:<10} | {n:>9} | {n / segundos:>10.0f}")
+
+        print()
+        print(f"{'log (ops)':>9} | {'recuperação (s)':>15} | {'após checkpoint (s)':>19} | {'log (MB)':>8}")
+        for n in tamanhos_da_linha_de_comando([10**3, 10**4, 10**5, 10**6]):
+            destino = os.path.join(pasta, f"recuperacao_{n}")
+            chaves = random.sample(range(n * 10), n)
+            with ArvoreAVLDuravel(destino, "nunca", tamanho_lote=4096) as arvore:
+                aplicar(arvore, chaves)
+                esperado = arvore.percurso_em_ordem()
+            tamanho = os.path.getsize(os.path.join(destino, "wal.log")) / 2**20
+            t_log, recuperada = cronometrar(ArvoreAVLDuravel, destino)
+            assert recuperada.percurso_em_ordem() == esperado
+            recuperada.checkpoint()
+            recuperada.close()
+            t_checkpoint, recuperada = cronometrar(ArvoreAVLDuravel, destino)
+            assert recuperada.percurso_em_ordem() == esperado
+            recuperada.close()
+            print(f"{n:>9} | {t_log:>15.3f} | {t_checkpoint:>19.3f} | {tamanho:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
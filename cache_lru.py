@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Cache LRU limitado para buscas pontuais (chave -> valor) na frente das árvores.
+
+Só guarda chaves encontradas, então inserir uma chave nova nunca deixa o cache
+desatualizado; quem usa precisa chamar invalidar() ao remover uma chave ou trocar
+o valor dela. Acertos e faltas são contados para medir a eficácia do cache.
+"""
+
+from collections import OrderedDict
+
+AUSENTE = object()  # marcador de "não está no cache" (None pode ser um valor válido)
+
+
+class CacheLRU:
+    """
+    Guarda até capacidade pares chave -> valor; ao passar do limite descarta o usado
+    há mais tempo.
+    """
+    def __init__(self, capacidade):
+        if capacidade <= 0:
+            raise ValueError(f"A capacidade do cache deve ser positiva: {capacidade}")
+        self.capacidade = capacidade
+        self._itens = OrderedDict()
+        self.acertos = 0
+        self.faltas = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def buscar(self, chave):
+        """Retorna o valor guardado (e o marca como recente) ou AUSENTE."""
+        valor = self._itens.get(chave, AUSENTE)
+        if valor is AUSENTE:
+            self.faltas += 1
+        else:
+            self.acertos += 1
+            self._itens.move_to_end(chave)
+        return valor
+
+    def guardar(self, chave, valor):
+        self._itens[chave] = valor
+        self._itens.move_to_end(chave)
+        if len(self._itens) > self.capacidade:
+            self._itens.popitem(last=False)
+
+    def invalidar(self, chave):
+        self._itens.pop(chave, None)
+
+    def limpar(self):
+        self._itens.clear()
+
+    def estatisticas(self):
+        """Retorna acertos, faltas, taxa de acerto e ocupação do cache."""
+        total = self.acertos + self.faltas
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "taxa_acerto": self.acertos / total if total else 0.0,
+            "tamanho": len(self._itens),
+            "capacidade": self.capacidade,
+        }
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentação opcional das árvores (ArvoreAVL, MapaAVL, BinarySearchTree,
+SplayTree, BinaryTree...): comparações de chave, nós visitados, rotações simples e
+duplas, e histogramas de latência por tipo de operação.
+
+instrumentar(arvore) troca, só naquela instância, os métodos públicos por versões
+medidas; desinstrumentar(arvore) devolve os originais. As classes nunca são
+alteradas, então uma árvore sem instrumentação executa exatamente o mesmo código de
+antes (custo zero quando desligada).
+
+Como a contagem é feita sem tocar nos laços das árvores:
+- comparações: a chave da consulta é envolvida numa ChaveContada, que conta cada
+  comparação feita com ela; nós visitados são os nós distintos cuja chave foi
+  comparada. A ChaveContada nunca chega a inserir/deletar (senão ficaria guardada
+  nos nós): nessas operações as comparações vêm de uma descida de busca com a chave
+  envolvida, fora do tempo medido, e a operação recebe a chave original;
+- rotações: _rotacao_direita/_rotacao_esquerda são contadas, e _balancear
+  classifica o rebalanceamento como simples (1 rotação) ou duplo (2 rotações).
+  A SplayTree rotaciona dentro do próprio splay e não tem esses métodos.
+
+Cada operação gera um evento (dict) entregue aos ouvintes registrados com
+adicionar_ouvinte; exportar_jsonl cria um ouvinte que grava os eventos em JSON Lines.
+"""
+
+import json
+import time
+from bisect import bisect_left
+
+# método -> tipo de operação, para as duas famílias de nomes usadas no repositório
+OPERACOES = {
+    "inserir": "insert", "insert": "insert",
+    "deletar": "delete", "delete": "delete",
+    "obter_profundidade_no": "search", "search": "search", "depth": "search",
+    "encontrar_nos_intervalo": "range", "contar_intervalo": "range",
+}
+_MUTACOES = ("insert", "delete")
+_ROTACOES = ("_rotacao_direita", "_rotacao_esquerda")
+
+# limites superiores (segundos) das faixas dos histogramas: 1 µs a ~1 s em potências de 2
+LIMITES_PADRAO = tuple(1e-6 * 2 ** i for i in range(21))
+
+
+class _Medicao:
+    """Contadores da operação em andamento."""
+    __slots__ = ("comparacoes", "visitados", "rotacoes_simples", "rotacoes_duplas", "rotacoes")
+
+    def __init__(self):
+        self.comparacoes = 0
+        self.visitados = set()
+        self.rotacoes_simples = 0
+        self.rotacoes_duplas = 0
+        self.rotacoes = 0
+
+
+class ChaveContada:
+    """Envolve a chave de uma consulta e conta as comparações feitas com ela."""
+    __slots__ = ("chave", "medicao")
+
+    def __init__(self, chave, medicao):
+        self.chave = chave
+        self.medicao = medicao
+
+    def _outra(self, outra):
+        if isinstance(outra, ChaveContada):
+            outra = outra.chave
+        medicao = self.medicao
+        if medicao is not None:
+            medicao.comparacoes += 1
+            medicao.visitados.add(id(outra))
+        return outra
+
+    def __lt__(self, outra):
+        return self.chave < self._outra(outra)
+
+    def __le__(self, outra):
+        return self.chave <= self._outra(outra)
+
+    def __gt__(self, outra):
+        return self.chave > self._outra(outra)
+
+    def __ge__(self, outra):
+        return self.chave >= self._outra(outra)
+
+    def __eq__(self, outra):
+        return self.chave == self._outra(outra)
+
+    def __ne__(self, outra):
+        return self.chave != self._outra(outra)
+
+    def __hash__(self):
+        return hash(self.chave)
+
+    def __repr__(self):
+        return repr(self.chave)
+
+    def __format__(self, especificacao):
+        return format(self.chave, especificacao)
+
+
+class Histograma:
+    """Histograma de latências com faixas fixas (limites superiores em segundos)."""
+    def __init__(self, limites=LIMITES_PADRAO):
+        self.limites = tuple(limites)
+        self.contagens = [0] * (len(self.limites) + 1)  # a última faixa é "acima do maior limite"
+        self.total = 0
+        self.soma = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, segundos):
+        self.contagens[bisect_left(self.limites, segundos)] += 1
+        self.total += 1
+        self.soma += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def percentil(self, p):
+        """Limite superior da faixa que contém o percentil p (0 a 100)."""
+        if not self.total:
+            return 0.0
+        alvo = self.total * p / 100
+        acumulado = 0
+        for i, contagem in enumerate(self.contagens):
+            acumulado += contagem
+            if acumulado >= alvo and contagem:
+                return self.limites[i] if i < len(self.limites) else self.maximo
+        return self.maximo
+
+    def resumo(self):
+        return {
+            "operacoes": self.total,
+            "latencia_media": self.soma / self.total if self.total else 0.0,
+            "p50": self.percentil(50),
+            "p99": self.percentil(99),
+            "latencia_maxima": self.maximo,
+        }
+
+
+class Instrumentacao:
+    """
+    Acumula as métricas de uma ou mais árvores instrumentadas e repassa um evento por
+    operação aos ouvintes.
+    """
+    def __init__(self, limites=LIMITES_PADRAO):
+        self.limites = limites
+        self._ouvintes = []
+        self.zerar()
+
+    def zerar(self):
+        self.histogramas = {}
+        self.comparacoes = {}
+        self.nos_visitados = {}
+        self.rotacoes_simples = 0
+        self.rotacoes_duplas = 0
+
+    def adicionar_ouvinte(self, ouvinte):
+        """ouvinte(evento) é chamado depois de cada operação medida."""
+        self._ouvintes.append(ouvinte)
+
+    def remover_ouvinte(self, ouvinte):
+        self._ouvintes.remove(ouvinte)
+
+    def _registrar(self, metodo, operacao, segundos, medicao, erro):
+        if operacao not in self.histogramas:
+            self.histogramas[operacao] = Histograma(self.limites)
+            self.comparacoes[operacao] = 0
+            self.nos_visitados[operacao] = 0
+        self.histogramas[operacao].registrar(segundos)
+        self.comparacoes[operacao] += medicao.comparacoes
+        self.nos_visitados[operacao] += len(medicao.visitados)
+        self.rotacoes_simples += medicao.rotacoes_simples
+        self.rotacoes_duplas += medicao.rotacoes_duplas
+        if self._ouvintes:
+            evento = {
+                "operacao": operacao,
+                "metodo": metodo,
+                "segundos": segundos,
+                "comparacoes": medicao.comparacoes,
+                "nos_visitados": len(medicao.visitados),
+                "rotacoes_simples": medicao.rotacoes_simples,
+                "rotacoes_duplas": medicao.rotacoes_duplas,
+                "erro": erro,
+            }
+            for ouvinte in self._ouvintes:
+                ouvinte(evento)
+
+    def resumo(self):
+        """Latências, comparações e nós visitados (médias por operação) e rotações."""
+        operacoes = {}
+        for operacao, histograma in self.histogramas.items():
+            dados = histograma.resumo()
+            total = histograma.total or 1
+            dados["comparacoes_media"] = self.comparacoes[operacao] / total
+            dados["nos_visitados_media"] = self.nos_visitados[operacao] / total
+            operacoes[operacao] = dados
+        return {
+            "operacoes": operacoes,
+            "rotacoes_simples": self.rotacoes_simples,
+            "rotacoes_duplas": self.rotacoes_duplas,
+        }
+
+
+def exportar_jsonl(arquivo):
+    """Retorna um ouvinte que escreve cada evento como uma linha JSON no arquivo aberto."""
+    def ouvinte(evento):
+        arquivo.write(json.dumps(evento) + "\n")
+    return ouvinte
+
+
+def instrumentar(arvore, instrumentacao=None):
+    """
+    Liga a instrumentação na árvore e retorna o objeto Instrumentacao que acumula as
+    métricas (um novo, se nenhum for passado; um mesmo objeto pode medir várias árvores).
+    """
+    if "_instrumentacao" in vars(arvore):
+        raise ValueError("Árvore já instrumentada; chame desinstrumentar antes")
+    descer = _descida(arvore)
+    if descer is None:
+        raise TypeError(f"instrumentar não suporta {type(arvore).__name__}: a árvore precisa de "
+                        "obter_profundidade_no, depth ou nós com root/valor/left/right")
+    instrumentacao = instrumentacao if instrumentacao is not None else Instrumentacao()
+    estado = {"medicao": None}
+
+    nomes = [nome for nome in OPERACOES if hasattr(arvore, nome)]
+    for nome in nomes:
+        setattr(arvore, nome, _medir(getattr(arvore, nome), nome, instrumentacao, estado, descer))
+    if all(hasattr(arvore, nome) for nome in _ROTACOES + ("_balancear",)):
+        for nome in _ROTACOES:
+            setattr(arvore, nome, _contar_rotacao(getattr(arvore, nome), estado))
+        setattr(arvore, "_balancear", _classificar_rebalanceamento(arvore._balancear, estado))
+        nomes += list(_ROTACOES) + ["_balancear"]
+    arvore._instrumentacao = (instrumentacao, nomes)
+    return instrumentacao
+
+
+def _descida(arvore):
+    """
+    Busca (o método original, pego antes de instrumentar) usada para contar as
+    comparações de inserir/deletar, ou None se a árvore não tiver nenhuma que sirva.
+    Na família BinarySearchTree é depth, não search: o search da SplayTree reorganiza a árvore.
+    """
+    for nome in ("obter_profundidade_no", "depth"):
+        if hasattr(arvore, nome):
+            return getattr(arvore, nome)
+    if hasattr(arvore, "root"):  # BinaryTree: só nós, sem método de busca
+        def descer(chave):
+            no = arvore.root
+            while no is not None and no.valor != chave:
+                no = no.left if chave < no.valor else no.right
+        return descer
+    return None
+
+
+def desinstrumentar(arvore):
+    """Devolve os métodos originais da classe (custo zero a partir daqui)."""
+    _, nomes = vars(arvore).pop("_instrumentacao")
+    for nome in nomes:
+        delattr(arvore, nome)
+
+
+def _medir(metodo, nome, instrumentacao, estado, descer):
+    operacao = OPERACOES[nome]
+    # nas consultas por intervalo os dois limites são comparados; nas outras, a chave
+    chaves_contadas = 2 if operacao == "range" else 1
+    mutacao = operacao in _MUTACOES
+
+    def medido(*args, **kwargs):
+        if estado["medicao"] is not None:
+            # chamada de dentro de outra operação medida (ex.: pop chama deletar):
+            # a de fora registra tudo
+            return metodo(*args, **kwargs)
+        medicao = estado["medicao"] = _Medicao()
+        envolvidas = [ChaveContada(chave, medicao) for chave in args[:chaves_contadas]]
+        if mutacao:
+            # a chave guardada na árvore tem de ser a original: só a descida de busca
+            # vê a ChaveContada
+            if envolvidas:
+                descer(envolvidas[0])
+            argumentos = args
+        else:
+            argumentos = (*envolvidas, *args[chaves_contadas:])
+        erro = True
+        inicio = time.perf_counter()
+        try:
+            resultado = metodo(*argumentos, **kwargs)
+            erro = False
+        finally:
+            segundos = time.perf_counter() - inicio
+            for chave in envolvidas:
+                chave.medicao = None
+            estado["medicao"] = None
+            instrumentacao._registrar(nome, operacao, segundos, medicao, erro)
+        return resultado
+    return medido
+
+
+def _contar_rotacao(rotacao, estado):
+    def contada(no):
+        medicao = estado["medicao"]
+        if medicao is not None:
+            medicao.rotacoes += 1
+        return rotacao(no)
+    return contada
+
+
+def _classificar_rebalanceamento(balancear, estado):
+    def classificado(no):
+        medicao = estado["medicao"]
+        if medicao is None:
+            return balancear(no)
+        antes = medicao.rotacoes
+        resultado = balancear(no)
+        feitas = medicao.rotacoes - antes
+        if feitas == 1:
+            medicao.rotacoes_simples += 1
+        elif feitas == 2:
+            medicao.rotacoes_duplas += 1
+        return resultado
+    return classificado
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Modo mapa (chave -> valor) da atividade_5.ArvoreAVL.
+
+MapaAVL guarda o valor no próprio nó, então uma única descida responde get/put e
+dispensa o dict paralelo. Opcionalmente um CacheLRU limitado fica na frente das
+buscas pontuais; ele é invalidado exatamente quando uma chave é removida ou tem o
+valor trocado (inserir uma chave nova não afeta nada que esteja no cache).
+"""
+
+from atividade_5 import ArvoreAVL
+from cache_lru import AUSENTE, CacheLRU
+
+
+class MapaAVL(ArvoreAVL):
+    """
+    ArvoreAVL com valores. tamanho_cache > 0 liga o cache LRU de get com esse
+    número de entradas; os contadores ficam em estatisticas_cache().
+    """
+    def __init__(self, tamanho_cache=0):
+        super().__init__()
+        self.cache = CacheLRU(tamanho_cache) if tamanho_cache else None
+
+    def _nova_arvore(self, raiz=None):
+        arvore = super()._nova_arvore(raiz)
+        if self.cache is not None:
+            arvore.cache = CacheLRU(self.cache.capacidade)
+        return arvore
+
+    def _esvaziar(self):
+        super()._esvaziar()
+        if self.cache is not None:
+            self.cache.limpar()
+
+    # ===============================================================
+    # ACESSO POR CHAVE
+    # ===============================================================
+
+    def get(self, chave, padrao=None):
+        """Retorna o valor da chave, ou padrao se ela não existir."""
+        if self.cache is not None:
+            valor = self.cache.buscar(chave)
+            if valor is not AUSENTE:
+                return valor
+        no = self._localizar(chave)
+        if no is None:
+            return padrao
+        if self.cache is not None:
+            self.cache.guardar(chave, no.valor)
+        return no.valor
+
+    def put(self, chave, valor):
+        """Associa o valor à chave, inserindo-a ou trocando o valor anterior (uma descida só)."""
+        no = self._inserir_no(chave, valor)
+        if no is not None:  # chave já existe: só troca o valor
+            no.valor = valor
+            if self.cache is not None:
+                self.cache.invalidar(chave)
+
+    def pop(self, chave, padrao=AUSENTE):
+        """
+        Remove a chave e retorna o valor dela. Se a chave não existir retorna padrao
+        ou, sem padrao, gera KeyError (como dict.pop).
+        """
+        no = self._localizar(chave)
+        if no is None:
+            if padrao is AUSENTE:
+                raise KeyError(chave)
+            return padrao
+        valor = no.valor
+        self.deletar(chave)
+        return valor
+
+    def deletar(self, chave):
+        super().deletar(chave)
+        if self.cache is not None:
+            self.cache.invalidar(chave)
+
+    def aplicar_lote(self, operacoes):
+        operacoes = list(operacoes)
+        erros = super().aplicar_lote(operacoes)
+        if self.cache is not None:
+            for operacao, chave in operacoes:
+                if operacao == "deletar":
+                    self.cache.invalidar(chave)
+        return erros
+
+    def __getitem__(self, chave):
+        valor = self.get(chave, AUSENTE)
+        if valor is AUSENTE:
+            raise KeyError(chave)
+        return valor
+
+    def __setitem__(self, chave, valor):
+        self.put(chave, valor)
+
+    def __delitem__(self, chave):
+        self.pop(chave)
+
+    def __contains__(self, chave):
+        return self._localizar(chave) is not None
+
+    def itens(self):
+        """Gera os pares (chave, valor) em ordem de chave."""
+        pilha = []
+        atual = self.raiz
+        while pilha or atual is not None:
+            while atual is not None:
+                pilha.append(atual)
+                atual = atual.esquerda
+            no = pilha.pop()
+            yield no.chave, no.valor
+            atual = no.direita
+
+    # ===============================================================
+    # VIZINHOS (retornam o par (chave, valor) ou None)
+    # ===============================================================
+
+    def floor(self, chave):
+        """Maior chave <= chave."""
+        return self._vizinho(chave, abaixo=True, inclusivo=True)
+
+    def ceiling(self, chave):
+        """Menor chave >= chave."""
+        return self._vizinho(chave, abaixo=False, inclusivo=True)
+
+    def predecessor(self, chave):
+        """Maior chave < chave."""
+        return self._vizinho(chave, abaixo=True, inclusivo=False)
+
+    def successor(self, chave):
+        """Menor chave > chave."""
+        return self._vizinho(chave, abaixo=False, inclusivo=False)
+
+    def _vizinho(self, chave, abaixo, inclusivo):
+        """
+        Desce um único caminho guardando o melhor candidato visto: abaixo=True procura
+        a maior chave antes de chave, abaixo=False a menor depois dela.
+        """
+        melhor = None
+        atual = self.raiz
+        while atual is not None:
+            if inclusivo and atual.chave == chave:
+                return atual.chave, atual.valor
+            if (atual.chave < chave) if abaixo else (atual.chave > chave):
+                melhor = atual
+                atual = atual.direita if abaixo else atual.esquerda
+            else:
+                atual = atual.esquerda if abaixo else atual.direita
+        return None if melhor is None else (melhor.chave, melhor.valor)
+
+    # ===============================================================
+    # CACHE
+    # ===============================================================
+
+    def estatisticas_cache(self):
+        """Acertos, faltas e taxa de acerto do cache (None se ele estiver desligado)."""
+        return None if self.cache is None else self.cache.estatisticas()
+
+    # ===============================================================
+    # SNAPSHOT BINÁRIO
+    # ===============================================================
+
+    def salvar(self, caminho):
+        """
+        O formato de snapshot_binario guarda só as chaves; gravar um mapa perderia os
+        valores, então gera TypeError (use ArvoreAVL para snapshots de conjuntos).
+        """
+        raise TypeError("O snapshot binário não guarda os valores de um MapaAVL")
+
+    @classmethod
+    def carregar(cls, caminho, somente_leitura=False):
+        """Como salvar: um snapshot binário não tem os valores para montar um mapa."""
+        raise TypeError("O snapshot binário não guarda os valores de um MapaAVL; use ArvoreAVL.carregar")
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor asyncio (TCP ou socket Unix) na frente de uma atividade_5.ArvoreAVL.
+
+Protocolo de linhas (texto, uma requisição e uma resposta por linha; comandos sem
+diferença entre maiúsculas e minúsculas; chaves inteiras ou float finitas):
+
+    INSERT k     -> OK            (ERR ... se a chave já existir)
+    DELETE k     -> OK
+    SEARCH k     -> 1 ou 0
+    DEPTH k      -> profundidade (-1 se não existir)
+    RANGE a b    -> chaves de [a, b] separadas por espaço (linha vazia se nenhuma)
+
+Linhas malformadas (comando ou chave inválida, nan/inf, texto que não é UTF-8, linha
+maior que o limite do StreamReader) recebem ERR ... e a conexão continua.
+
+Os clientes podem mandar várias requisições sem esperar as respostas (pipelining);
+as respostas de cada conexão saem sempre na ordem das requisições.
+
+Tudo o que chega numa mesma volta do event loop vira um lote: a primeira requisição
+agenda o processamento com call_soon, e as que forem lidas antes dele (de qualquer
+conexão) entram no mesmo lote. O lote é aplicado na árvore ordenado por chave
+(ordenação estável: pedidos da mesma chave mantêm a ordem de chegada). RANGE e DEPTH
+dependem de outras chaves além da pedida, então funcionam como barreiras: nunca
+enxergam escritas que chegaram depois deles nem deixam de ver as que chegaram antes.
+As respostas de cada conexão são escritas numa única chamada por lote.
+
+Uso: python servidor_avl.py [--host H] [--porta P | --unix CAMINHO] [--precarregar N]
+"""
+
+import argparse
+import asyncio
+import math
+import random
+
+from atividade_5 import ArvoreAVL
+
+LIMITE_BUFFER_ESCRITA = 1 << 20  # acima disso a leitura da conexão espera o cliente consumir
+
+
+def _chave(texto):
+    try:
+        return int(texto)
+    except ValueError:
+        valor = float(texto)
+    # nan não é igual a nada (nem a si mesmo) e quebraria as comparações da árvore
+    if not math.isfinite(valor):
+        raise ValueError(f"chave não finita: {texto}")
+    return valor
+
+
+async def _ler_linha(reader):
+    """
+    Próxima linha da conexão (b"" quando ela acaba). Uma linha maior que o limite
+    do StreamReader é lida e descartada inteira, até o fim da linha, e vira None.
+    """
+    longa = False
+    while True:
+        try:
+            linha = await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as erro:  # conexão fechada sem \n no fim
+            linha = erro.partial
+        except asyncio.LimitOverrunError as erro:
+            await reader.readexactly(erro.consumed)
+            longa = True
+            continue
+        return None if longa else linha
+
+
+class _Conexao:
+    """Respostas pendentes de uma conexão, na ordem das requisições."""
+    __slots__ = ("writer", "respostas")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.respostas = []  # cada item é uma lista [texto ou None]
+
+
+class ServidorAVL:
+    """
+    Atende o protocolo de linhas sobre uma ArvoreAVL (uma nova, se nenhuma for passada).
+    A árvore só é tocada pelo event loop, então não precisa de trava.
+    """
+    COMANDOS = {"INSERT": 1, "DELETE": 1, "SEARCH": 1, "DEPTH": 1, "RANGE": 2}
+    BARREIRAS = ("RANGE", "DEPTH")
+
+    def __init__(self, arvore=None):
+        self.arvore = arvore if arvore is not None else ArvoreAVL()
+        self._lote = []
+        self._servidor = None
+        self.requisicoes = 0
+        self.lotes = 0
+        self.maior_lote = 0
+
+    async def iniciar(self, host="127.0.0.1", porta=0, caminho_unix=None):
+        """Começa a escutar; retorna o endereço (host, porta) ou o caminho do socket Unix."""
+        if caminho_unix is not None:
+            self._servidor = await asyncio.start_unix_server(self._atender, caminho_unix)
+            return caminho_unix
+        self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self._servidor.sockets[0].getsockname()[:2]
+
+    async def encerrar(self):
+        self._servidor.close()
+        await self._servidor.wait_closed()
+
+    async def servir_para_sempre(self):
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    def estatisticas(self):
+        return {
+            "requisicoes": self.requisicoes,
+            "lotes": self.lotes,
+            "tamanho_medio_lote": self.requisicoes / self.lotes if self.lotes else 0.0,
+            "maior_lote": self.maior_lote,
+        }
+
+    # ===============================================================
+    # CONEXÕES
+    # ===============================================================
+
+    async def _atender(self, reader, writer):
+        conexao = _Conexao(writer)
+        try:
+            while True:
+                linha = await _ler_linha(reader)
+                if linha is None:
+                    self._responder(conexao, "ERR linha longa demais")
+                    continue
+                if not linha:
+                    break
+                self._receber(conexao, linha)
+                if writer.transport.get_write_buffer_size() > LIMITE_BUFFER_ESCRITA:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _receber(self, conexao, linha):
+        """Interpreta uma linha e põe a requisição no lote da volta atual do loop."""
+        try:
+            texto = linha.decode()
+        except UnicodeDecodeError:
+            self._responder(conexao, "ERR requisição não é UTF-8")
+            return
+        partes = texto.split()
+        if not partes:
+            self._responder(conexao, "ERR requisição vazia")
+            return
+        comando = partes[0].upper()
+        if self.COMANDOS.get(comando) != len(partes) - 1:
+            self._responder(conexao, f"ERR comando inválido: {texto.strip()}")
+            return
+        try:
+            argumentos = [_chave(parte) for parte in partes[1:]]
+        except ValueError:
+            self._responder(conexao, f"ERR chave inválida: {texto.strip()}")
+            return
+        slot = [None]
+        conexao.respostas.append(slot)
+        if not self._lote:
+            asyncio.get_running_loop().call_soon(self._processar_lote)
+        self._lote.append((argumentos[0], comando, argumentos, conexao, slot))
+
+    def _responder(self, conexao, texto):
+        """Resposta imediata (erros de protocolo), na vez dela na fila da conexão."""
+        conexao.respostas.append([texto])
+        self._descarregar(conexao)
+
+    def _descarregar(self, conexao):
+        """Escreve, numa chamada só, as respostas prontas do começo da fila da conexão."""
+        respostas = conexao.respostas
+        prontas = 0
+        while prontas < len(respostas) and respostas[prontas][0] is not None:
+            prontas += 1
+        if prontas:
+            texto = "".join(slot[0] + "\n" for slot in respostas[:prontas])
+            del respostas[:prontas]
+            if not conexao.writer.is_closing():
+                conexao.writer.write(texto.encode())
+
+    # ===============================================================
+    # LOTES
+    # ===============================================================
+
+    def _processar_lote(self):
+        lote = self._lote
+        self._lote = []
+        self.requisicoes += len(lote)
+        self.lotes += 1
+        self.maior_lote = max(self.maior_lote, len(lote))
+
+        # trechos de operações que comutam entre chaves diferentes, separados pelas
+        # barreiras; cada trecho é aplicado em ordem de chave
+        inicio = 0
+        for i, pedido in enumerate(lote):
+            if pedido[1] in self.BARREIRAS:
+                self._aplicar_trecho(lote[inicio:i])
+                self._aplicar(pedido)
+                inicio = i + 1
+        self._aplicar_trecho(lote[inicio:])
+
+        conexoes = {id(pedido[3]): pedido[3] for pedido in lote}
+        for conexao in conexoes.values():
+            self._descarregar(conexao)
+
+    def _aplicar_trecho(self, trecho):
+        trecho.sort(key=lambda pedido: pedido[0])
+        for pedido in trecho:
+            self._aplicar(pedido)
+
+    def _aplicar(self, pedido):
+        _, comando, argumentos, _, slot = pedido
+        arvore = self.arvore
+        try:
+            if comando == "SEARCH":
+                slot[0] = "1" if arvore.obter_profundidade_no(argumentos[0]) != -1 else "0"
+            elif comando == "DEPTH":
+                slot[0] = str(arvore.obter_profundidade_no(argumentos[0]))
+            elif comando == "INSERT":
+                arvore.inserir(argumentos[0])
+                slot[0] = "OK"
+            elif comando == "DELETE":
+                arvore.deletar(argumentos[0])
+                slot[0] = "OK"
+            else:
+                slot[0] = " ".join(map(str, arvore.encontrar_nos_intervalo(*argumentos)))
+        except Exception as erro:  # a resposta leva o erro; o servidor continua
+            slot[0] = f"ERR {erro}"
+
+
+async def _principal(args):
+    arvore = None
+    if args.precarregar:
+        rng = random.Random(args.semente)
+        arvore = ArvoreAVL.from_iterable(rng.sample(range(args.precarregar * 10), args.precarregar))
+    servidor = ServidorAVL(arvore)
+    endereco = await servidor.iniciar(args.host, args.porta, args.unix)
+    if args.unix:
+        print(f"escutando em {endereco}", flush=True)
+    else:
+        print(f"escutando em {endereco[0]}:{endereco[1]}", flush=True)
+    await servidor.servir_para_sempre()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor asyncio de uma ArvoreAVL.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=7878, help="0 escolhe uma porta livre")
+    parser.add_argument("--unix", metavar="CAMINHO", help="escuta num socket Unix em vez de TCP")
+    parser.add_argument("--precarregar", type=int, default=0, metavar="N",
+                        help="começa com N chaves aleatórias de range(10 * N)")
+    parser.add_argument("--semente", type=int, default=0)
+    try:
+        asyncio.run(_principal(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Formato binário de snapshot das árvores de busca, com leitura zero-copy via mmap.
+
+Layout do arquivo (little-endian):
+    cabeçalho  magic "ARVB", versão (u16), typecode das chaves ('q' ou 'd'),
+               reservado (u8), número de nós (i64), índice da raiz (i64)
+    chaves     n valores de 8 bytes (int64 ou float64)
+    esquerda   n índices int32 do filho esquerdo (-1 = nenhum)
+    direita    n índices int32 do filho direito (-1 = nenhum)
+
+Os nós são numerados em pré-ordem, então a raiz é o índice 0 e todo filho tem
+índice maior que o do pai; a forma da árvore (e portanto a profundidade de cada
+chave) é preservada. ArvoreMapeada responde buscas direto do buffer mapeado, sem
+criar nós Python: abrir o arquivo custa o mesmo para qualquer tamanho de árvore.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"ARVB"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sHccqq")
+NULO = -1
+
+
+def _little_endian(arr):
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def _tipo_das_chaves(chaves):
+    """Typecode do array para as chaves: 'q' se todas são int, 'd' se todas são float."""
+    tipos = set(map(type, chaves))
+    if tipos <= {int, bool}:
+        return "q"
+    if tipos == {float}:
+        return "d"
+    if not tipos - {int, bool, float}:
+        raise TypeError("Chaves misturam int e float; o formato binário guarda um único tipo")
+    nomes = ", ".join(sorted(t.__name__ for t in tipos - {int, bool, float}))
+    raise TypeError(f"Tipo de chave não suportado no formato binário: {nomes}")
+
+
+def salvar_arvore(raiz, caminho, filhos, chave):
+    """
+    Grava a árvore em caminho. filhos(no) retorna (esquerdo, direito) e chave(no) a
+    chave do nó; as chaves devem ser todas inteiros de 64 bits ou todas floats
+    (TypeError caso contrário, antes de escrever o arquivo).
+    Retorna o número de nós gravados.
+    """
+    lista = []
+    esquerda = array("i")
+    direita = array("i")
+    # pré-ordem iterativa: (nó, índice do pai, é filho esquerdo?)
+    pilha = [(raiz, NULO, False)] if raiz is not None else []
+    while pilha:
+        no, pai, eh_esquerdo = pilha.pop()
+        indice = len(lista)
+        lista.append(chave(no))
+        esquerda.append(NULO)
+        direita.append(NULO)
+        if pai != NULO:
+            (esquerda if eh_esquerdo else direita)[pai] = indice
+        filho_esquerdo, filho_direito = filhos(no)
+        if filho_direito is not None:
+            pilha.append((filho_direito, indice, False))
+        if filho_esquerdo is not None:
+            pilha.append((filho_esquerdo, indice, True))
+
+    tipo = _tipo_das_chaves(lista)
+    try:
+        chaves = array(tipo, lista)
+    except OverflowError:
+        fora = next(c for c in lista if not -2**63 <= c < 2**63)
+        raise ValueError(f"Chave não cabe no formato binário ({tipo}): {fora!r}") from None
+    n = len(chaves)
+    with open(caminho, "wb") as f:
+        f.write(CABECALHO.pack(MAGIC, VERSAO, tipo.encode(), b"\0", n, 0 if n else NULO))
+        for arr in (chaves, esquerda, direita):
+            _little_endian(arr).tofile(f)
+    return n
+
+
+def _ler_cabecalho(buffer, caminho):
+    if len(buffer) < CABECALHO.size:
+        raise ValueError(f"Arquivo de snapshot truncado: {caminho}")
+    magic, versao, tipo, _, n, raiz = CABECALHO.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"Arquivo não é um snapshot de árvore: {caminho}")
+    if versao != VERSAO:
+        raise ValueError(f"Versão de snapshot não suportada: {versao}")
+    tipo = tipo.decode()
+    if len(buffer) < CABECALHO.size + n * 16:
+        raise ValueError(f"Arquivo de snapshot truncado: {caminho}")
+    return tipo, n, raiz
+
+
+def ler_arvore(caminho):
+    """
+    Lê o snapshot inteiro para a memória.
+    Retorna (chaves, esquerda, direita, raiz), com arrays indexados em pré-ordem.
+    """
+    with open(caminho, "rb") as f:
+        dados = f.read()
+    tipo, n, raiz = _ler_cabecalho(dados, caminho)
+    inicio = CABECALHO.size
+    chaves = array(tipo)
+    chaves.frombytes(dados[inicio:inicio + 8 * n])
+    inicio += 8 * n
+    esquerda = array("i")
+    esquerda.frombytes(dados[inicio:inicio + 4 * n])
+    inicio += 4 * n
+    direita = array("i")
+    direita.frombytes(dados[inicio:inicio + 4 * n])
+    return _little_endian(chaves), _little_endian(esquerda), _little_endian(direita), raiz
+
+
+class _VisaoLittleEndian:
+    """
+    Acesso por índice a um array little-endian do buffer em hosts big-endian, onde
+    memoryview.cast leria os bytes na ordem nativa. Cada leitura usa struct com
+    formato '<' explícito; continua sem copiar o arquivo.
+    """
+    def __init__(self, visao, tipo):
+        self._visao = visao
+        self._formato = struct.Struct("<" + tipo)
+
+    def __getitem__(self, i):
+        return self._formato.unpack_from(self._visao, i * self._formato.size)[0]
+
+    def release(self):
+        self._visao.release()
+
+
+def _visao_do_array(visao, tipo):
+    if sys.byteorder == "little":
+        return visao.cast(tipo)
+    return _VisaoLittleEndian(visao, tipo)
+
+
+class ArvoreMapeada:
+    """
+    Árvore somente leitura servida direto de um snapshot mapeado em memória.
+    Oferece as consultas da ArvoreAVL (obter_profundidade_no, encontrar_nos_intervalo,
+    percurso_em_ordem) e da BinarySearchTree (search, depth).
+    """
+    def __init__(self, caminho):
+        self._arquivo = open(caminho, "rb")
+        try:
+            self._mmap = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # arquivo vazio não pode ser mapeado
+            self._arquivo.close()
+            raise ValueError(f"Arquivo de snapshot truncado: {caminho}") from None
+        tipo, n, self.raiz = _ler_cabecalho(self._mmap, caminho)
+        self._n = n
+        visao = memoryview(self._mmap)
+        inicio = CABECALHO.size
+        self._chaves = _visao_do_array(visao[inicio:inicio + 8 * n], tipo)
+        inicio += 8 * n
+        self._esq = _visao_do_array(visao[inicio:inicio + 4 * n], "i")
+        inicio += 4 * n
+        self._dir = _visao_do_array(visao[inicio:inicio + 4 * n], "i")
+
+    def close(self):
+        for visao in (self._chaves, self._esq, self._dir):
+            visao.release()
+        self._mmap.close()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    def obter_profundidade_no(self, chave):
+        """Profundidade (raiz = 0) da chave no snapshot, ou -1 se não existir."""
+        chaves, esq, dir_ = self._chaves, self._esq, self._dir
+        nivel = 0
+        atual = self.raiz
+        while atual != NULO:
+            if chave == chaves[atual]:
+                return nivel
+            elif chave < chaves[atual]:
+                atual = esq[atual]
+            else:
+                atual = dir_[atual]
+            nivel += 1
+        return -1
+
+    def depth(self, valor):
+        return self.obter_profundidade_no(valor)
+
+    def search(self, valor):
+        return self.obter_profundidade_no(valor) != -1
+
+    def __contains__(self, chave):
+        return self.search(chave)
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        """Retorna, em ordem, as chaves no intervalo [chave1, chave2]."""
+        chaves, esq, dir_ = self._chaves, self._esq, self._dir
+        resultado = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual != NULO:
+            while atual != NULO:
+                pilha.append(atual)
+                atual = esq[atual] if chaves[atual] > chave1 else NULO
+            i = pilha.pop()
+            if chaves[i] > chave2:
+                break
+            if chaves[i] >= chave1:
+                resultado.append(chaves[i])
+            atual = dir_[i]
+        return resultado
+
+    def percurso_em_ordem(self):
+        """Retorna lista das chaves em ordem (in-order)."""
+        chaves, esq, dir_ = self._chaves, self._esq, self._dir
+        resultado = []
+        pilha = []
+        atual = self.raiz
+        while pilha or atual != NULO:
+            while atual != NULO:
+                pilha.append(atual)
+                atual = esq[atual]
+            i = pilha.pop()
+            resultado.append(chaves[i])
+            atual = dir_[i]
+        return resultado
@@ -0,0 +1,5 @@
+# os módulos do projeto ficam soltos na raiz do repositório
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,121 @@
+import random
+from collections import Counter
+
+import pytest
+
+from arvore_b import ArvoreB
+
+
+def verificar_b(arvore):
+    """Confere ocupação, separadores, nível das folhas e o encadeamento; retorna as folhas."""
+    folhas = []
+
+    def visitar(no, minimo, maximo, nivel, eh_raiz):
+        assert no.chaves == sorted(set(no.chaves))
+        assert len(no.chaves) <= arvore._maximo
+        if not eh_raiz:
+            assert len(no.chaves) >= arvore._minimo
+        assert all((minimo is None or minimo <= c) and (maximo is None or c < maximo) for c in no.chaves)
+        if no.filhos is None:
+            folhas.append((nivel, no))
+            return
+        assert len(no.filhos) == len(no.chaves) + 1
+        limites = [minimo] + no.chaves + [maximo]
+        for i, filho in enumerate(no.filhos):
+            visitar(filho, limites[i], limites[i + 1], nivel + 1, False)
+
+    visitar(arvore.raiz, None, None, 0, True)
+    assert len({nivel for nivel, _ in folhas}) == 1
+    for (_, folha), (_, seguinte) in zip(folhas, folhas[1:]):
+        assert folha.proxima is seguinte
+    assert folhas[-1][1].proxima is None
+    return [folha for _, folha in folhas]
+
+
+@pytest.fixture
+def chamadas(monkeypatch):
+    """Conta as chamadas dos passos de rebalanceamento da deleção."""
+    contagem = Counter()
+    for nome in ("_emprestar_da_esquerda", "_emprestar_da_direita", "_fundir"):
+        original = getattr(ArvoreB, nome)
+
+        def contar(self, *args, _nome=nome, _original=original):
+            contagem[_nome] += 1
+            return _original(self, *args)
+        monkeypatch.setattr(ArvoreB, nome, contar)
+    return contagem
+
+
+@pytest.mark.parametrize("ordem", [3, 4, 5, 8])
+def test_insercoes_e_delecoes_aleatorias_contra_set(ordem, chamadas):
+    rng = random.Random(ordem)
+    arvore = ArvoreB(ordem)
+    presentes = set()
+    alturas = set()
+    for passo in range(6000):
+        chave = rng.randrange(600)
+        # fases que crescem e esvaziam a árvore, para dividir e fundir nós em todos os níveis
+        inserir = rng.random() < (0.75 if passo % 2000 < 1000 else 0.25)
+        if inserir:
+            if chave in presentes:
+                with pytest.raises(ValueError):
+                    arvore.inserir(chave)
+            else:
+                arvore.inserir(chave)
+                presentes.add(chave)
+        else:
+            arvore.deletar(chave)
+            presentes.discard(chave)
+        altura = 0
+        no = arvore.raiz
+        while no.filhos is not None:
+            no = no.filhos[0]
+            altura += 1
+        alturas.add(altura)
+        if passo % 250 == 0:
+            verificar_b(arvore)
+            assert arvore.percurso_em_ordem() == sorted(presentes)
+        if passo % 50 == 0:
+            a, b = sorted(rng.randrange(-10, 610) for _ in range(2))
+            assert arvore.encontrar_nos_intervalo(a, b) == sorted(c for c in presentes if a <= c <= b)
+    verificar_b(arvore)
+    assert arvore.percurso_em_ordem() == sorted(presentes)
+    assert len(arvore) == len(presentes)
+    assert all(chave in arvore for chave in presentes)
+    assert not any(chave in arvore for chave in set(range(600)) - presentes)
+    # a árvore cresceu e encolheu de nível, e a deleção usou os três caminhos
+    assert len(alturas) >= 3
+    assert chamadas["_emprestar_da_esquerda"] and chamadas["_emprestar_da_direita"] and chamadas["_fundir"]
+
+
+def test_intervalo_atravessa_o_encadeamento_das_folhas():
+    arvore = ArvoreB(4)
+    for chave in range(0, 400, 2):
+        arvore.inserir(chave)
+    for chave in range(0, 400, 6):
+        arvore.deletar(chave)
+    folhas = verificar_b(arvore)
+    assert len(folhas) > 20
+    presentes = [c for c in range(0, 400, 2) if c % 6]
+    assert arvore.encontrar_nos_intervalo(-5, 1000) == presentes
+    assert arvore.encontrar_nos_intervalo(7, 7) == []
+    assert arvore.encontrar_nos_intervalo(8, 8) == [8]
+    assert arvore.encontrar_nos_intervalo(30, 20) == []
+    assert arvore.encontrar_nos_intervalo(401, 500) == []
+    # fronteiras exatamente nas primeiras e últimas chaves de cada folha
+    for folha in folhas:
+        primeira, ultima = folha.chaves[0], folha.chaves[-1]
+        assert arvore.encontrar_nos_intervalo(primeira, ultima) == folha.chaves
+        assert arvore.encontrar_nos_intervalo(ultima, ultima + 5) == [c for c in presentes if ultima <= c <= ultima + 5]
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 100, 5000])
+def test_from_iterable_e_depois_mutacoes(n):
+    arvore = ArvoreB.from_iterable(range(n), ordem=5)
+    verificar_b(arvore)
+    assert arvore.percurso_em_ordem() == list(range(n))
+    for chave in range(0, n, 3):
+        arvore.deletar(chave)
+    arvore.inserir(n + 1)
+    verificar_b(arvore)
+    assert arvore.percurso_em_ordem() == [c for c in range(n) if c % 3] + [n + 1]
@@ -0,0 +1,20 @@
+import pytest
+
+from arvore_splay import SplayTree
+
+
+def test_alpha_e_recusado():
+    with pytest.raises(TypeError, match="alpha"):
+        SplayTree(0.7)
+    with pytest.raises(TypeError, match="alpha"):
+        SplayTree(alpha=0.7)
+
+
+def test_sem_alpha():
+    arvore = SplayTree()
+    for valor in range(100):
+        arvore.insert(valor)
+    assert arvore.alpha is None
+    assert arvore.search(10) and not arvore.search(1000)
+    arvore.delete(10)
+    assert not arvore.search(10)
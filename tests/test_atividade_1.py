@@ -0,0 +1,80 @@
+import math
+import random
+
+import pytest
+
+from atividade_1 import No, avaliar, compilar, construir_arvore
+
+
+def test_inteiro_e_float_iguais_nao_sao_unificados():
+    raiz = No("+", No(1), No(1.0))
+    resultado = compilar(raiz)()
+    assert resultado == avaliar(raiz) == 2.0
+    assert type(resultado) is float
+
+
+def test_zero_e_zero_negativo_nao_sao_unificados():
+    raiz = No("*", No(0.0), No(-0.0))
+    assert math.copysign(1, compilar(raiz)()) == math.copysign(1, avaliar(raiz)) == -1
+
+
+def test_subarvores_iguais_sao_calculadas_uma_vez():
+    soma = lambda: No("+", No("2"), No("3"))
+    expressao = compilar(No("*", soma(), soma()))
+    assert expressao() == 25
+    assert len(expressao.instrucoes) == 4
+
+
+def avaliar_como_python(expressao):
+    """(resultado, None) ou (None, tipo da exceção) da árvore montada e de eval."""
+    resultados = []
+    for calcular in (lambda: avaliar(construir_arvore(expressao)), lambda: eval(expressao)):
+        try:
+            resultados.append((calcular(), None))
+        except ZeroDivisionError:
+            resultados.append((None, ZeroDivisionError))
+    return resultados
+
+
+@pytest.mark.parametrize("expressao", [
+    # precedência
+    "2+3*4", "2*3+4", "2-6/3", "7-2*3-1", "1+2*3-4/5",
+    # associatividade à esquerda
+    "2-3-4", "8/4/2", "2-3+4", "8/2*4", "100/10/5/2", "1-2-3-4-5",
+    # parênteses aninhados
+    "(2+3)*4", "2*(3+4)", "((2))", "(1+(2*(3-(4/(5+6)))))", "((1-2)-(3-(4-5)))*2",
+    # menos (e mais) unário
+    "-(2-3)", "2*-3", "--4", "-2*3", "-2-3", "2--3", "-(-(-1))", "- 3 - -2",
+    "3*-(2+1)", "-(2*3)/-4", "+3", "2*+3", "-.5*2", "1.5-2.25",
+])
+def test_construir_arvore_igual_a_eval(expressao):
+    arvore, python = avaliar_como_python(expressao)
+    assert arvore == python
+    assert type(arvore[0]) is type(python[0])
+
+
+def expressao_aleatoria(rng, profundidade):
+    if profundidade == 0 or rng.random() < 0.25:
+        texto = str(rng.randint(0, 9))
+    else:
+        operador = rng.choice("+-*/")
+        texto = f"{expressao_aleatoria(rng, profundidade - 1)} {operador} {expressao_aleatoria(rng, profundidade - 1)}"
+        if rng.random() < 0.5:
+            texto = f"({texto})"
+    if rng.random() < 0.2:
+        texto = "-" + (texto if texto[0] == "(" or texto.isdigit() else f"({texto})")
+    return texto
+
+
+def test_expressoes_aleatorias_iguais_a_eval():
+    rng = random.Random(9)
+    for _ in range(2000):
+        expressao = expressao_aleatoria(rng, 4)
+        arvore, python = avaliar_como_python(expressao)
+        assert arvore == python, expressao
+
+
+@pytest.mark.parametrize("expressao", ["", "2+", "(2+3", "2+3)", "()", "2 3", "*2", "2(3)", "2+*3", "2 $ 3"])
+def test_construir_arvore_rejeita_expressoes_malformadas(expressao):
+    with pytest.raises(ValueError):
+        construir_arvore(expressao)
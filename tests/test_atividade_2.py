@@ -0,0 +1,79 @@
+import math
+import random
+
+import pytest
+
+from atividade_2 import BinarySearchMap, BinarySearchTree
+
+
+def em_ordem(arvore):
+    return [node.valor for node in arvore._flatten(arvore.root)]
+
+
+def limite_altura(n, alpha):
+    return math.log(n) / math.log(1 / alpha) + 1
+
+
+@pytest.mark.parametrize("alpha", [0.55, 0.7, 0.9])
+@pytest.mark.parametrize("ordem", ["crescente", "decrescente"])
+def test_altura_limitada_com_insercoes_ordenadas(alpha, ordem):
+    arvore = BinarySearchTree(alpha)
+    valores = range(2000) if ordem == "crescente" else range(1999, -1, -1)
+    for n, valor in enumerate(valores, 1):
+        arvore.insert(valor)
+        assert arvore.height() <= limite_altura(n, alpha)
+    assert arvore.rebuilds > 0
+    assert em_ordem(arvore) == list(range(2000))
+    # sem alpha a mesma entrada vira uma lista
+    simples = BinarySearchTree()
+    for valor in range(200):
+        simples.insert(valor)
+    assert simples.height() == 199
+
+
+@pytest.mark.parametrize("alpha", [0.55, 0.7, 0.9])
+def test_reconstrucao_global_apos_remocoes(alpha):
+    n = 1024
+    arvore = BinarySearchTree(alpha)
+    valores = list(range(n))
+    random.Random(8).shuffle(valores)
+    for valor in valores:
+        arvore.insert(valor)
+    arvore.delete(-1)  # ausente: não conta como remoção
+    assert arvore._size == n
+    antes = arvore.rebuilds
+    restantes = set(valores)
+    globais = 0
+    maior = n
+    for valor in valores[: n // 2]:
+        arvore.delete(valor)
+        restantes.discard(valor)
+        if len(restantes) < alpha * maior:
+            # a remoção que derruba n abaixo de alpha * maior n reconstrói tudo
+            globais += 1
+            maior = len(restantes)
+            assert arvore.rebuilds == antes + globais
+            assert arvore.height() == math.ceil(math.log2(len(restantes) + 1)) - 1
+        else:
+            assert arvore.rebuilds == antes + globais
+    # depois de remover metade das chaves houve ao menos uma reconstrução global
+    assert globais >= 1
+    assert arvore._max_size == maior
+    assert em_ordem(arvore) == sorted(restantes)
+
+
+def test_mapa_com_alpha_mantem_os_dados():
+    mapa = BinarySearchMap(alpha=0.6)
+    for valor in range(500):
+        mapa.put(valor, str(valor))
+    for valor in range(0, 500, 2):
+        mapa.delete(valor)
+    assert mapa.rebuilds > 0
+    assert mapa.height() <= limite_altura(500, 0.6)
+    assert all(mapa.get(valor) == (str(valor) if valor % 2 else None) for valor in range(500))
+
+
+def test_alpha_fora_do_intervalo():
+    for alpha in (0.5, 1, 0.2):
+        with pytest.raises(ValueError):
+            BinarySearchTree(alpha)
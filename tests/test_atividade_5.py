@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from atividade_5 import ArvoreAVL
+from mapa_avl import MapaAVL
+
+OPERACOES = {
+    "uniao": set.union,
+    "intersecao": set.intersection,
+    "diferenca": set.difference,
+}
+
+
+def verificar_avl(no):
+    """Confere ordem, alturas, tamanhos e balanceamento; retorna a altura."""
+    if no is None:
+        return 0
+    esquerda, direita = verificar_avl(no.esquerda), verificar_avl(no.direita)
+    assert no.esquerda is None or no.esquerda.chave < no.chave
+    assert no.direita is None or no.direita.chave > no.chave
+    assert abs(esquerda - direita) <= 1
+    assert no.altura == 1 + max(esquerda, direita)
+    assert no.tamanho == 1 + (no.esquerda.tamanho if no.esquerda else 0) + (no.direita.tamanho if no.direita else 0)
+    return no.altura
+
+
+# m pequeno contra n grande cai no caminho chave a chave; tamanhos parecidos, no split/join
+TAMANHOS = [(0, 50), (50, 0), (5, 500), (500, 5), (300, 400)]
+
+
+@pytest.mark.parametrize("operacao", OPERACOES)
+@pytest.mark.parametrize("n_a, n_b", TAMANHOS)
+def test_entradas_ficam_intactas(operacao, n_a, n_b):
+    rng = random.Random(n_a * 1000 + n_b)
+    chaves_a, chaves_b = rng.sample(range(2 * (n_a + n_b) + 1), n_a), rng.sample(range(2 * (n_a + n_b) + 1), n_b)
+    a, b = ArvoreAVL.from_iterable(chaves_a), ArvoreAVL.from_iterable(chaves_b)
+    resultado = getattr(a, operacao)(b)
+    assert resultado.percurso_em_ordem() == sorted(OPERACOES[operacao](set(chaves_a), set(chaves_b)))
+    verificar_avl(resultado.raiz)
+    assert a.percurso_em_ordem() == sorted(chaves_a)
+    assert b.percurso_em_ordem() == sorted(chaves_b)
+    verificar_avl(a.raiz)
+    verificar_avl(b.raiz)
+    # o resultado não divide nós com as entradas
+    resultado.inserir(-1)
+    for chave in chaves_a:
+        a.deletar(chave)
+    assert b.percurso_em_ordem() == sorted(chaves_b)
+    assert -1 not in b.percurso_em_ordem()
+
+
+@pytest.mark.parametrize("operacao", OPERACOES)
+@pytest.mark.parametrize("n_a, n_b", TAMANHOS)
+def test_consumir_esvazia_as_entradas(operacao, n_a, n_b):
+    rng = random.Random(n_a + n_b)
+    chaves_a, chaves_b = rng.sample(range(2 * (n_a + n_b) + 1), n_a), rng.sample(range(2 * (n_a + n_b) + 1), n_b)
+    a, b = ArvoreAVL.from_iterable(chaves_a), ArvoreAVL.from_iterable(chaves_b)
+    resultado = getattr(a, operacao)(b, consumir=True)
+    assert resultado.percurso_em_ordem() == sorted(OPERACOES[operacao](set(chaves_a), set(chaves_b)))
+    verificar_avl(resultado.raiz)
+    assert a.raiz is None and len(a) == 0
+    assert b.raiz is None and len(b) == 0
+
+
+def test_operacao_da_arvore_com_ela_mesma():
+    a = ArvoreAVL.from_iterable(range(20))
+    assert a.uniao(a).percurso_em_ordem() == list(range(20))
+    assert a.diferenca(a).percurso_em_ordem() == []
+    assert a.percurso_em_ordem() == list(range(20))
+    with pytest.raises(ValueError):
+        a.uniao(a, consumir=True)
+
+
+@pytest.mark.parametrize("consumir", [False, True])
+@pytest.mark.parametrize("operacao", OPERACOES)
+@pytest.mark.parametrize("n_a, n_b", TAMANHOS)
+def test_mapa_mantem_os_valores(operacao, n_a, n_b, consumir):
+    rng = random.Random(n_a * 7 + n_b)
+    universo = range(2 * (n_a + n_b) + 1)
+    dados_a = {chave: f"a{chave}" for chave in rng.sample(universo, n_a)}
+    dados_b = {chave: f"b{chave}" for chave in rng.sample(universo, n_b)}
+    a, b = MapaAVL(tamanho_cache=8), MapaAVL()
+    for chave, valor in dados_a.items():
+        a[chave] = valor
+    for chave, valor in dados_b.items():
+        b[chave] = valor
+    resultado = getattr(a, operacao)(b, consumir=consumir)
+    assert isinstance(resultado, MapaAVL)
+    assert resultado.cache is not None
+    esperado = {**dados_b, **dados_a}  # na união vale o valor desta árvore
+    chaves = sorted(OPERACOES[operacao](set(dados_a), set(dados_b)))
+    assert list(resultado.itens()) == [(chave, esperado[chave]) for chave in chaves]
+    verificar_avl(resultado.raiz)
+    if not consumir:
+        assert list(a.itens()) == sorted(dados_a.items())
+        assert list(b.itens()) == sorted(dados_b.items())
+
+
+def test_copiar():
+    a = MapaAVL()
+    for chave in range(10):
+        a[chave] = chave * chave
+    copia = a.copiar()
+    assert isinstance(copia, MapaAVL)
+    copia[3] = "novo"
+    del copia[4]
+    assert a[3] == 9 and a[4] == 16
+    assert list(copia.itens()) == [(c, "novo" if c == 3 else c * c) for c in range(10) if c != 4]
@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from avl_compacta import NULO, ArvoreAVLCompacta
+
+
+def verificar_avl(arvore, i=None):
+    """Confere ordem, alturas e balanceamento a partir do índice i; retorna a altura."""
+    if i is None:
+        i = arvore.raiz
+    if i == NULO:
+        return 0
+    esq, dir_ = arvore._esq[i], arvore._dir[i]
+    altura_esq, altura_dir = verificar_avl(arvore, esq), verificar_avl(arvore, dir_)
+    assert esq == NULO or arvore._chave[esq] < arvore._chave[i]
+    assert dir_ == NULO or arvore._chave[dir_] > arvore._chave[i]
+    assert abs(altura_esq - altura_dir) <= 1
+    assert arvore._alt[i] == 1 + max(altura_esq, altura_dir)
+    return arvore._alt[i]
+
+
+def livres(arvore):
+    """Posições da lista livre, na ordem em que serão reaproveitadas."""
+    posicoes = []
+    i = arvore._livre
+    while i != NULO:
+        posicoes.append(i)
+        i = arvore._esq[i]
+    return posicoes
+
+
+def test_inserir_e_deletar_aleatorio():
+    rng = random.Random(3)
+    arvore = ArvoreAVLCompacta()
+    presentes = set()
+    for _ in range(4000):
+        chave = rng.randrange(500)
+        if chave in presentes and rng.random() < 0.6:
+            arvore.deletar(chave)
+            presentes.discard(chave)
+        elif chave in presentes:
+            with pytest.raises(ValueError):
+                arvore.inserir(chave)
+        else:
+            arvore.inserir(chave)
+            presentes.add(chave)
+    assert arvore.percurso_em_ordem() == sorted(presentes)
+    assert len(arvore) == len(presentes)
+    verificar_avl(arvore)
+    assert all(arvore.obter_profundidade_no(chave) >= 0 for chave in presentes)
+    assert arvore.obter_profundidade_no(-1) == -1
+    assert arvore.encontrar_nos_intervalo(100, 200) == sorted(c for c in presentes if 100 <= c <= 200)
+
+
+def test_deletar_chave_ausente_nao_muda_nada():
+    arvore = ArvoreAVLCompacta()
+    for chave in (2, 1, 3):
+        arvore.inserir(chave)
+    arvore.deletar(7)
+    assert arvore.percurso_em_ordem() == [1, 2, 3]
+    assert livres(arvore) == []
+
+
+def test_posicoes_liberadas_sao_reaproveitadas():
+    arvore = ArvoreAVLCompacta()
+    for chave in range(100):
+        arvore.inserir(chave)
+    for chave in range(0, 100, 2):
+        arvore.deletar(chave)
+    assert len(livres(arvore)) == 50
+    for chave in range(100, 150):
+        arvore.inserir(chave)
+    # as 50 inserções couberam nas posições livres, sem crescer os arrays
+    assert livres(arvore) == []
+    assert len(arvore._chave) == 100
+    assert arvore.percurso_em_ordem() == list(range(1, 100, 2)) + list(range(100, 150))
+    verificar_avl(arvore)
+
+
+@pytest.mark.parametrize("invalida, erro", [(2 ** 70, OverflowError), (1.5, TypeError)])
+def test_chave_que_nao_cabe_no_tipo_nao_vaza_posicao(invalida, erro):
+    arvore = ArvoreAVLCompacta("q")
+    for chave in range(10):
+        arvore.inserir(chave)
+    arvore.deletar(3)
+    arvore.deletar(7)
+    antes = livres(arvore)
+    with pytest.raises(erro):
+        arvore.inserir(invalida)
+    assert livres(arvore) == antes
+    assert len(arvore) == 8
+    arvore.inserir(3)
+    arvore.inserir(7)
+    assert livres(arvore) == []
+    assert len(arvore._chave) == 10
+    assert arvore.percurso_em_ordem() == list(range(10))
+    verificar_avl(arvore)
@@ -0,0 +1,162 @@
+import random
+import threading
+
+import pytest
+
+from atividade_5 import ArvoreAVL
+from avl_concorrente import ArvoreAVLConcorrente, _Pedido
+from avl_merkle import ArvoreAVLMerkle
+from mapa_avl import MapaAVL
+
+
+def verificar_avl(no):
+    """Retorna (altura, tamanho) conferindo balanceamento, alturas e tamanhos guardados."""
+    if no is None:
+        return 0, 0
+    altura_esquerda, tamanho_esquerda = verificar_avl(no.esquerda)
+    altura_direita, tamanho_direita = verificar_avl(no.direita)
+    assert abs(altura_esquerda - altura_direita) <= 1
+    assert no.altura == 1 + max(altura_esquerda, altura_direita)
+    assert no.tamanho == 1 + tamanho_esquerda + tamanho_direita
+    return no.altura, no.tamanho
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_aplicar_lote_igual_a_aplicar_em_sequencia(semente):
+    rng = random.Random(semente)
+    chaves = rng.sample(range(2000), rng.randrange(0, 500))
+    arvore = ArvoreAVL.from_iterable(chaves)
+    esperadas = set(chaves)
+    for _ in range(5):
+        operacoes = [(rng.choice(("inserir", "deletar")), rng.randrange(2000))
+                     for _ in range(rng.randrange(0, 300))]
+        erros = arvore.aplicar_lote(operacoes)
+        for (operacao, chave), erro in zip(operacoes, erros):
+            if operacao == "inserir":
+                assert (erro is not None) == (chave in esperadas)
+                esperadas.add(chave)
+            else:
+                assert erro is None
+                esperadas.discard(chave)
+        assert arvore.percurso_em_ordem() == sorted(esperadas)
+        verificar_avl(arvore.raiz)
+
+
+def test_aplicar_lote_segue_a_ordem_dos_pedidos_da_mesma_chave():
+    arvore = ArvoreAVL.from_iterable([1, 2, 3])
+    erros = arvore.aplicar_lote([("deletar", 2), ("inserir", 2), ("inserir", 2), ("inserir", 9)])
+    assert [type(erro) for erro in erros] == [type(None), type(None), ValueError, type(None)]
+    assert arvore.percurso_em_ordem() == [1, 2, 3, 9]
+
+
+def test_aplicar_lote_rejeita_operacao_desconhecida_sem_alterar_a_arvore():
+    arvore = ArvoreAVL.from_iterable(range(10))
+    with pytest.raises(ValueError):
+        arvore.aplicar_lote([("inserir", 20), ("trocar", 3)])
+    assert arvore.percurso_em_ordem() == list(range(10))
+
+
+def test_aplicar_lote_preserva_os_valores_do_mapa():
+    mapa = MapaAVL(tamanho_cache=16)
+    for chave in range(100):
+        mapa.put(chave, f"v{chave}")
+    assert mapa.get(3) == "v3"  # fica no cache
+    mapa.aplicar_lote([("inserir", 1000), ("deletar", 3)] + [("inserir", c) for c in range(200, 300)])
+    assert all(mapa.get(c) == f"v{c}" for c in range(100) if c != 3)
+    assert mapa.get(3) is None
+    assert 1000 in mapa and mapa.get(1000) is None
+    verificar_avl(mapa.raiz)
+
+
+def test_aplicar_lote_mantem_os_hashes_da_merkle():
+    merkle = ArvoreAVLMerkle.from_iterable(range(0, 2000, 2))
+    merkle.aplicar_lote([("inserir", c) for c in range(1, 400, 2)] + [("deletar", c) for c in range(0, 400, 4)])
+    esperadas = (set(range(0, 2000, 2)) | set(range(1, 400, 2))) - set(range(0, 400, 4))
+    assert merkle.assinatura() == ArvoreAVLMerkle.from_iterable(esperadas).assinatura()
+
+
+def enfileirar(arvore, pedidos):
+    """Põe pedidos na fila como se outras threads estivessem esperando a vez."""
+    pedidos = [_Pedido(operacao, chave) for operacao, chave in pedidos]
+    arvore._fila.extend(pedidos)
+    return pedidos
+
+
+def test_fachada_aplica_lotes_grandes_numa_descida():
+    mapa = MapaAVL()
+    for chave in range(0, 1000, 2):
+        mapa.put(chave, -chave)
+    arvore = ArvoreAVLConcorrente(mapa)
+    pedidos = enfileirar(arvore, [("inserir", c) for c in range(1, 200, 2)] + [("inserir", 10)])
+    arvore.deletar(500)
+    assert all(pedido.feito for pedido in pedidos)
+    assert isinstance(pedidos[-1].erro, ValueError)
+    estatisticas = arvore.estatisticas()
+    assert estatisticas["descidas_em_lote"] == 1 and estatisticas["maior_lote"] == 102
+    assert mapa.get(10) == -10 and mapa.get(500) is None
+    assert arvore.percurso_em_ordem() == sorted((set(range(0, 1000, 2)) | set(range(1, 200, 2))) - {500})
+
+
+def test_fachada_aplica_lotes_pequenos_pedido_a_pedido():
+    arvore = ArvoreAVLConcorrente(ArvoreAVL.from_iterable(range(10)))
+    enfileirar(arvore, [("inserir", 20)])
+    arvore.inserir(21)
+    assert arvore.estatisticas()["descidas_em_lote"] == 0
+    with pytest.raises(ValueError):
+        arvore.inserir(5)
+    assert arvore.percurso_em_ordem() == list(range(10)) + [20, 21]
+
+
+def test_fachada_com_arvore_sem_aplicar_lote():
+    class SemLote:
+        def __init__(self):
+            self.chaves = set()
+
+        def inserir(self, chave):
+            self.chaves.add(chave)
+
+        def deletar(self, chave):
+            self.chaves.discard(chave)
+
+    arvore = ArvoreAVLConcorrente(SemLote())
+    enfileirar(arvore, [("inserir", c) for c in range(100)])
+    arvore.deletar(50)
+    assert arvore._arvore.chaves == set(range(100)) - {50}
+
+
+def test_escritas_e_leituras_concorrentes():
+    arvore = ArvoreAVLConcorrente(ArvoreAVL.from_iterable(range(0, 1000, 2)))
+    n_threads = 8
+    lotes = [[c for c in random.Random(i).sample(range(1000, 9000), 400) if c % n_threads == i]
+             for i in range(n_threads)]
+    parar = threading.Event()
+    falhas = []
+
+    def escrever(chaves):
+        for chave in chaves:
+            arvore.inserir(chave)
+        for chave in chaves[::2]:
+            arvore.deletar(chave)
+
+    def ler():
+        while not parar.is_set():
+            # as chaves pares iniciais nunca mudam
+            if arvore.encontrar_nos_intervalo(100, 120) != list(range(100, 121, 2)):
+                falhas.append(True)
+
+    leitores = [threading.Thread(target=ler) for _ in range(2)]
+    escritores = [threading.Thread(target=escrever, args=(lote,)) for lote in lotes]
+    for t in leitores + escritores:
+        t.start()
+    for t in escritores:
+        t.join()
+    parar.set()
+    for t in leitores:
+        t.join()
+    esperadas = set(range(0, 1000, 2))
+    for lote in lotes:
+        esperadas |= set(lote) - set(lote[::2])
+    assert not falhas
+    assert arvore.percurso_em_ordem() == sorted(esperadas)
+    verificar_avl(arvore._arvore.raiz)
+    assert arvore.estatisticas()["escritas"]["operacoes"] == sum(len(l) + len(l[::2]) for l in lotes)
@@ -0,0 +1,78 @@
+import random
+
+from atividade_5 import ArvoreAVL
+from avl_merkle import ArvoreAVLMerkle, hash_chave
+
+
+def test_arvore_com_uma_chave():
+    arvore = ArvoreAVLMerkle()
+    arvore.inserir(5)
+    assert arvore.assinatura() == (1, hash_chave(5))
+    assert arvore.resumo_intervalo(None, 10) == (1, hash_chave(5))
+    assert arvore.resumo_intervalo(6, None) == (0, 0)
+    assert list(arvore.diferencas(ArvoreAVLMerkle())) == [(5, True)]
+
+
+def test_resumo_intervalo_logo_apos_a_primeira_insercao():
+    arvore = ArvoreAVLMerkle()
+    arvore.inserir(5)
+    assert arvore.resumo_intervalo(None, 10)[0] == 1
+    arvore.inserir(7)
+    assert arvore.resumo_intervalo(6, 10) == (1, hash_chave(7))
+
+
+def test_nos_criados_pela_classe_base():
+    chaves = random.Random(1).sample(range(10_000), 1000)
+    arvore = ArvoreAVLMerkle()
+    arvore.raiz = ArvoreAVL.from_iterable(chaves).raiz  # nós sem hash
+    for chave in range(10_000, 10_050):
+        arvore.inserir(chave)
+    arvore.deletar(chaves[0])
+    esperada = ArvoreAVLMerkle.from_iterable(set(chaves[1:]) | set(range(10_000, 10_050)))
+    assert arvore.assinatura() == esperada.assinatura()
+    assert list(arvore.diferencas(esperada)) == []
+
+
+def test_diferencas_e_sincronizacao():
+    rng = random.Random(2)
+    chaves = rng.sample(range(100_000), 5000)
+    primaria = ArvoreAVLMerkle.from_iterable(chaves)
+    replica = ArvoreAVLMerkle()
+    for chave in reversed(chaves):
+        replica.inserir(chave)
+    removidas = chaves[:50]
+    novas = [-i for i in range(1, 51)]
+    for chave in removidas:
+        replica.deletar(chave)
+    for chave in novas:
+        replica.inserir(chave)
+    esperadas = sorted([(c, True) for c in removidas] + [(c, False) for c in novas])
+    assert list(primaria.diferencas(replica)) == esperadas
+    assert replica.sincronizar_com(primaria) == (50, 50)
+    assert replica.assinatura() == primaria.assinatura()
+
+
+def test_hash_de_todos_os_nos_apos_insercoes_e_remocoes():
+    rng = random.Random(4)
+    arvore = ArvoreAVLMerkle()
+    presentes = set()
+    for _ in range(3000):
+        chave = rng.randrange(800)
+        if chave in presentes:
+            arvore.deletar(chave)
+            presentes.discard(chave)
+        else:
+            arvore.inserir(chave)
+            presentes.add(chave)
+
+    def conferir(no):
+        if no is None:
+            return 0, 0
+        tamanho_esq, hash_esq = conferir(no.esquerda)
+        tamanho_dir, hash_dir = conferir(no.direita)
+        assert no.tamanho == 1 + tamanho_esq + tamanho_dir
+        assert no.hash == (hash_chave(no.chave) + hash_esq + hash_dir) & ((1 << 64) - 1)
+        return no.tamanho, no.hash
+
+    conferir(arvore.raiz)
+    assert arvore.assinatura() == ArvoreAVLMerkle.from_iterable(presentes).assinatura()
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from avl_particionada import ArvoreAVLParticionada
+
+
+def chaves_por_particao(arvore):
+    return [arvore._chamar(i, "percurso_em_ordem") for i in range(arvore.trabalhadores)]
+
+
+def test_chaves_vao_para_a_particao_da_faixa():
+    with ArvoreAVLParticionada(trabalhadores=3, limites=[100, 200], minimo_rebalanceamento=10**9) as arvore:
+        chaves = random.Random(1).sample(range(300), 150)
+        assert arvore.inserir_many(chaves) == 150
+        assert arvore.inserir_many(chaves[:10]) == 0  # duplicatas são ignoradas
+        arvore.inserir(1000)
+        arvore.deletar(chaves[0])
+        presentes = set(chaves[1:]) | {1000}
+        particoes = chaves_por_particao(arvore)
+        assert particoes == [sorted(c for c in presentes if c < 100),
+                             sorted(c for c in presentes if 100 <= c < 200),
+                             sorted(c for c in presentes if c >= 200)]
+        assert arvore.tamanhos() == [len(p) for p in particoes]
+        assert arvore.percurso_em_ordem() == sorted(presentes)
+        assert arvore.encontrar_nos_intervalo(50, 250) == sorted(c for c in presentes if 50 <= c <= 250)
+        consulta = [chaves[0], chaves[1], 1000, -5]
+        assert [p != -1 for p in arvore.profundidade_many(consulta)] == [False, True, True, False]
+        assert arvore.deletar_many(chaves[:20] + [-5]) == 19
+
+
+def test_rebalanceamento_iguala_as_particoes():
+    with ArvoreAVLParticionada(trabalhadores=4, minimo_rebalanceamento=100) as arvore:
+        # sem limites tudo cai na primeira partição até o primeiro rebalanceamento
+        arvore.inserir_many(range(50))
+        assert arvore.tamanhos() == [50, 0, 0, 0]
+        arvore.inserir_many(range(50, 400))
+        assert arvore.rebalanceamentos >= 1
+        assert len(arvore.limites) == 3
+        assert max(arvore.tamanhos()) - min(arvore.tamanhos()) <= 1
+        # chaves crescentes desequilibram a última partição, que volta a ser dividida
+        antes = arvore.rebalanceamentos
+        for inicio in range(400, 2000, 100):
+            arvore.inserir_many(range(inicio, inicio + 100))
+        assert arvore.rebalanceamentos > antes
+        assert max(arvore.tamanhos()) <= arvore.fator_desequilibrio * len(arvore) / 4
+        particoes = chaves_por_particao(arvore)
+        assert arvore.tamanhos() == [len(p) for p in particoes]
+        assert [c for p in particoes for c in p] == list(range(2000))
+        for limite, (anterior, seguinte) in zip(arvore.limites, zip(particoes, particoes[1:])):
+            assert anterior[-1] < limite <= seguinte[0]
+
+
+def test_from_iterable_divide_em_partes_iguais():
+    with ArvoreAVLParticionada.from_iterable(range(1000), trabalhadores=4) as arvore:
+        assert arvore.tamanhos() == [250, 250, 250, 250]
+        assert arvore.limites == [250, 500, 750]
+        assert arvore.percurso_em_ordem() == list(range(1000))
+
+
+def test_excecao_do_trabalhador_e_relancada_com_tamanhos_corretos():
+    with ArvoreAVLParticionada(trabalhadores=2) as arvore:
+        arvore.inserir_many([1, 2, 3])
+        # sem limites tudo vai para a partição 0, que insere 5 e falha ao comparar "x"
+        with pytest.raises(TypeError):
+            arvore.inserir_many([5, "x", 7])
+        assert arvore.percurso_em_ordem() == [1, 2, 3, 5]
+        assert arvore.tamanhos() == [4, 0]
+        with pytest.raises(TypeError):
+            arvore.deletar_many([1, "x"])
+        assert arvore.tamanhos() == [3, 0]
+        assert len(arvore) == len(arvore.percurso_em_ordem())
+        with pytest.raises(TypeError):
+            arvore.profundidade_many(["x"])
@@ -0,0 +1,103 @@
+import random
+import threading
+
+import pytest
+
+from avl_persistente import ArvoreAVLPersistente, ArvoreAVLVersionada
+
+
+def nos(raiz):
+    """Todos os nós da versão, em pré-ordem."""
+    resultado, pilha = [], [raiz] if raiz is not None else []
+    while pilha:
+        no = pilha.pop()
+        resultado.append(no)
+        pilha.extend(filho for filho in (no.direita, no.esquerda) if filho is not None)
+    return resultado
+
+
+def forma(raiz):
+    """Retrato completo da versão: identidade e campos de cada nó."""
+    return [(id(no), no.chave, id(no.esquerda), id(no.direita), no.altura, no.tamanho) for no in nos(raiz)]
+
+
+def verificar_avl(no):
+    if no is None:
+        return 0
+    esquerda, direita = verificar_avl(no.esquerda), verificar_avl(no.direita)
+    assert no.esquerda is None or no.esquerda.chave < no.chave
+    assert no.direita is None or no.direita.chave > no.chave
+    assert abs(esquerda - direita) <= 1
+    assert no.altura == 1 + max(esquerda, direita)
+    return no.altura
+
+
+def test_versoes_antigas_ficam_intactas():
+    rng = random.Random(6)
+    versoes = [ArvoreAVLPersistente()]
+    conjuntos = [set()]
+    retratos = [forma(None)]
+    for _ in range(600):
+        chave = rng.randrange(200)
+        atual, presentes = versoes[-1], conjuntos[-1]
+        if chave in presentes:
+            nova = atual.deletar(chave)
+            presentes = presentes - {chave}
+        else:
+            nova = atual.inserir(chave)
+            presentes = presentes | {chave}
+        versoes.append(nova)
+        conjuntos.append(presentes)
+        retratos.append(forma(nova.raiz))
+    for versao, presentes, retrato in zip(versoes, conjuntos, retratos):
+        assert versao.percurso_em_ordem() == sorted(presentes)
+        assert len(versao) == len(presentes)
+        assert forma(versao.raiz) == retrato
+        verificar_avl(versao.raiz)
+
+
+def test_inserir_duplicada_e_deletar_ausente():
+    versao = ArvoreAVLPersistente.from_iterable(range(10))
+    with pytest.raises(ValueError):
+        versao.inserir(3)
+    assert versao.deletar(42) is versao
+
+
+@pytest.mark.parametrize("operacao", ["inserir", "deletar"])
+def test_nos_fora_do_caminho_sao_compartilhados(operacao):
+    n = 4096
+    antiga = ArvoreAVLPersistente.from_iterable(range(0, 2 * n, 2))
+    rng = random.Random(7)
+    for _ in range(50):
+        chave = 2 * rng.randrange(n) + (1 if operacao == "inserir" else 0)
+        nova = getattr(antiga, operacao)(chave)
+        antigos = {id(no) for no in nos(antiga.raiz)}
+        copiados = [no for no in nos(nova.raiz) if id(no) not in antigos]
+        # só o caminho até a chave (mais os nós das rotações) é copiado
+        assert len(copiados) <= 2 * antiga.raiz.altura + 2
+        # e a subárvore do lado que a operação não visitou é a mesma
+        if chave < antiga.raiz.chave:
+            assert nova.raiz.direita is antiga.raiz.direita or nova.raiz.chave != antiga.raiz.chave
+        elif chave > antiga.raiz.chave:
+            assert nova.raiz.esquerda is antiga.raiz.esquerda or nova.raiz.chave != antiga.raiz.chave
+
+
+def test_snapshot_nao_ve_escritas_posteriores():
+    arvore = ArvoreAVLVersionada()
+    for chave in range(100):
+        arvore.inserir(chave)
+    snapshot = arvore.snapshot()
+
+    def escrever(inicio):
+        for chave in range(inicio, inicio + 200):
+            arvore.inserir(chave)
+        for chave in range(0, 100, 2):
+            arvore.deletar(chave)
+
+    threads = [threading.Thread(target=escrever, args=(inicio,)) for inicio in (100, 300, 500)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert snapshot.percurso_em_ordem() == list(range(100))
+    assert arvore.percurso_em_ordem() == [c for c in range(700) if c >= 100 or c % 2]
@@ -0,0 +1,154 @@
+import os
+
+import pytest
+
+import avl_wal
+from avl_wal import CABECALHO, REGISTRO, ArvoreAVLDuravel
+
+
+def tamanho_do_log(pasta):
+    return os.path.getsize(os.path.join(pasta, "wal.log"))
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    """Conta as chamadas de os.fsync feitas pelo módulo."""
+    chamadas = []
+    original = os.fsync
+
+    def contar(fd):
+        chamadas.append(fd)
+        original(fd)
+    monkeypatch.setattr(avl_wal.os, "fsync", contar)
+    return chamadas
+
+
+def test_replay_recupera_insercoes_e_remocoes(tmp_path):
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        for chave in range(20):
+            arvore.inserir(chave)
+        for chave in range(0, 20, 3):
+            arvore.deletar(chave)
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.registros_recuperados == 27
+        assert arvore.percurso_em_ordem() == [c for c in range(20) if c % 3]
+        arvore.inserir(100)
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.percurso_em_ordem() == [c for c in range(20) if c % 3] + [100]
+
+
+def test_group_commit_grava_a_cada_lote(tmp_path, fsyncs):
+    arvore = ArvoreAVLDuravel(tmp_path, politica_fsync="lote", tamanho_lote=4)
+    inicial = len(fsyncs)
+    for chave in range(3):
+        arvore.inserir(chave)
+    assert tamanho_do_log(tmp_path) == CABECALHO.size
+    assert len(fsyncs) == inicial
+    arvore.inserir(3)
+    assert tamanho_do_log(tmp_path) == CABECALHO.size + 4 * REGISTRO.size
+    assert len(fsyncs) == inicial + 1
+    arvore.inserir(4)
+    arvore.sincronizar()
+    assert tamanho_do_log(tmp_path) == CABECALHO.size + 5 * REGISTRO.size
+    assert len(fsyncs) == inicial + 2
+    arvore.close()
+
+
+def test_politica_sempre_faz_fsync_a_cada_operacao(tmp_path, fsyncs):
+    arvore = ArvoreAVLDuravel(tmp_path, politica_fsync="sempre", tamanho_lote=64)
+    inicial = len(fsyncs)
+    for chave in range(5):
+        arvore.inserir(chave)
+        assert tamanho_do_log(tmp_path) == CABECALHO.size + (chave + 1) * REGISTRO.size
+    assert len(fsyncs) == inicial + 5
+    arvore.close()
+
+
+def test_politica_nunca_grava_sem_fsync(tmp_path, fsyncs):
+    arvore = ArvoreAVLDuravel(tmp_path, politica_fsync="nunca", tamanho_lote=2)
+    inicial = len(fsyncs)
+    for chave in range(4):
+        arvore.inserir(chave)
+    assert tamanho_do_log(tmp_path) == CABECALHO.size + 4 * REGISTRO.size
+    assert len(fsyncs) == inicial
+    arvore.close()
+
+
+@pytest.mark.parametrize("intervalo, esperado", [(0.0, 3), (3600.0, 0)])
+def test_politica_intervalo(tmp_path, fsyncs, intervalo, esperado):
+    arvore = ArvoreAVLDuravel(tmp_path, politica_fsync="intervalo", tamanho_lote=64,
+                              intervalo_fsync=intervalo)
+    inicial = len(fsyncs)
+    for chave in range(3):
+        arvore.inserir(chave)
+    assert len(fsyncs) - inicial == esperado
+    arvore.close()
+
+
+def test_politica_desconhecida(tmp_path):
+    with pytest.raises(ValueError):
+        ArvoreAVLDuravel(tmp_path, politica_fsync="as vezes")
+
+
+def test_checkpoint_zera_o_log(tmp_path):
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        for chave in range(10):
+            arvore.inserir(chave)
+        arvore.checkpoint()
+        assert tamanho_do_log(tmp_path) == CABECALHO.size
+        arvore.deletar(0)
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.registros_recuperados == 1
+        assert arvore.percurso_em_ordem() == list(range(1, 10))
+
+
+def test_checkpoint_automatico(tmp_path):
+    with ArvoreAVLDuravel(tmp_path, checkpoint_a_cada=5) as arvore:
+        for chave in range(12):
+            arvore.inserir(chave)
+        assert tamanho_do_log(tmp_path) == CABECALHO.size
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.registros_recuperados == 2
+        assert arvore.percurso_em_ordem() == list(range(12))
+
+
+@pytest.mark.parametrize("estrago", ["truncado", "crc"])
+def test_final_rasgado_do_log_e_descartado(tmp_path, estrago):
+    with ArvoreAVLDuravel(tmp_path, politica_fsync="sempre") as arvore:
+        for chave in range(5):
+            arvore.inserir(chave)
+    caminho = os.path.join(tmp_path, "wal.log")
+    with open(caminho, "r+b") as f:
+        if estrago == "truncado":
+            f.truncate(CABECALHO.size + 4 * REGISTRO.size + 5)
+        else:
+            f.seek(CABECALHO.size + 4 * REGISTRO.size + 3)
+            f.write(b"\xff")
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.registros_recuperados == 4
+        assert arvore.percurso_em_ordem() == [0, 1, 2, 3]
+        assert tamanho_do_log(tmp_path) == CABECALHO.size + 4 * REGISTRO.size
+        arvore.inserir(9)
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.percurso_em_ordem() == [0, 1, 2, 3, 9]
+
+
+def test_chave_de_outro_tipo_e_recusada_antes_de_mudar_algo(tmp_path):
+    with ArvoreAVLDuravel(tmp_path, politica_fsync="sempre", checkpoint_a_cada=1) as arvore:
+        arvore.inserir(1)
+        tamanho = tamanho_do_log(tmp_path)
+        with pytest.raises(TypeError):
+            arvore.inserir(2.5)
+        assert arvore.percurso_em_ordem() == [1]
+        assert tamanho_do_log(tmp_path) == tamanho
+        arvore.deletar(1)
+        arvore.inserir(2.5)  # árvore vazia aceita o outro tipo
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        assert arvore.percurso_em_ordem() == [2.5]
+
+
+def test_chave_que_nao_cabe_no_registro(tmp_path):
+    with ArvoreAVLDuravel(tmp_path) as arvore:
+        with pytest.raises(ValueError):
+            arvore.inserir(2**70)
+        assert len(arvore) == 0
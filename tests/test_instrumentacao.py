@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from arvore_b import ArvoreB
+from arvore_splay import SplayTree
+from atividade_2 import BinarySearchTree
+from atividade_3 import BinaryTree
+from atividade_5 import ArvoreAVL
+from avl_compacta import ArvoreAVLCompacta
+from avl_merkle import ArvoreAVLMerkle
+from instrumentacao import ChaveContada, desinstrumentar, instrumentar
+
+
+def _chaves():
+    return random.Random(0).sample(range(10_000), 500)
+
+
+def _chaves_das_folhas(arvore):
+    no = arvore.raiz
+    while no.filhos is not None:
+        no = no.filhos[0]
+    while no is not None:
+        yield from no.chaves
+        no = no.proxima
+
+
+def _chaves_dos_nos(no, esquerda="esquerda", direita="direita", campo="chave"):
+    pilha = [no] if no is not None else []
+    while pilha:
+        no = pilha.pop()
+        yield getattr(no, campo)
+        pilha.extend(filho for filho in (getattr(no, esquerda), getattr(no, direita)) if filho is not None)
+
+
+def test_arvore_b_guarda_as_chaves_originais():
+    chaves = _chaves()
+    arvore = ArvoreB(ordem=4)
+    instrumentacao = instrumentar(arvore)
+    for chave in chaves:
+        arvore.inserir(chave)
+    for chave in chaves[::3]:
+        arvore.deletar(chave)
+    guardadas = list(_chaves_das_folhas(arvore))
+    originais = {id(chave) for chave in chaves}
+    assert guardadas == sorted(set(chaves) - set(chaves[::3]))
+    assert all(id(chave) in originais for chave in guardadas)
+    assert instrumentacao.resumo()["operacoes"]["insert"]["comparacoes_media"] > 0
+
+
+def test_avl_compacta_aceita_inserir_instrumentado():
+    chaves = _chaves()
+    arvore = ArvoreAVLCompacta()
+    instrumentacao = instrumentar(arvore)
+    for chave in chaves:
+        arvore.inserir(chave)
+    assert arvore.percurso_em_ordem() == sorted(chaves)
+    assert arvore.encontrar_nos_intervalo(100, 2000) == [c for c in sorted(chaves) if 100 <= c <= 2000]
+    resumo = instrumentacao.resumo()
+    assert resumo["operacoes"]["insert"]["operacoes"] == len(chaves)
+    assert resumo["rotacoes_simples"] + resumo["rotacoes_duplas"] > 0
+
+
+def test_merkle_mantem_a_assinatura_com_e_sem_instrumentacao():
+    chaves = _chaves()
+    referencia = ArvoreAVLMerkle.from_iterable(chaves)
+    arvore = ArvoreAVLMerkle()
+    instrumentar(arvore)
+    for chave in chaves:
+        arvore.inserir(chave)
+    assert arvore.assinatura() == referencia.assinatura()
+    assert not any(isinstance(chave, ChaveContada) for chave in _chaves_dos_nos(arvore.raiz))
+    desinstrumentar(arvore)
+    assert arvore.assinatura() == referencia.assinatura()
+    assert list(arvore.diferencas(referencia)) == []
+
+
+@pytest.mark.parametrize("classe", [ArvoreAVL, BinarySearchTree, SplayTree, BinaryTree])
+def test_arvores_de_nos_guardam_as_chaves_originais(classe):
+    chaves = _chaves()
+    arvore = classe()
+    instrumentar(arvore)
+    inserir = getattr(arvore, "inserir", None) or arvore.insert
+    for chave in chaves:
+        inserir(chave)
+    if hasattr(arvore, "raiz"):
+        guardadas = list(_chaves_dos_nos(arvore.raiz))
+    else:
+        guardadas = list(_chaves_dos_nos(arvore.root, "left", "right", "valor"))
+    assert sorted(guardadas) == sorted(chaves)
+    assert all(type(chave) is int for chave in guardadas)
+
+
+def test_arvore_sem_busca_gera_type_error():
+    class SemBusca:
+        def inserir(self, chave):
+            pass
+
+    with pytest.raises(TypeError):
+        instrumentar(SemBusca())
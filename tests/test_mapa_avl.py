@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from mapa_avl import MapaAVL
+
+
+def test_put_insere_e_troca_valores_como_dict():
+    rng = random.Random(5)
+    mapa, esperado = MapaAVL(tamanho_cache=16), {}
+    for _ in range(3000):
+        chave = rng.randrange(300)
+        if rng.random() < 0.2 and chave in esperado:
+            assert mapa.pop(chave) == esperado.pop(chave)
+        elif rng.random() < 0.5:
+            assert mapa.get(chave) == esperado.get(chave)
+        else:
+            mapa[chave] = esperado[chave] = rng.random()
+    assert list(mapa.itens()) == sorted(esperado.items())
+    assert len(mapa) == len(esperado)
+
+
+def test_put_de_chave_existente_desce_uma_vez(monkeypatch):
+    mapa = MapaAVL()
+    for chave in range(100):
+        mapa[chave] = chave
+    # a troca de valor não pode depender de uma segunda busca nem de ValueError
+    monkeypatch.setattr(mapa, "_localizar", None)
+    monkeypatch.setattr(mapa, "inserir", None)
+    mapa.put(42, "novo")
+    mapa.put(100, "fim")
+    monkeypatch.undo()
+    assert mapa[42] == "novo"
+    assert mapa[100] == "fim"
+    assert len(mapa) == 101
+
+
+def test_put_invalida_o_cache():
+    mapa = MapaAVL(tamanho_cache=4)
+    mapa[1] = "a"
+    assert mapa[1] == "a"  # agora no cache
+    mapa[1] = "b"
+    assert mapa[1] == "b"
+
+
+def test_snapshot_binario_nao_perde_valores_em_silencio(tmp_path):
+    mapa = MapaAVL()
+    mapa[1] = "um"
+    caminho = str(tmp_path / "mapa.bin")
+    with pytest.raises(TypeError):
+        mapa.salvar(caminho)
+    with pytest.raises(TypeError):
+        MapaAVL.carregar(caminho)
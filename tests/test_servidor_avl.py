@@ -0,0 +1,52 @@
+import asyncio
+
+from servidor_avl import ServidorAVL
+
+
+def conversar(linhas, servidor=None, limite=None):
+    """Manda as linhas (bytes) numa conexão e retorna as respostas, uma por linha enviada."""
+    async def principal():
+        nonlocal servidor
+        servidor = servidor or ServidorAVL()
+        if limite is None:
+            host, porta = await servidor.iniciar()
+        else:
+            servidor._servidor = await asyncio.start_server(servidor._atender, "127.0.0.1", 0, limit=limite)
+            host, porta = servidor._servidor.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, porta)
+        writer.write(b"".join(linhas))
+        await writer.drain()
+        respostas = [(await reader.readline()).decode().rstrip("\n") for _ in linhas]
+        writer.close()
+        await servidor.encerrar()
+        return respostas
+    return asyncio.run(principal())
+
+
+def test_pipelining_responde_na_ordem():
+    respostas = conversar([b"INSERT 5\n", b"INSERT 3\n", b"INSERT 5\n", b"SEARCH 3\n",
+                           b"RANGE 0 10\n", b"DELETE 3\n", b"DEPTH 3\n"])
+    assert respostas[:2] == ["OK", "OK"]
+    assert respostas[2].startswith("ERR")
+    assert respostas[3:] == ["1", "3 5", "OK", "-1"]
+
+
+def test_chaves_nao_finitas_sao_recusadas():
+    servidor = ServidorAVL()
+    respostas = conversar([b"INSERT nan\n", b"INSERT inf\n", b"INSERT -Infinity\n",
+                           b"INSERT 1\n", b"INSERT 2.5\n", b"RANGE 0 3\n"], servidor)
+    assert all(resposta.startswith("ERR chave inválida") for resposta in respostas[:3])
+    assert respostas[3:] == ["OK", "OK", "1 2.5"]
+    assert servidor.arvore.percurso_em_ordem() == [1, 2.5]
+
+
+def test_utf8_invalido_nao_derruba_a_conexao():
+    respostas = conversar([b"INSERT \xff\xfe\n", b"INSERT 7\n", b"SEARCH 7\n"])
+    assert respostas[0].startswith("ERR")
+    assert respostas[1:] == ["OK", "1"]
+
+
+def test_linha_longa_demais_e_descartada_inteira():
+    longa = b"INSERT " + b"9" * 5000 + b"\n"
+    respostas = conversar([b"INSERT 1\n", longa, b"INSERT 2\n", b"RANGE 0 9\n"], limite=256)
+    assert respostas == ["OK", "ERR linha longa demais", "OK", "1 2"]
@@ -0,0 +1,54 @@
+import sys
+
+import pytest
+
+import snapshot_binario
+from atividade_5 import ArvoreAVL
+from snapshot_binario import ArvoreMapeada, ler_arvore
+
+
+@pytest.mark.parametrize("chaves", [[5.0, 1, 9], [5, 1.5, 9], [5, 1, 9.0]])
+def test_chaves_int_e_float_misturadas(tmp_path, chaves):
+    arvore = ArvoreAVL()
+    for chave in chaves:
+        arvore.inserir(chave)
+    caminho = tmp_path / "arvore.bin"
+    with pytest.raises(TypeError, match="misturam"):
+        arvore.salvar(caminho)
+    assert not caminho.exists()
+
+
+def test_chave_de_tipo_nao_suportado(tmp_path):
+    arvore = ArvoreAVL.from_iterable(["a", "b"])
+    with pytest.raises(TypeError, match="str"):
+        arvore.salvar(tmp_path / "arvore.bin")
+
+
+def test_inteiro_fora_de_64_bits(tmp_path):
+    arvore = ArvoreAVL.from_iterable([1, 2**70])
+    with pytest.raises(ValueError, match=str(2**70)):
+        arvore.salvar(tmp_path / "arvore.bin")
+
+
+@pytest.mark.parametrize("chaves", [list(range(-50, 50)), [x / 4 for x in range(100)]])
+def test_ida_e_volta(tmp_path, chaves):
+    arvore = ArvoreAVL.from_iterable(chaves)
+    caminho = tmp_path / "arvore.bin"
+    assert arvore.salvar(caminho) == len(chaves)
+    assert sorted(ler_arvore(caminho)[0]) == chaves
+    with ArvoreMapeada(caminho) as mapeada:
+        assert mapeada.percurso_em_ordem() == chaves
+        assert all(mapeada.depth(c) == arvore.obter_profundidade_no(c) for c in chaves)
+
+
+def test_mapeada_com_leitura_big_endian(tmp_path, monkeypatch):
+    chaves = [x * 1.5 for x in range(-20, 20)]
+    arvore = ArvoreAVL.from_iterable(chaves)
+    caminho = tmp_path / "arvore.bin"
+    arvore.salvar(caminho)
+    # o arquivo é sempre little-endian; força o caminho usado em hosts big-endian
+    monkeypatch.setattr(snapshot_binario.sys, "byteorder", "big" if sys.byteorder == "little" else "little")
+    with ArvoreMapeada(caminho) as mapeada:
+        assert mapeada.percurso_em_ordem() == chaves
+        assert mapeada.encontrar_nos_intervalo(-3, 3) == [c for c in chaves if -3 <= c <= 3]
+        assert all(mapeada.depth(c) == arvore.obter_profundidade_no(c) for c in chaves)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Exportação das árvores para o formato DOT do Graphviz, escrita direto no arquivo.
+
+O grafo nunca é montado na memória: os nós são percorridos com uma pilha explícita
+(sem limite de recursão) e cada nó/aresta vira uma linha assim que é visitado. Os nós
+recebem identificadores sequenciais, então valores iguais não se confundem e uma raiz
+sozinha também aparece no desenho.
+
+Para árvores enormes dá para limitar a profundidade ou colapsar subárvores: o nó
+colapsado vira uma caixa com "n nós, altura h" da subárvore que ele representa.
+A renderização chama o executável dot e pode rodar em segundo plano.
+"""
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+_executor = None
+
+
+def _escapar(texto):
+    return str(texto).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _resumo_subarvore(no, filhos):
+    """Retorna (número de nós, altura) da subárvore; altura de uma folha é 0."""
+    total = 0
+    altura = -1
+    pilha = [(no, 0)]
+    while pilha:
+        atual, nivel = pilha.pop()
+        total += 1
+        altura = max(altura, nivel)
+        for filho in filhos(atual):
+            if filho is not None:
+                pilha.append((filho, nivel + 1))
+    return total, altura
+
+
+def escrever_dot(raiz, caminho, filhos, rotulo, profundidade_max=None, colapsar=None):
+    """
+    Escreve a árvore em caminho no formato DOT.
+    filhos(no) deve retornar (esquerdo, direito) e rotulo(no) o texto do nó.
+    Nós na profundidade profundidade_max (raiz = 0) que ainda têm filhos, e nós para
+    os quais colapsar(no) for verdadeiro, são desenhados como um resumo da subárvore.
+    Retorna o número de nós escritos.
+    """
+    escritos = 0
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("digraph {\n")
+        pilha = [(raiz, None, 0)] if raiz is not None else []
+        while pilha:
+            no, id_pai, nivel = pilha.pop()
+            id_no = f"n{escritos}"
+            escritos += 1
+            esquerdo, direito = filhos(no)
+            tem_filhos = esquerdo is not None or direito is not None
+            limite = profundidade_max is not None and nivel >= profundidade_max
+            if tem_filhos and (limite or (colapsar is not None and colapsar(no))):
+                total, altura = _resumo_subarvore(no, filhos)
+                texto = f"{_escapar(rotulo(no))}\\n{total} nós, altura {altura}"
+                f.write(f'  {id_no} [label="{texto}", shape=box, style=dashed];\n')
+                tem_filhos = False
+            else:
+                f.write(f'  {id_no} [label="{_escapar(rotulo(no))}"];\n')
+            if id_pai is not None:
+                f.write(f"  {id_pai} -> {id_no};\n")
+            if tem_filhos:
+                # a direita entra primeiro na pilha para a esquerda ser escrita antes
+                for filho in (direito, esquerdo):
+                    if filho is not None:
+                        pilha.append((filho, id_no, nivel + 1))
+        f.write("}\n")
+    return escritos
+
+
+def _executar_dot(caminho_dot, saida, formato, apagar_dot):
+    try:
+        subprocess.run(["dot", f"-T{formato}", caminho_dot, "-o", saida], check=True)
+    finally:
+        if apagar_dot:
+            os.remove(caminho_dot)
+    return saida
+
+
+def renderizar(caminho_dot, saida, formato="png", em_segundo_plano=False, apagar_dot=True):
+    """
+    Converte o arquivo DOT em imagem com o executável dot do Graphviz.
+    Com em_segundo_plano=True retorna imediatamente um Future com o caminho da imagem;
+    caso contrário espera o dot terminar e retorna o caminho.
+    """
+    if shutil.which("dot") is None:
+        raise RuntimeError("Executável 'dot' do Graphviz não encontrado no PATH")
+    if not em_segundo_plano:
+        return _executar_dot(caminho_dot, saida, formato, apagar_dot)
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="graphviz")
+    return _executor.submit(_executar_dot, caminho_dot, saida, formato, apagar_dot)